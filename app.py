@@ -1,11 +1,20 @@
 import os
 import sys
+import time
 import tkinter as tk
 from collections.abc import Callable
+from functools import partial
+from pathlib import Path
 from tkinter import filedialog, messagebox
 
+import config as config_module
 from config import ConfigLoadError, default_config, load_config, save_config
 from logic import DataLoadError
+from profiling import import_times, profiler, profiling_requested
+
+PROFILE_STARTUP_FLAG = "--profile-startup"
+STARTUP_IMPORTS = "import app, gui"
+PREFETCH_DELAY_MS = 2_000
 
 
 def replace_editor(
@@ -24,17 +33,22 @@ def replace_editor(
 
 
 def check_vlc_installed() -> bool:
-    """Verifica se o VLC Media Player está instalado e acessível no sistema."""
+    """Verifica se a libVLC foi carregada e exporta ``libvlc_new``, sem criar uma instância do VLC."""
     try:
         import vlc
-
-        instance = vlc.Instance()
-        if instance is None:
-            return False
-        instance.release()
-        return True
-    except (ImportError, OSError, AttributeError):
+    except (ImportError, OSError, NotImplementedError):
         return False
+    library = getattr(vlc, "dll", None)
+    return library is not None and hasattr(library, "libvlc_new")
+
+
+def report_startup_imports(top: int = 15) -> None:
+    """Imprime os módulos de importação mais cara na inicialização, medidos em um interpretador novo."""
+
+    times = import_times(STARTUP_IMPORTS, cwd=Path(__file__).resolve().parent)
+    print(f"Importações mais caras de '{STARTUP_IMPORTS}' (acumulado / próprio):")
+    for entry in sorted(times, key=lambda item: item.cumulative_us, reverse=True)[:top]:
+        print(f"{entry.cumulative_us / 1000:10.1f} ms {entry.self_us / 1000:10.1f} ms  {entry.module}")
 
 
 def reveal_in_explorer(file_path: str) -> None:
@@ -115,6 +129,13 @@ class AboutDialog(tk.Toplevel):
 
 def main() -> None:
     """Inicializa a interface gráfica e executa o aplicativo."""
+    args = sys.argv[1:]
+    profile_startup = PROFILE_STARTUP_FLAG in args
+    if profile_startup:
+        args.remove(PROFILE_STARTUP_FLAG)
+        report_startup_imports()
+    started = time.perf_counter()
+
     if not check_vlc_installed():
         root = tk.Tk()
         root.withdraw()
@@ -128,6 +149,8 @@ def main() -> None:
         sys.exit(1)
 
     from gui import ChapterEditor, SettingsWindow
+    from gui.prefetch import VideoPrefetcher, next_video_in_folder
+    from session_index import SESSION_INDEX_NAME, SessionIndex
 
     root = tk.Tk()
     root.title("Editor de Capítulos")
@@ -146,6 +169,23 @@ def main() -> None:
         except OSError as save_error:
             messagebox.showerror("Erro ao salvar configuração", str(save_error))
 
+    profiler.enabled = profiling_requested(config)
+    performance_overlay: tk.Toplevel | None = None
+    watchdog = None
+    if profiler.enabled:
+        import logging
+
+        from gui.watchdog import EventLoopWatchdog
+
+        logging.basicConfig(
+            filename=config_module.CONFIG_PATH.with_name("desempenho.log"),
+            encoding="utf-8",
+            level=logging.INFO,
+            format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+        )
+        watchdog = EventLoopWatchdog(root)
+        watchdog.start()
+
     # Aplica configuração de Sempre no Topo (Always on Top)
     always_on_top_var = tk.BooleanVar(value=config.get("always_on_top", False))
     root.attributes("-topmost", always_on_top_var.get())
@@ -182,6 +222,9 @@ def main() -> None:
 
     editor: ChapterEditor | None = None
     last_video_path = config.get("last_video", "")
+    prefetcher = VideoPrefetcher()
+    session_index = SessionIndex(config_module.CONFIG_PATH.with_name(SESSION_INDEX_NAME))
+    prefetch_after: str | None = None
 
     # Barra superior com o caminho do vídeo selecionável e o botão do explorador
     path_frame = tk.Frame(root, bd=0, relief="flat")
@@ -219,8 +262,14 @@ def main() -> None:
         if not os.path.isfile(abs_path):
             messagebox.showerror("Vídeo não encontrado", f"O arquivo informado não existe:\n{abs_path}")
             return
+        if editor and not editor.flush():
+            if not confirm_discard():
+                return
+            editor.discard()
+        remember_duration()
+        editor_factory = partial(ChapterEditor, prefetched=prefetcher.take(abs_path))
         try:
-            new_editor = replace_editor(root, editor, abs_path, config, ChapterEditor)
+            new_editor = replace_editor(root, editor, abs_path, config, editor_factory)
         except (DataLoadError, OSError, ValueError, RuntimeError, tk.TclError) as exc:
             editor = None
             messagebox.showerror("Não foi possível abrir o vídeo", str(exc), parent=root)
@@ -228,11 +277,78 @@ def main() -> None:
         editor = new_editor
         config["last_video"] = abs_path
         path_var.set(abs_path)
+        update_session_index(lambda: session_index.record_open(abs_path))
+        schedule_prefetch(abs_path)
+
+    def update_session_index(update: Callable[[], None]) -> None:
+        """Atualiza o índice de sessões; falhas nele não impedem o uso do editor."""
+        if profile_startup:
+            return
+        import sqlite3
+
+        try:
+            update()
+        except (OSError, sqlite3.DatabaseError):
+            pass
+
+    def remember_duration() -> None:
+        """Guarda no índice a duração do vídeo atual, já conhecida pelo player."""
+        if editor and path_var.get():
+            duration_ms = editor.player_widget.player.get_length()
+            update_session_index(lambda: session_index.record_duration(path_var.get(), duration_ms))
+
+    def show_quick_open(event: tk.Event | None = None) -> str:
+        """Exibe a lista de vídeos recentes e das pastas vigiadas."""
+        from gui.quick_open import QuickOpenDialog
+
+        remember_duration()
+        QuickOpenDialog(root, session_index, open_video)
+        return "break"
+
+    def schedule_prefetch(video_path: str) -> None:
+        """Pré-carrega o próximo vídeo da pasta depois que a abertura do atual se acomodar."""
+        nonlocal prefetch_after
+        if prefetch_after:
+            root.after_cancel(prefetch_after)
+            prefetch_after = None
+        if profile_startup:
+            return
+        following = next_video_in_folder(video_path)
+        if following:
+            prefetch_after = root.after(PREFETCH_DELAY_MS, lambda: prefetcher.prefetch(following))
+
+    def open_next_video(event: tk.Event | None = None) -> str:
+        """Abre o vídeo seguinte da pasta do vídeo atual, aproveitando o pré-carregamento."""
+        current = path_var.get()
+        following = next_video_in_folder(current) if current else None
+        if following:
+            open_video(following)
+        else:
+            messagebox.showinfo("Fim da pasta", "Não há outro vídeo depois deste na pasta.", parent=root)
+        return "break"
+
+    def confirm_discard() -> bool:
+        """Pergunta se as edições que não puderam ser gravadas podem ser descartadas."""
+        return messagebox.askyesno(
+            "Edições não salvas",
+            "Algumas edições não puderam ser salvas e serão perdidas.\n\nDeseja continuar mesmo assim?",
+            parent=root,
+        )
 
     def show_settings() -> None:
         """Exibe a janela de configurações."""
         SettingsWindow(root, config, lambda: editor.update_config(config) if editor else None)
 
+    def show_performance() -> None:
+        """Exibe a janela de desempenho, reutilizando a que já estiver aberta."""
+        nonlocal performance_overlay
+        from gui.performance_overlay import PerformanceOverlay
+
+        if performance_overlay is not None and performance_overlay.winfo_exists():
+            performance_overlay.lift()
+            return
+        performance_overlay = PerformanceOverlay(root)
+
     def show_about() -> None:
         """Exibe a janela modal Sobre."""
         AboutDialog(root)
@@ -240,6 +356,11 @@ def main() -> None:
     def on_closing() -> None:
         """Salva a configuração e libera o VLC antes de fechar a aplicação."""
 
+        if editor and not editor.flush():
+            if not confirm_discard():
+                return
+            editor.discard()
+        remember_duration()
         config["window_geometry"] = root.geometry()
         try:
             save_config(config)
@@ -249,6 +370,11 @@ def main() -> None:
                 f"Não foi possível salvar a configuração:\n{exc}\n\nDeseja fechar mesmo assim?",
             ):
                 return
+        if watchdog is not None:
+            watchdog.stop()
+        if prefetch_after:
+            root.after_cancel(prefetch_after)
+        prefetcher.close()
         if editor:
             editor.destroy()
         root.destroy()
@@ -258,10 +384,36 @@ def main() -> None:
     # Menu Arquivo
     file_menu = tk.Menu(menubar, tearoff=0)
     file_menu.add_command(label="Abrir vídeo", command=lambda: open_video())
+    file_menu.add_command(label="Abertura rápida…", accelerator="Ctrl+P", command=show_quick_open)
+    file_menu.add_command(label="Próximo vídeo da pasta", accelerator="Ctrl+Shift+N", command=open_next_video)
+    file_menu.add_separator()
+    file_menu.add_command(
+        label="Importar capítulos do vídeo", command=lambda: editor.import_container_chapters() if editor else None
+    )
+    file_menu.add_command(
+        label="Exportar capítulos para o vídeo…", command=lambda: editor.export_container_chapters() if editor else None
+    )
     file_menu.add_separator()
     file_menu.add_command(label="Sair", command=on_closing)
     menubar.add_cascade(label="Arquivo", menu=file_menu)
 
+    # Menu Capítulos
+    chapter_menu = tk.Menu(menubar, tearoff=0)
+    chapter_menu.add_command(
+        label="Sugerir capítulos pelas cenas…", command=lambda: editor.suggest_scene_chapters() if editor else None
+    )
+    menubar.add_cascade(label="Capítulos", menu=chapter_menu)
+
+    # Menu Legendas
+    subtitle_menu = tk.Menu(menubar, tearoff=0)
+    subtitle_menu.add_command(
+        label="Sugerir legendas pela voz", command=lambda: editor.suggest_subtitles() if editor else None
+    )
+    subtitle_menu.add_command(
+        label="Ajustar bordas às pausas", command=lambda: editor.snap_subtitles() if editor else None
+    )
+    menubar.add_cascade(label="Legendas", menu=subtitle_menu)
+
     # Menu Exibir
     view_menu = tk.Menu(menubar, tearoff=0)
     view_menu.add_checkbutton(
@@ -269,6 +421,9 @@ def main() -> None:
         variable=always_on_top_var,
         command=toggle_always_on_top,
     )
+    if profiler.enabled:
+        view_menu.add_separator()
+        view_menu.add_command(label="Desempenho", command=show_performance)
     menubar.add_cascade(label="Exibir", menu=view_menu)
 
     # Menu Configurações
@@ -280,22 +435,40 @@ def main() -> None:
     menubar.add_cascade(label="Ajuda", menu=help_menu)
 
     root.config(menu=menubar)
+    root.bind("<Control-N>", open_next_video)
+    root.bind("<Control-p>", show_quick_open)
 
     # Verifica se foi passado um arquivo de vídeo via argumento
-    video_arg = ""
-    if len(sys.argv) > 1:
-        video_arg = sys.argv[1]
+    video_arg = args[0] if args else ""
 
     if video_arg:
         open_video(video_arg)
     elif last_video_path and os.path.exists(last_video_path):
         open_video(last_video_path)
-    else:
+    elif not profile_startup:
         open_video()
 
+    if profile_startup:
+
+        def report_first_frame() -> None:
+            """Imprime o tempo até a primeira janela desenhada e encerra sem alterar a configuração."""
+            root.update_idletasks()
+            print(
+                f"Tempo até o primeiro quadro (desde o início de main): {(time.perf_counter() - started) * 1000:.1f} ms"
+            )
+            prefetcher.close()
+            if editor:
+                editor.destroy()
+            root.destroy()
+
+        root.after_idle(report_first_frame)
+
     root.protocol("WM_DELETE_WINDOW", on_closing)
     root.mainloop()
 
 
 if __name__ == "__main__":
+    import multiprocessing
+
+    multiprocessing.freeze_support()
     main()
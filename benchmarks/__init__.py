@@ -0,0 +1 @@
+"""Benchmarks dos caminhos críticos de desempenho do Editor de Capítulos."""
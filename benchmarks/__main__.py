@@ -0,0 +1,91 @@
+"""Executa os benchmarks, grava o relatório JSON e compara com a linha de base.
+
+Uso a partir da raiz do projeto::
+
+    python -m benchmarks --output resultados.json
+    python -m benchmarks --save-baseline
+    python -m benchmarks --threshold 0.25
+
+Sem ``--save-baseline``, o relatório é comparado com ``benchmarks/baseline.json`` quando ele existe; o
+processo termina com código 1 se algum caso ficar mais lento que a linha de base além do limite.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks import bench_persistence, bench_startup, bench_timecode
+from benchmarks.harness import (
+    BenchmarkResult,
+    compare,
+    load_report,
+    report,
+    write_report,
+)
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+SUITES = ("persistence", "timecode", "startup")
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    """Interpreta as opções da linha de comando."""
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument("--suite", choices=SUITES, action="append", help="suítes a executar (padrão: todas)")
+    parser.add_argument("--repeat", type=int, default=5, help="execuções cronometradas por caso")
+    parser.add_argument("--output", type=Path, help="arquivo JSON com os resultados desta execução")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="relatório usado como referência")
+    parser.add_argument("--threshold", type=float, default=0.25, help="lentidão tolerada sobre a linha de base")
+    parser.add_argument("--save-baseline", action="store_true", help="grava os resultados como nova linha de base")
+    return parser.parse_args(argv)
+
+
+def run_suites(suites: tuple[str, ...], repeat: int) -> list[BenchmarkResult]:
+    """Executa as suítes pedidas, usando um diretório temporário para os arquivos gerados."""
+
+    results: list[BenchmarkResult] = []
+    if "persistence" in suites:
+        with tempfile.TemporaryDirectory(prefix="benchmarks_") as workdir:
+            results.extend(bench_persistence.run(Path(workdir), repeat))
+    if "timecode" in suites:
+        results.extend(bench_timecode.run(repeat))
+    if "startup" in suites:
+        results.extend(bench_startup.run(repeat))
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Executa os benchmarks e retorna o código de saída do processo."""
+
+    args = _parse_args(argv)
+    results = run_suites(tuple(args.suite or SUITES), args.repeat)
+    document = report(results)
+    for result in results:
+        print(
+            f"{result.name:<40}{result.best_seconds * 1000:>10.2f} ms"
+            f"{result.median_seconds * 1000:>10.2f} ms (mediana){result.peak_bytes / 1_048_576:>9.1f} MiB"
+        )
+    if args.output:
+        write_report(args.output, document)
+    if args.save_baseline:
+        write_report(args.baseline, document)
+        print(f"Linha de base gravada em {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        return 0
+
+    regressions = compare(document, load_report(args.baseline), args.threshold)
+    for regression in regressions:
+        print(
+            f"REGRESSÃO {regression.name}: {regression.baseline_seconds * 1000:.2f} ms → "
+            f"{regression.current_seconds * 1000:.2f} ms ({regression.ratio:.2f}x)",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
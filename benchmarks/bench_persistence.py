@@ -0,0 +1,71 @@
+"""Benchmarks de carga, gravação e ida e volta dos arquivos ``.chp`` e ``.srt`` e da verificação das legendas."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from benchmarks.generators import chapter_tree, count_chapters, image_set, write_srt
+from benchmarks.harness import BenchmarkResult, measure
+from logic import ChapterManager, SubtitleManager, subtitle_issues
+
+SRT_CUES = (1_000, 10_000)
+CHAPTER_SHAPES = ((2, 30), (4, 10))
+IMAGE_SETS = ((20, 200_000),)
+
+Case = tuple[str, Callable[[], object], Callable[[], object] | None]
+
+
+def _subtitle_cases(workdir: Path) -> Iterator[Case]:
+    """Casos de legendas para cada quantidade configurada de blocos."""
+
+    for cues in SRT_CUES:
+        manager = SubtitleManager(str(workdir / f"legendas_{cues}.mp4"))
+        write_srt(Path(manager.srt_path), cues)
+        subtitles = manager.load()
+        yield f"srt.load[{cues}]", manager.load, None
+        yield f"srt.save[{cues}]", lambda manager=manager, subtitles=subtitles: manager.save(subtitles), None
+        yield f"srt.roundtrip[{cues}]", lambda manager=manager: manager.save(manager.load()), None
+        yield f"srt.qc[{cues}]", lambda subtitles=subtitles: subtitle_issues(subtitles), None
+
+
+def _chapter_cases(workdir: Path) -> Iterator[Case]:
+    """Casos de árvores de capítulos com profundidade e largura configuradas."""
+
+    for depth, breadth in CHAPTER_SHAPES:
+        chapters = chapter_tree(depth, breadth)
+        label = f"{depth}x{breadth}={count_chapters(chapters)}"
+        manager = ChapterManager(str(workdir / f"capitulos_{depth}_{breadth}.mp4"))
+        manager.save(chapters, [])
+        yield f"chp.save[{label}]", lambda manager=manager, chapters=chapters: manager.save(chapters, []), None
+        yield f"chp.load[{label}]", manager.load, None
+        yield f"chp.roundtrip[{label}]", lambda manager=manager: _chp_roundtrip(manager), None
+
+
+def _image_cases(workdir: Path) -> Iterator[Case]:
+    """Casos de arquivos ``.chp`` dominados por imagens BLOB."""
+
+    for count, size_bytes in IMAGE_SETS:
+        images = image_set(count, size_bytes)
+        label = f"{count}x{size_bytes // 1000}kB"
+        manager = ChapterManager(str(workdir / f"imagens_{count}_{size_bytes}.mp4"))
+        manager.save([], [], [], images)
+        yield f"chp.images.save[{label}]", lambda manager=manager, images=images: manager.save([], [], [], images), None
+        yield f"chp.images.load[{label}]", manager.load, None
+
+
+def _chp_roundtrip(manager: ChapterManager) -> None:
+    """Carrega e grava novamente todo o conteúdo de um ``.chp``."""
+
+    data = manager.load()
+    manager.save(data["chapters"], data["casting"], data["metadata"], data["images"])
+
+
+def run(workdir: Path, repeat: int = 5) -> list[BenchmarkResult]:
+    """Gera os dados sintéticos em ``workdir`` e mede todos os casos de persistência."""
+
+    results: list[BenchmarkResult] = []
+    for cases in (_subtitle_cases(workdir), _chapter_cases(workdir), _image_cases(workdir)):
+        for name, function, setup in cases:
+            results.append(measure(name, function, setup, repeat))
+    return results
@@ -0,0 +1,35 @@
+"""Inicialização a frio: cada caso executa um interpretador novo que importa os módulos da aplicação.
+
+Os tempos incluem a partida do próprio interpretador; o pico de memória registrado é o do processo que mede, não
+o do filho, e serve apenas para manter o formato do relatório. O tempo até o primeiro quadro depende de um monitor e
+do VLC e é obtido à parte com ``python app.py --profile-startup``.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.harness import BenchmarkResult, measure
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+STATEMENTS = {
+    "startup.python": "pass",
+    "startup.import_app": "import app",
+    "startup.import_gui": "import app, gui",
+    "startup.check_vlc": "import app; app.check_vlc_installed()",
+}
+
+
+def run(repeat: int = 5) -> list[BenchmarkResult]:
+    """Mede cada importação em um interpretador novo, partindo sempre da raiz do projeto."""
+
+    return [
+        measure(
+            name,
+            lambda statement=statement: subprocess.run([sys.executable, "-c", statement], cwd=PROJECT_DIR, check=True),
+            repeat=repeat,
+        )
+        for name, statement in STATEMENTS.items()
+    ]
@@ -0,0 +1,59 @@
+"""Micro-benchmarks da formatação e leitura de tempos usadas nas árvores e nos ``.srt``.
+
+Execute com ``python -m benchmarks.bench_timecode`` a partir da raiz do projeto.
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Callable
+
+from benchmarks.harness import BenchmarkResult, measure
+from timecode import (
+    fmt_sec,
+    fmt_srt_time,
+    parse_flexible_time,
+    parse_srt_time,
+    parse_time,
+)
+
+SAMPLE_SIZE = 10_000
+
+
+def _samples() -> dict[str, tuple[Callable[[object], object], list[object]]]:
+    """Monta entradas representativas, reprodutíveis, para cada função medida."""
+
+    generator = random.Random(29)
+    seconds = [generator.randrange(4 * 3600) for _ in range(SAMPLE_SIZE)]
+    milliseconds = [generator.randrange(4 * 3_600_000) for _ in range(SAMPLE_SIZE)]
+    return {
+        "fmt_sec": (fmt_sec, seconds),
+        "fmt_srt_time": (fmt_srt_time, milliseconds),
+        "parse_time": (parse_time, [fmt_sec(value) for value in seconds]),
+        "parse_flexible_time": (parse_flexible_time, [fmt_sec(value) for value in seconds]),
+        "parse_srt_time": (parse_srt_time, [f" {fmt_srt_time(value)}" for value in milliseconds]),
+    }
+
+
+def run(repeat: int = 5) -> list[BenchmarkResult]:
+    """Mede cada função sobre ``SAMPLE_SIZE`` entradas; os tempos cobrem o lote inteiro."""
+
+    return [
+        measure(
+            f"timecode.{name}[{len(values)}]",
+            lambda function=function, values=values: [function(value) for value in values],
+            repeat=repeat,
+        )
+        for name, (function, values) in _samples().items()
+    ]
+
+
+def main() -> None:
+    """Exibe os resultados em nanossegundos por chamada."""
+
+    for result in run():
+        print(f"{result.name:<34}{result.best_seconds / SAMPLE_SIZE * 1e9:>10.1f} ns/chamada")
+
+
+if __name__ == "__main__":
+    main()
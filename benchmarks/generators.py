@@ -0,0 +1,97 @@
+"""Geradores de dados sintéticos e reprodutíveis para os benchmarks de persistência."""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+from timecode import fmt_srt_time
+
+
+def write_srt(path: Path, cues: int, seed: int = 30) -> Path:
+    """Grava um ``.srt`` válido com ``cues`` blocos de uma ou duas linhas."""
+
+    generator = random.Random(seed)
+    blocks: list[str] = []
+    start = 0
+    for index in range(1, cues + 1):
+        start += generator.randrange(200, 4_000)
+        end = start + generator.randrange(500, 6_000)
+        lines = [f"Fala {index} " + "texto " * generator.randrange(1, 8)]
+        if generator.random() < 0.4:
+            lines.append("segunda linha da legenda")
+        blocks.append(f"{index}\n{fmt_srt_time(start)} --> {fmt_srt_time(end)}\n" + "\n".join(lines))
+    path.write_text("\n\n".join(blocks) + "\n", encoding="utf-8")
+    return path
+
+
+def chapter_tree(depth: int, breadth: int) -> list[dict]:
+    """Monta uma árvore completa de capítulos com ``breadth`` filhos por nó e ``depth`` níveis."""
+
+    chapters: list[dict] = []
+    pending: list[tuple[list[dict], int, int]] = [(chapters, 0, 1)]
+    while pending:
+        siblings, start, level = pending.pop()
+        for index in range(breadth):
+            node = {"title": f"Nível {level} · {index + 1}", "start": start + index, "end": start + index + 5}
+            node["subs"] = []
+            siblings.append(node)
+            if level < depth:
+                pending.append((node["subs"], start + index, level + 1))
+    return chapters
+
+
+def count_chapters(chapters: list[dict]) -> int:
+    """Conta os nós de uma árvore de capítulos sem recursão."""
+
+    total = 0
+    pending = list(chapters)
+    while pending:
+        node = pending.pop()
+        total += 1
+        pending.extend(node["subs"])
+    return total
+
+
+def image_set(count: int, size_bytes: int, seed: int = 30) -> list[dict]:
+    """Cria imagens com conteúdo binário pseudoaleatório do tamanho indicado."""
+
+    generator = random.Random(seed)
+    return [
+        {
+            "title": f"Imagem {index + 1}",
+            "description": "Gerada para benchmark.",
+            "data": generator.randbytes(size_bytes),
+            "mime_type": "image/jpeg",
+            "width": 1080,
+            "height": 1080,
+        }
+        for index in range(count)
+    ]
+
+
+def subtitle_list(cues: int, seed: int = 30) -> list[dict]:
+    """Cria legendas já carregadas, ordenadas pelo início, sem passar pelo arquivo ``.srt``."""
+
+    generator = random.Random(seed)
+    subtitles: list[dict] = []
+    start = 0
+    for index in range(1, cues + 1):
+        start += generator.randrange(200, 4_000)
+        subtitles.append({"start": start, "end": start + generator.randrange(500, 6_000), "text": f"Fala {index}"})
+    return subtitles
+
+
+def metadata_tree(depth: int, breadth: int) -> list[dict]:
+    """Monta metadados com ``breadth`` chaves por nível; apenas as folhas recebem valor."""
+
+    metadata: list[dict] = []
+    pending: list[tuple[list[dict], int]] = [(metadata, 1)]
+    while pending:
+        siblings, level = pending.pop()
+        for index in range(breadth):
+            node = {"key": f"chave_{level}_{index + 1}", "value": "" if level < depth else "valor", "children": []}
+            siblings.append(node)
+            if level < depth:
+                pending.append((node["children"], level + 1))
+    return metadata
@@ -0,0 +1,110 @@
+"""Medição de tempo e memória, relatório JSON e comparação com uma linha de base."""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Resultado de um caso: melhor tempo, mediana e pico de memória alocada pelo Python."""
+
+    name: str
+    best_seconds: float
+    median_seconds: float
+    peak_bytes: int
+    repeat: int
+
+
+@dataclass(frozen=True)
+class Regression:
+    """Caso cujo melhor tempo excedeu a linha de base além do limite tolerado."""
+
+    name: str
+    baseline_seconds: float
+    current_seconds: float
+
+    @property
+    def ratio(self) -> float:
+        """Razão entre o tempo atual e o da linha de base."""
+
+        return self.current_seconds / self.baseline_seconds
+
+
+def measure(
+    name: str,
+    function: Callable[[], object],
+    setup: Callable[[], object] | None = None,
+    repeat: int = 5,
+) -> BenchmarkResult:
+    """Executa ``function`` ``repeat`` vezes e, à parte, mede seu pico de memória com ``tracemalloc``.
+
+    ``setup`` roda antes de cada execução, fora da medição; o pico é obtido em uma execução extra
+    para que o rastreamento de alocações não distorça os tempos.
+    """
+
+    timings: list[float] = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return BenchmarkResult(name, min(timings), statistics.median(timings), peak, repeat)
+
+
+def report(results: list[BenchmarkResult]) -> dict[str, Any]:
+    """Monta o documento JSON com o ambiente de execução e os resultados por nome."""
+
+    return {
+        "created": datetime.now(tz=UTC).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": {result.name: asdict(result) for result in results},
+    }
+
+
+def write_report(path: Path, document: dict[str, Any]) -> None:
+    """Grava o relatório JSON de forma legível e estável para diffs."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, ensure_ascii=False, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def load_report(path: Path) -> dict[str, Any]:
+    """Lê um relatório gravado por :func:`write_report`."""
+
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def compare(document: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[Regression]:
+    """Lista os casos presentes em ambos os relatórios que ficaram mais lentos que ``1 + threshold``."""
+
+    regressions: list[Regression] = []
+    baseline_results = baseline.get("results", {})
+    for name, result in document["results"].items():
+        previous = baseline_results.get(name)
+        if previous is None or previous["best_seconds"] <= 0:
+            continue
+        if result["best_seconds"] > previous["best_seconds"] * (1 + threshold):
+            regressions.append(Regression(name, previous["best_seconds"], result["best_seconds"]))
+    return regressions
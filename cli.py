@@ -0,0 +1,144 @@
+"""Valida e regrava em lote os arquivos ``.chp`` e ``.srt`` de uma biblioteca de vídeos, sem interface gráfica.
+
+Uso a partir da raiz do projeto::
+
+    python -m cli ~/Videos
+    python -m cli --check --workers 4 ~/Videos/Curso aula.chp
+
+Cada par de arquivos auxiliares é carregado, validado e gravado de novo em um processo do pool; com ``--check`` os
+arquivos são apenas validados, abertos em modo somente leitura e sem migrar o formato em disco. O processo termina
+com código 1 se algum arquivo não puder ser carregado ou validado.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import NamedTuple
+
+from logic import ChapterManager, DataLoadError, SubtitleManager
+
+SIDECAR_SUFFIXES = (".chp", ".srt")
+
+
+class FileResult(NamedTuple):
+    """Resultado do processamento dos arquivos auxiliares de um vídeo."""
+
+    path: str
+    seconds: float
+    chapters: int
+    cues: int
+    error: str = ""
+    load_error: bool = False
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    """Interpreta as opções da linha de comando."""
+
+    parser = argparse.ArgumentParser(prog="python -m cli", description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="+", type=Path, help="pastas percorridas recursivamente ou arquivos .chp/.srt")
+    parser.add_argument("--check", action="store_true", help="apenas valida, sem regravar os arquivos")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="processos usados em paralelo")
+    return parser.parse_args(argv)
+
+
+def find_sidecars(paths: list[Path]) -> list[str]:
+    """Retorna um arquivo auxiliar por vídeo, em ordem de caminho, para cada ``.chp`` ou ``.srt`` encontrado."""
+
+    def walk() -> Iterator[str]:
+        for path in paths:
+            if path.is_file():
+                yield str(path)
+                continue
+            for folder, _, names in os.walk(path):
+                for name in sorted(names):
+                    yield os.path.join(folder, name)
+
+    by_base: dict[str, str] = {}
+    for file_path in walk():
+        base_path, suffix = os.path.splitext(os.path.abspath(file_path))
+        if suffix.lower() in SIDECAR_SUFFIXES:
+            by_base.setdefault(base_path, base_path + suffix)
+    return [by_base[base_path] for base_path in sorted(by_base)]
+
+
+def process_sidecars(sidecar_path: str, save: bool = True) -> FileResult:
+    """Carrega, valida e, se pedido, regrava o ``.chp`` e o ``.srt`` que existirem para o vídeo.
+
+    Sem ``save`` nenhum arquivo é modificado, nem mesmo pela migração de um ``.chp`` de versão anterior.
+    """
+
+    started = time.perf_counter()
+    manager = ChapterManager(sidecar_path)
+    sub_manager = SubtitleManager(sidecar_path)
+    base_path = os.path.splitext(sidecar_path)[0]
+    chapters = cues = 0
+    try:
+        if os.path.exists(manager.chp_path):
+            data = manager.load(read_only=not save)
+            chapters = len(data["chapters"])
+            arguments = (data["chapters"], data["casting"], data["metadata"], data["images"])
+            if save:
+                manager.save(*arguments)
+            else:
+                manager.validate(*arguments)
+        if os.path.exists(sub_manager.srt_path):
+            subtitles = sub_manager.load()
+            cues = len(subtitles)
+            if save:
+                sub_manager.save(subtitles)
+            else:
+                sub_manager.validate(subtitles)
+    except DataLoadError as exc:
+        return FileResult(base_path, time.perf_counter() - started, chapters, cues, str(exc), load_error=True)
+    except (OSError, TypeError, ValueError) as exc:
+        return FileResult(base_path, time.perf_counter() - started, chapters, cues, str(exc))
+    return FileResult(base_path, time.perf_counter() - started, chapters, cues)
+
+
+def run(sidecars: list[str], save: bool, workers: int) -> Iterator[FileResult]:
+    """Processa os arquivos em um pool de processos, ou na própria thread com um único trabalhador."""
+
+    task = partial(process_sidecars, save=save)
+    if workers <= 1:
+        yield from map(task, sidecars)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(task, sidecars, chunksize=max(1, len(sidecars) // (workers * 8)))
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Processa a biblioteca, imprime o tempo de cada arquivo e o resumo e retorna o código de saída."""
+
+    args = _parse_args(argv)
+    started = time.perf_counter()
+    sidecars = find_sidecars(args.paths)
+    results: list[FileResult] = []
+    for result in run(sidecars, save=not args.check, workers=args.workers):
+        results.append(result)
+        status = f"ERRO: {result.error}" if result.error else f"{result.chapters} capítulos, {result.cues} legendas"
+        print(f"{result.seconds * 1000:9.1f} ms  {result.path}  {status}")
+
+    failed = [result for result in results if result.error]
+    load_errors = sum(result.load_error for result in failed)
+    elapsed = time.perf_counter() - started
+    busy = sum(result.seconds for result in results)
+    print(
+        f"\n{len(results)} vídeos {'validados' if args.check else 'regravados'} em {elapsed:.2f} s "
+        f"({busy:.2f} s de processamento, {args.workers} processos); "
+        f"{len(failed)} com erro, {load_errors} ilegíveis"
+    )
+    if results:
+        slowest = max(results, key=lambda result: result.seconds)
+        print(f"Mais lento: {slowest.path} ({slowest.seconds * 1000:.1f} ms)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
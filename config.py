@@ -23,12 +23,15 @@ CONFIG_PATH = _application_dir() / "config.json"
 
 DEFAULT_CONFIG: dict[str, Any] = {
     "update_ms": 500,
+    "autosave_ms": 750,
     "small_jump": 5,
     "large_jump": 20,
     "volume": 100,
     "always_on_top": False,
     "window_geometry": "",
     "last_video": "",
+    "profiling": False,
+    "snap_to_keyframe": False,
     "keys": {
         "play_pause": "<space>",
         "back_small": "<Left>",
@@ -87,10 +90,13 @@ def normalize_config(config: object) -> dict[str, Any]:
         return normalized
 
     normalized["update_ms"] = _bounded_int(config.get("update_ms"), 500, 50, 60_000)
+    normalized["autosave_ms"] = _bounded_int(config.get("autosave_ms"), 750, 100, 60_000)
     normalized["small_jump"] = _bounded_int(config.get("small_jump"), 5, 1, 3_600)
     normalized["large_jump"] = _bounded_int(config.get("large_jump"), 20, 1, 3_600)
     normalized["volume"] = _bounded_int(config.get("volume"), 100, 0, 100)
     normalized["always_on_top"] = config.get("always_on_top", False) is True
+    normalized["profiling"] = config.get("profiling", False) is True
+    normalized["snap_to_keyframe"] = config.get("snap_to_keyframe", False) is True
 
     for field in ("window_geometry", "last_video"):
         value = config.get(field, "")
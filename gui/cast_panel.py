@@ -9,6 +9,7 @@ from tkinter import ttk
 from gui.add_item_dialog import AddItemDialog, FormField
 from gui.confirmation_dialog import ask_confirmation
 from gui.rounded_button import RoundedButton
+from profiling import profiled
 
 
 class CastPanel(tk.Frame):
@@ -62,6 +63,7 @@ class CastPanel(tk.Frame):
 
         self.refresh_cast_tree()
 
+    @profiled("tree.casting")
     def refresh_cast_tree(self, select_idx: int | None = None) -> None:
         """Atualiza a lista de casting e foca o item selecionado."""
         self.cast_tree.delete(*self.cast_tree.get_children())
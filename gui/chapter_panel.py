@@ -9,7 +9,9 @@ from tkinter import messagebox, ttk
 from gui.add_item_dialog import AddItemDialog, FormField
 from gui.confirmation_dialog import ask_confirmation
 from gui.rounded_button import RoundedButton
+from gui.thumbnails import THUMBNAIL_HEIGHT
 from logic import fmt_sec, parse_flexible_time
+from profiling import profiled
 
 
 class ChapterPanel(tk.Frame):
@@ -23,8 +25,9 @@ class ChapterPanel(tk.Frame):
         get_current_time: Callable[[], int],
         on_jump_to_sec: Callable[[int], None],
         on_manage_images: Callable[[dict], None],
+        get_thumbnail: Callable[[int], tk.PhotoImage | None] | None = None,
     ) -> None:
-        """Inicializa o painel de capítulos."""
+        """Inicializa o painel de capítulos; ``get_thumbnail`` fornece a miniatura do início de cada capítulo."""
 
         super().__init__(master)
         self.chaps = chaps
@@ -32,6 +35,7 @@ class ChapterPanel(tk.Frame):
         self.get_current_time = get_current_time
         self.on_jump_to_sec = on_jump_to_sec
         self.on_manage_images = on_manage_images
+        self.get_thumbnail = get_thumbnail
         self.item_map: dict[str, dict] = {}
 
         btns = tk.Frame(self)
@@ -56,6 +60,9 @@ class ChapterPanel(tk.Frame):
             selectmode="browse",
             height=15,
         )
+        if get_thumbnail is not None:
+            ttk.Style(self).configure("Thumbnails.Treeview", rowheight=THUMBNAIL_HEIGHT + 4)
+            self.tree.configure(style="Thumbnails.Treeview", height=8)
         self.tree.heading("#0", text="Título", anchor="w")
         self.tree.heading("start", text="Início", anchor="e")
         self.tree.heading("end", text="Fim", anchor="e")
@@ -88,41 +95,54 @@ class ChapterPanel(tk.Frame):
 
         self.refresh_chap_tree()
 
+    @profiled("tree.chapters")
     def refresh_chap_tree(self, select_chap: dict | None = None) -> None:
         """Atualiza a árvore com a lista de capítulos e foca o item selecionado."""
         self.tree.delete(*self.tree.get_children())
         self.item_map = {}
         found_id = None
 
-        def add_items(parent: str, items: list[dict]) -> None:
-            nonlocal found_id
-            for chap in items:
-                item_id = self.tree.insert(
-                    parent,
-                    "end",
-                    text=chap["title"],
-                    values=(fmt_sec(chap["start"]), fmt_sec(chap["end"])),
-                    open=True,
-                )
-                self.item_map[item_id] = chap
-                if chap is select_chap:
-                    found_id = item_id
-                add_items(item_id, chap.get("subs", []))
-
-        add_items("", self.chaps)
+        pending: list[tuple[str, dict]] = [("", chap) for chap in reversed(self.chaps)]
+        while pending:
+            parent, chap = pending.pop()
+            item_id = self.tree.insert(
+                parent,
+                "end",
+                text=chap["title"],
+                values=(fmt_sec(chap["start"]), fmt_sec(chap["end"])),
+                image=self._thumbnail(chap),
+                open=True,
+            )
+            self.item_map[item_id] = chap
+            if chap is select_chap:
+                found_id = item_id
+            pending.extend((item_id, sub) for sub in reversed(chap.get("subs", [])))
 
         if found_id:
             self.tree.selection_set(found_id)
             self.tree.focus(found_id)
             self.tree.see(found_id)
 
+    def _thumbnail(self, chap: dict) -> tk.PhotoImage | str:
+        """Retorna a miniatura do início do capítulo, ou ``""`` enquanto ela não estiver pronta."""
+
+        image = self.get_thumbnail(chap["start"]) if self.get_thumbnail is not None else None
+        return "" if image is None else image
+
+    def update_thumbnails(self) -> None:
+        """Aplica às linhas existentes as miniaturas que ficaram prontas, sem reconstruir a árvore."""
+
+        for item_id, chap in self.item_map.items():
+            self.tree.item(item_id, image=self._thumbnail(chap))
+
     def _sort_chapters(self, chapters: list[dict] | None = None) -> None:
-        """Ordena capítulos e subcapítulos recursivamente pelo início."""
+        """Ordena capítulos e subcapítulos de todos os níveis pelo início, sem recursão."""
 
-        items = self.chaps if chapters is None else chapters
-        items.sort(key=lambda chapter: chapter["start"])
-        for chapter in items:
-            self._sort_chapters(chapter.get("subs", []))
+        pending = [self.chaps if chapters is None else chapters]
+        while pending:
+            items = pending.pop()
+            items.sort(key=lambda chapter: chapter["start"])
+            pending.extend(chapter["subs"] for chapter in items if chapter.get("subs"))
 
     def _expand_parent_ends(self, parent_id: str, child_end: int) -> None:
         """Amplia o fim do pai e de seus ancestrais sem reduzi-los automaticamente."""
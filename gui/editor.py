@@ -1,56 +1,115 @@
-"""Widget principal do editor integrando player, painéis de capítulos, legendas, casting e atalhos."""
+"""Widget principal do editor integrando player, painéis de capítulos, legendas, casting e atalhos.
+
+As edições dos painéis apenas marcam o arquivo afetado (``.chp`` ou ``.srt``) como pendente; a gravação acontece
+depois de ``autosave_ms`` sem novas edições, ao perder o foco, ao trocar de vídeo, ao fechar ou com Ctrl+S. Até lá,
+as seções editadas são acrescentadas em lotes ao diário de edições, reaplicado na próxima abertura após uma queda.
+"""
 
 from __future__ import annotations
 
+import os
+import struct
 import tkinter as tk
 from collections.abc import Callable
-from tkinter import messagebox, ttk
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from tkinter import filedialog, messagebox, ttk
+from typing import TYPE_CHECKING
 
 from gui.cast_panel import CastPanel
 from gui.chapter_panel import ChapterPanel
-from gui.image_association_dialog import ImageAssociationDialog
 from gui.image_panel import ImagePanel
 from gui.metadata_panel import MetadataPanel
 from gui.player_widget import PlayerWidget
+from gui.prefetch import PrefetchedVideo
+from gui.subtitle_overlay import SubtitleOverlay
 from gui.subtitle_panel import SubtitlePanel
-from logic import ChapterManager, SubtitleManager
+from gui.thumbnails import ChapterThumbnails
+from gui.waveform_view import WaveformView
+from logic import ChapterManager, EditJournal, SubtitleManager
+from mp4 import chapters_for_container, import_chapters, write_chapters
+from profiling import profiled
+
+if TYPE_CHECKING:
+    from waveform import Envelope
+
+DIRTY_MARK = " •"
+CHP = "chp"
+SRT = "srt"
+JOURNAL_BATCH_MS = 150
+PRELOAD_DELAY_MS = 300
+EXPORT_POLL_MS = 250
+SECTION_ATTRIBUTES = {
+    "chapters": "chaps",
+    "casting": "casting",
+    "metadata": "metadata",
+    "images": "images",
+    "subtitles": "subtitles",
+}
 
 
 class ChapterEditor(tk.Frame):
     """Widget Tkinter principal que sintetiza player VLC, capítulos, legendas (.srt) e casting."""
 
-    def __init__(self, master: tk.Tk, video_path: str, config: dict) -> None:
-        """Inicializa o editor para o vídeo informado."""
+    def __init__(self, master: tk.Tk, video_path: str, config: dict, prefetched: PrefetchedVideo | None = None) -> None:
+        """Inicializa o editor para o vídeo informado, reaproveitando os dados pré-carregados, se houver."""
 
         self.manager = ChapterManager(video_path)
         self.sub_manager = SubtitleManager(video_path)
-        data = self.manager.load()
-        subtitles = self.sub_manager.load()
+        self.journal = EditJournal(video_path)
+        if prefetched is not None:
+            data = prefetched.data
+            data["subtitles"] = prefetched.subtitles
+        else:
+            data = self.manager.load()
+            data["subtitles"] = self.sub_manager.load()
+        recovered = self._valid_recovery(data, self.journal.pending())
+        data.update(recovered)
 
         super().__init__(master)
         self.pack(fill="both", expand=True)
 
         self.app_config = config
         self.update_ms = config.get("update_ms", 500)
+        self.autosave_ms = config.get("autosave_ms", 750)
+        self.dirty: set[str] = set()
+        self.autosave_after: str | None = None
+        self.focus_check_after: str | None = None
+        self.journal_after: str | None = None
+        self.preload_after: str | None = None
+        self.export_after: str | None = None
+        self.export_future: Future[None] | None = None
+        self.autosave_bindings: list[tuple[str, str]] = []
+        self.base_title = self.winfo_toplevel().title()
         self.chaps: list[dict] = data["chapters"]
         self.casting: list[dict] = data["casting"]
         self.metadata: list[dict] = data["metadata"]
         self.images: list[dict] = data["images"]
-        self.subtitles: list[dict] = subtitles
+        self.subtitles: list[dict] = data["subtitles"]
         self.bound_shortcuts: list[tuple[str, str]] = []
 
         main_container = tk.Frame(self)
         main_container.pack(fill="both", expand=True)
 
-        # Player Widget (esquerda)
+        # Player Widget e forma de onda (esquerda)
+        player_column = tk.Frame(main_container)
+        player_column.pack(side="left", fill="both", expand=True)
         self.player_widget = PlayerWidget(
-            main_container,
+            player_column,
             video_path=video_path,
             config=config,
             on_drag_start=self._stop_update_loop,
             on_drag_end=self._start_update_loop,
+            instance=prefetched.instance if prefetched is not None else None,
+            media=prefetched.media if prefetched is not None else None,
+        )
+        self.waveform = WaveformView(
+            player_column, video_path, self.subtitles, on_seek_ms=self.player_widget.set_time_ms
         )
-        self.player_widget.pack(side="left", fill="both", expand=True)
+        self.waveform.pack(side="bottom", fill="x", padx=6, pady=(0, 4))
+        self.player_widget.pack(side="top", fill="both", expand=True)
+        self.subtitle_overlay = SubtitleOverlay(self, self.player_widget.player, self.subtitles)
 
         # Painel lateral com abas (direita)
         side_panel = tk.Frame(main_container, width=280, relief="flat", bd=0)
@@ -59,139 +118,473 @@ class ChapterEditor(tk.Frame):
         self.notebook = ttk.Notebook(side_panel)
         self.notebook.pack(fill="both", expand=True)
 
-        # Aba de Capítulos
-        chap_tab = tk.Frame(self.notebook)
-        self.notebook.add(chap_tab, text="Capítulos")
+        # As abas começam vazias; cada painel é criado ao ser exibido pela primeira vez ou pré-carregado
+        # quando o laço de eventos fica ocioso, e até lá os dados permanecem apenas nas listas compartilhadas.
+        self.chap_panel: ChapterPanel | None = None
+        self.thumbnails: ChapterThumbnails | None = None
+        self.sub_panel: SubtitlePanel | None = None
+        self.cast_panel: CastPanel | None = None
+        self.metadata_panel: MetadataPanel | None = None
+        self.image_panel: ImagePanel | None = None
+        self.tab_builders: dict[str, Callable[[tk.Frame], None]] = {}
+        for title, builder in (
+            ("Capítulos", self._build_chapter_panel),
+            ("Legendas", self._build_subtitle_panel),
+            ("Casting", self._build_cast_panel),
+            ("Metadados", self._build_metadata_panel),
+            ("Imagens", self._build_image_panel),
+        ):
+            tab = tk.Frame(self.notebook)
+            self.notebook.add(tab, text=title)
+            self.tab_builders[str(tab)] = builder
+        self._show_current_tab()
+        self.notebook.bind("<<NotebookTabChanged>>", lambda _: self._show_current_tab())
+
+        self.updater: str | None = None
+        self._start_update_loop()
+        self._bind_keys()
+        self._bind_autosave()
+
+        if recovered:
+            self._restore_recovered(recovered)
+
+    def _build_chapter_panel(self, tab: tk.Frame) -> None:
+        """Cria o painel de capítulos na aba informada, com as miniaturas geradas em segundo plano."""
+        self.thumbnails = ChapterThumbnails(self, self.player_widget.video_path, self._show_thumbnails)
         self.chap_panel = ChapterPanel(
-            chap_tab,
+            tab,
             chaps=self.chaps,
-            on_save=self.save_data,
-            get_current_time=self.player_widget.get_current_time_seconds,
-            on_jump_to_sec=self.player_widget.set_time_seconds,
+            on_save=partial(self.record_edit, "chapters"),
+            get_current_time=self.player_widget.get_chapter_time_seconds,
+            on_jump_to_sec=self.player_widget.seek_chapter,
             on_manage_images=self.open_image_associations,
+            get_thumbnail=self.thumbnails.image,
         )
         self.chap_panel.pack(fill="both", expand=True)
 
-        # Aba de Legendas
-        sub_tab = tk.Frame(self.notebook)
-        self.notebook.add(sub_tab, text="Legendas")
+    def _show_thumbnails(self) -> None:
+        """Exibe na árvore de capítulos as miniaturas recém-geradas."""
+        if self.chap_panel is not None:
+            self.chap_panel.update_thumbnails()
+
+    def _build_subtitle_panel(self, tab: tk.Frame) -> None:
+        """Cria o painel de legendas na aba informada."""
         self.sub_panel = SubtitlePanel(
-            sub_tab,
+            tab,
             subtitles=self.subtitles,
-            on_save=self.save_subtitles,
+            on_save=partial(self.record_edit, "subtitles"),
             get_current_time_ms=self.player_widget.get_current_time_ms,
             on_jump_to_ms=self.player_widget.set_time_ms,
         )
         self.sub_panel.pack(fill="both", expand=True)
 
-        # Aba de Casting
-        cast_tab = tk.Frame(self.notebook)
-        self.notebook.add(cast_tab, text="Casting")
+    def _build_cast_panel(self, tab: tk.Frame) -> None:
+        """Cria o painel de casting na aba informada."""
         self.cast_panel = CastPanel(
-            cast_tab,
+            tab,
             casting=self.casting,
-            on_save=self.save_data,
+            on_save=partial(self.record_edit, "casting"),
             on_manage_images=self.open_image_associations,
         )
         self.cast_panel.pack(fill="both", expand=True)
 
-        metadata_tab = tk.Frame(self.notebook)
-        self.notebook.add(metadata_tab, text="Metadados")
+    def _build_metadata_panel(self, tab: tk.Frame) -> None:
+        """Cria o painel de metadados na aba informada."""
         self.metadata_panel = MetadataPanel(
-            metadata_tab,
+            tab,
             metadata=self.metadata,
-            on_save=self.save_data,
+            on_save=partial(self.record_edit, "metadata"),
             on_manage_images=self.open_image_associations,
         )
         self.metadata_panel.pack(fill="both", expand=True)
 
-        images_tab = tk.Frame(self.notebook)
-        self.notebook.add(images_tab, text="Imagens")
+    def _build_image_panel(self, tab: tk.Frame) -> None:
+        """Cria o painel de imagens na aba informada."""
         self.image_panel = ImagePanel(
-            images_tab,
+            tab,
             images=self.images,
             get_records=self._get_image_records,
-            on_save=self.save_data,
+            on_save=partial(self.record_edit, "images", "chapters", "casting", "metadata"),
         )
         self.image_panel.pack(fill="both", expand=True)
 
-        self.updater: str | None = None
-        self._start_update_loop()
-        self._bind_keys()
-
-        # Carrega a legenda no VLC se já existir arquivo .srt
-        self.initial_subtitle_after: str | None = self.after(500, self._load_initial_subtitles)
-
-    def _load_initial_subtitles(self) -> None:
-        """Carrega a legenda no player VLC ao iniciar."""
-        self.initial_subtitle_after = None
-        if self.subtitles:
+    def _ensure_tab(self, tab_id: str) -> None:
+        """Cria o painel da aba se ele ainda não existir."""
+        builder = self.tab_builders.pop(tab_id, None)
+        if builder is not None:
+            builder(self.nametowidget(tab_id))
+
+    def _show_current_tab(self) -> None:
+        """Garante o painel da aba visível e agenda o pré-carregamento da próxima."""
+        self._ensure_tab(self.notebook.select())
+        if self.tab_builders and self.preload_after is None:
+            self.preload_after = self.after(PRELOAD_DELAY_MS, self._preload_next_tab)
+
+    def _preload_next_tab(self) -> None:
+        """Cria, com o laço de eventos ocioso, o painel da aba seguinte à visível, a mais provável de ser aberta."""
+        self.preload_after = None
+        tabs = self.notebook.tabs()
+        current = tabs.index(self.notebook.select())
+        for tab_id in tabs[current + 1 :] + tabs[:current]:
+            if tab_id in self.tab_builders:
+                self._ensure_tab(tab_id)
+                return
+
+    @staticmethod
+    def _valid_recovery(data: dict[str, list[dict]], recovered: dict[str, list[dict]]) -> dict[str, list[dict]]:
+        """Mantém apenas as seções do diário que passam pela mesma validação do salvamento.
+
+        As seções do ``.chp`` são validadas juntas, pois os vínculos de imagens cruzam capítulos, elenco e metadados.
+        """
+        valid = dict(recovered)
+        chp_sections = [section for section in valid if section != "subtitles"]
+        if chp_sections:
+            merged = {**data, **valid}
+            try:
+                ChapterManager.validate(merged["chapters"], merged["casting"], merged["metadata"], merged["images"])
+            except (AttributeError, TypeError, ValueError):
+                for section in chp_sections:
+                    del valid[section]
+        if "subtitles" in valid:
             try:
-                self.player_widget.set_subtitle_file(self.sub_manager.srt_path)
-            except RuntimeError as exc:
-                messagebox.showwarning("Legenda não carregada", str(exc))
+                SubtitleManager.validate(valid["subtitles"])
+            except (AttributeError, TypeError, ValueError):
+                del valid["subtitles"]
+        return valid
+
+    def _restore_recovered(self, sections: dict[str, list[dict]]) -> None:
+        """Marca como pendentes os arquivos cujas seções vieram do diário e avisa o usuário."""
+        for section in sections:
+            self._mark_dirty(SRT if section == "subtitles" else CHP)
+        messagebox.showinfo(
+            "Edições recuperadas",
+            "Foram recuperadas edições que não chegaram a ser salvas antes do encerramento anterior.\n"
+            "Elas serão gravadas em instantes.",
+        )
 
     def destroy(self) -> None:
-        """Interrompe a reprodução e libera recursos do player."""
+        """Grava as edições pendentes, interrompe a reprodução e libera recursos do player."""
+        self.flush()
+        if self.preload_after:
+            self.after_cancel(self.preload_after)
+            self.preload_after = None
+        if self.journal_after:
+            self.after_cancel(self.journal_after)
+            self.journal_after = None
+        if self.export_after:
+            self.after_cancel(self.export_after)
+            self.export_after = None
+        self._cancel_focus_check()
         self._stop_update_loop()
         self._unbind_keys()
-        if self.initial_subtitle_after:
-            self.after_cancel(self.initial_subtitle_after)
-            self.initial_subtitle_after = None
+        self._unbind_autosave()
+        self.winfo_toplevel().title(self.base_title)
+        if hasattr(self, "subtitle_overlay"):
+            self.subtitle_overlay.close()
+        if self.thumbnails is not None:
+            self.thumbnails.close()
+            self.thumbnails = None
         if hasattr(self, "player_widget"):
             self.player_widget.destroy()
         super().destroy()
 
-    def save_data(self) -> None:
-        """Persiste os capítulos e casting atuais no arquivo JSON."""
+    @profiled("editor.save_data")
+    def save_data(self) -> bool:
+        """Persiste capítulos, casting, metadados e imagens no arquivo ``.chp``."""
         try:
             self.manager.save(self.chaps, self.casting, self.metadata, self.images)
         except (OSError, TypeError, ValueError) as exc:
             messagebox.showerror("Dados não salvos", str(exc))
+            return False
+        return True
 
-    def save_subtitles(self) -> None:
-        """Persiste as legendas atuais no arquivo .srt e atualiza no VLC."""
+    @profiled("editor.save_subtitles")
+    def save_subtitles(self) -> bool:
+        """Persiste as legendas atuais no arquivo .srt; o player as exibe direto da memória."""
         try:
             self.sub_manager.save(self.subtitles)
         except (OSError, TypeError, ValueError) as exc:
             messagebox.showerror("Legendas não salvas", str(exc))
-            return
+            return False
+        return True
+
+    def record_edit(self, *sections: str) -> None:
+        """Registra no diário as seções editadas e marca como pendentes os arquivos correspondentes."""
+        for section in sections:
+            self.journal.stage(section, self._section_data(section))
+        if self.journal_after is None:
+            self.journal_after = self.after(JOURNAL_BATCH_MS, self._write_journal)
+        if "subtitles" in sections:
+            self.waveform.redraw()
+            self.subtitle_overlay.invalidate()
+            self.mark_srt_dirty()
+        if any(section != "subtitles" for section in sections):
+            self.mark_chp_dirty()
+
+    def _section_data(self, section: str) -> list[dict]:
+        """Retorna a lista viva que contém a seção indicada."""
+        return getattr(self, SECTION_ATTRIBUTES[section])
+
+    def _write_journal(self) -> None:
+        """Grava no diário o lote de seções editadas desde a última gravação."""
+        self.journal_after = None
+        try:
+            self.journal.write_staged()
+        except (OSError, TypeError, ValueError) as exc:
+            messagebox.showwarning("Diário de edições indisponível", str(exc))
+
+    def mark_chp_dirty(self) -> None:
+        """Registra uma edição pendente no arquivo ``.chp``."""
+        self._mark_dirty(CHP)
+
+    def mark_srt_dirty(self) -> None:
+        """Registra uma edição pendente no arquivo ``.srt``."""
+        self._mark_dirty(SRT)
+
+    def _mark_dirty(self, sidecar: str) -> None:
+        """Marca o arquivo como pendente e reinicia a contagem para o salvamento automático."""
+        self.dirty.add(sidecar)
+        self._update_title()
+        if self.autosave_after:
+            self.after_cancel(self.autosave_after)
+        self.autosave_after = self.after(self.autosave_ms, self.flush)
+
+    def flush(self) -> bool:
+        """Grava imediatamente os arquivos pendentes e retorna se todos foram salvos."""
+        if self.autosave_after:
+            self.after_cancel(self.autosave_after)
+            self.autosave_after = None
+        if CHP in self.dirty and self.save_data():
+            self.dirty.discard(CHP)
+        if SRT in self.dirty and self.save_subtitles():
+            self.dirty.discard(SRT)
+        self._update_title()
+        if self.dirty:
+            if self.journal_after:
+                self.after_cancel(self.journal_after)
+            self._write_journal()
+            return False
+        if self.journal_after:
+            self.after_cancel(self.journal_after)
+            self.journal_after = None
         try:
-            self.player_widget.set_subtitle_file(self.sub_manager.srt_path)
-        except RuntimeError as exc:
-            messagebox.showwarning("Legenda salva, mas não recarregada", str(exc))
+            self.journal.clear()
+        except OSError:
+            pass
+        return True
+
+    def discard(self) -> None:
+        """Abandona as edições que não puderam ser gravadas e o diário, para que não voltem ao fechar nem ao reabrir."""
+        if self.autosave_after:
+            self.after_cancel(self.autosave_after)
+            self.autosave_after = None
+        if self.journal_after:
+            self.after_cancel(self.journal_after)
+            self.journal_after = None
+        try:
+            self.journal.clear()
+        except OSError:
+            pass
+        self.dirty.clear()
+        self._update_title()
+
+    def _update_title(self) -> None:
+        """Acrescenta ao título da janela o indicador de edições não salvas."""
+        self.winfo_toplevel().title(f"{self.base_title}{DIRTY_MARK}" if self.dirty else self.base_title)
 
     def _get_image_records(self) -> list[tuple[str, dict, str]]:
         """Lista todos os registros que podem receber imagens associadas."""
 
         records: list[tuple[str, dict, str]] = []
-
-        def add_chapters(nodes: list[dict], prefix: str = "") -> None:
-            for node in nodes:
-                label = f"Capítulo: {prefix}{node['title']}"
-                records.append(("chapters", node, label))
-                add_chapters(node["subs"], f"{prefix}{node['title']} › ")
-
-        def add_metadata(nodes: list[dict], prefix: str = "") -> None:
-            for node in nodes:
-                label = f"Metadado: {prefix}{node['key']}"
-                records.append(("metadata", node, label))
-                add_metadata(node["children"], f"{prefix}{node['key']} › ")
-
-        add_chapters(self.chaps)
-        add_metadata(self.metadata)
+        for record_type, nodes, kind, name_key, children_key in (
+            ("chapters", self.chaps, "Capítulo", "title", "subs"),
+            ("metadata", self.metadata, "Metadado", "key", "children"),
+        ):
+            pending: list[tuple[dict, str]] = [(node, "") for node in reversed(nodes)]
+            while pending:
+                node, prefix = pending.pop()
+                records.append((record_type, node, f"{kind}: {prefix}{node[name_key]}"))
+                child_prefix = f"{prefix}{node[name_key]} › "
+                pending.extend((child, child_prefix) for child in reversed(node[children_key]))
         records.extend(("casting", member, f"Elenco: {member['name']}") for member in self.casting)
         return records
 
     def open_image_associations(self, record: dict) -> None:
         """Abre o diálogo que associa várias imagens ao registro selecionado."""
 
-        ImageAssociationDialog(self, self.images, record, self.save_data)
+        from gui.image_association_dialog import ImageAssociationDialog
+
+        ImageAssociationDialog(self, self.images, record, partial(self.record_edit, "chapters", "casting", "metadata"))
+
+    def suggest_subtitles(self) -> None:
+        """Cria legendas vazias nos trechos de fala do áudio que ainda não têm legenda."""
+
+        envelope = self._speech_envelope()
+        if envelope is None:
+            return
+        from speech import cue_skeletons, speech_segments
+
+        skeletons = cue_skeletons(speech_segments(envelope), self.subtitles)
+        if not skeletons:
+            messagebox.showinfo(
+                "Nenhum trecho novo", "Todos os trechos de fala detectados já têm legendas.", parent=self
+            )
+            return
+        if not messagebox.askyesno(
+            "Sugerir legendas",
+            f"Criar {len(skeletons)} legendas vazias nos trechos de fala sem legenda?",
+            parent=self,
+        ):
+            return
+        self.subtitles.extend(skeletons)
+        self.subtitles.sort(key=lambda subtitle: subtitle["start"])
+        self._subtitles_changed()
+
+    def snap_subtitles(self) -> None:
+        """Aproxima as bordas das legendas existentes do início e do fim dos trechos de fala."""
+
+        envelope = self._speech_envelope()
+        if envelope is None:
+            return
+        from speech import snap_cues, speech_segments
+
+        moved = snap_cues(self.subtitles, speech_segments(envelope))
+        messagebox.showinfo(
+            "Legendas ajustadas", f"{moved} legendas tiveram as bordas ajustadas às pausas.", parent=self
+        )
+        if moved:
+            self._subtitles_changed()
+
+    def _speech_envelope(self) -> Envelope | None:
+        """Retorna o envelope de áudio, avisando quando a análise ainda não terminou."""
+
+        if self.waveform.envelope is None:
+            messagebox.showinfo(
+                "Áudio em análise",
+                "A forma de onda ainda está sendo preparada; tente novamente em instantes.",
+                parent=self,
+            )
+        return self.waveform.envelope
+
+    def _subtitles_changed(self) -> None:
+        """Atualiza a lista de legendas após uma alteração em lote e a registra."""
+
+        if self.sub_panel is not None:
+            self.sub_panel.refresh_sub_tree()
+        self.record_edit("subtitles")
+
+    def import_container_chapters(self) -> None:
+        """Substitui os capítulos pelos capítulos Nero gravados no próprio vídeo."""
+
+        try:
+            chapters = import_chapters(self.player_widget.video_path)
+        except (OSError, ValueError, struct.error) as exc:
+            messagebox.showerror("Capítulos não importados", str(exc), parent=self)
+            return
+        if not chapters:
+            messagebox.showinfo("Sem capítulos", "O vídeo não possui capítulos no formato Nero (chpl).", parent=self)
+            return
+        self._replace_chapters(chapters, "capítulos do vídeo")
+
+    def suggest_scene_chapters(self) -> None:
+        """Abre o diálogo que sugere capítulos nas mudanças de cena do vídeo."""
+
+        duration_ms = self.player_widget.player.get_length()
+        if duration_ms <= 0:
+            messagebox.showinfo(
+                "Vídeo carregando",
+                "A duração do vídeo ainda não é conhecida; tente novamente em instantes.",
+                parent=self,
+            )
+            return
+        from gui.scene_dialog import SceneDialog
+
+        SceneDialog(
+            self,
+            self.player_widget.video_path,
+            duration_ms,
+            on_insert=partial(self._replace_chapters, description="capítulos sugeridos pelas cenas"),
+            on_markers=self.waveform.set_markers,
+        )
+
+    def _replace_chapters(self, chapters: list[dict], description: str) -> bool:
+        """Substitui os capítulos após confirmação, se houver capítulos atuais; retorna se a troca foi feita."""
+
+        if self.chaps and not messagebox.askyesno(
+            "Substituir capítulos",
+            f"Substituir os {len(self.chaps)} capítulos atuais pelos {len(chapters)} {description}?",
+            parent=self,
+        ):
+            return False
+        self.chaps[:] = chapters
+        if self.chap_panel is not None:
+            self.chap_panel.refresh_chap_tree()
+        self.record_edit("chapters")
+        return True
+
+    def export_container_chapters(self) -> None:
+        """Grava os capítulos como capítulos Nero em uma cópia do vídeo, sem recodificar.
+
+        A cópia, que pode ter vários gigabytes, é feita em uma thread auxiliar acompanhada por ``after``.
+        """
+
+        if self.export_future is not None:
+            messagebox.showinfo("Exportação em andamento", "Aguarde o fim da exportação anterior.", parent=self)
+            return
+        if not self.chaps:
+            messagebox.showinfo("Sem capítulos", "Não há capítulos para exportar.", parent=self)
+            return
+        include_subchapters = messagebox.askyesnocancel(
+            "Exportar capítulos",
+            "Incluir os subcapítulos como capítulos do vídeo?\n\nEscolha Não para exportar apenas os capítulos principais.",
+            parent=self,
+        )
+        if include_subchapters is None:
+            return
+        source = Path(self.player_widget.video_path)
+        destination = filedialog.asksaveasfilename(
+            parent=self,
+            initialdir=source.parent,
+            initialfile=f"{source.stem} (capítulos){source.suffix}",
+            defaultextension=source.suffix,
+            filetypes=[("Vídeo MP4", "*.mp4 *.m4v *.mov"), ("Todos os arquivos", "*.*")],
+        )
+        if not destination:
+            return
+        if os.path.abspath(destination) == os.path.abspath(source):
+            messagebox.showerror("Destino inválido", "Escolha um arquivo diferente do vídeo aberto.", parent=self)
+            return
+        # A lista é convertida aqui para que edições durante a cópia não alcancem a thread auxiliar.
+        chapters = chapters_for_container(self.chaps, include_subchapters)
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="export-chapters")
+        self.export_future = executor.submit(write_chapters, str(source), destination, chapters)
+        executor.shutdown(wait=False)
+        self.winfo_toplevel().config(cursor="watch")
+        self.export_after = self.after(EXPORT_POLL_MS, partial(self._poll_export, destination))
+
+    def _poll_export(self, destination: str) -> None:
+        """Avisa o resultado quando a exportação termina."""
+
+        if self.export_future is None or not self.export_future.done():
+            self.export_after = self.after(EXPORT_POLL_MS, partial(self._poll_export, destination))
+            return
+        self.export_after = None
+        future, self.export_future = self.export_future, None
+        self.winfo_toplevel().config(cursor="")
+        try:
+            future.result()
+        except (OSError, ValueError, struct.error) as exc:
+            messagebox.showerror("Capítulos não exportados", str(exc), parent=self)
+            return
+        messagebox.showinfo(
+            "Capítulos exportados", f"O vídeo com capítulos foi gravado em:\n{destination}", parent=self
+        )
 
     def update_config(self, config: dict) -> None:
         """Aplica as configurações atualizadas aos submódulos."""
         self.app_config = config
         self.update_ms = config.get("update_ms", self.update_ms)
+        self.autosave_ms = config.get("autosave_ms", self.autosave_ms)
         self.player_widget.update_config(config)
         self._bind_keys()
 
@@ -211,6 +604,7 @@ class ChapterEditor(tk.Frame):
         """Passo de atualização contínua da interface."""
         self.updater = None
         self.player_widget.update_ui_loop_step()
+        self.waveform.set_position(self.player_widget.get_current_time_ms())
         self._start_update_loop()
 
     def _unbind_keys(self) -> None:
@@ -221,6 +615,57 @@ class ChapterEditor(tk.Frame):
             root.unbind(sequence, function_id)
         self.bound_shortcuts.clear()
 
+    def _unbind_autosave(self) -> None:
+        """Remove os bindings de Ctrl+S e de perda de foco."""
+
+        root = self.winfo_toplevel()
+        for sequence, function_id in self.autosave_bindings:
+            root.unbind(sequence, function_id)
+        self.autosave_bindings.clear()
+
+    def _bind_autosave(self) -> None:
+        """Associa Ctrl+S à gravação imediata e a perda de foco da janela ao salvamento pendente."""
+
+        self._unbind_autosave()
+        root = self.winfo_toplevel()
+
+        def save_now(_: tk.Event) -> str:
+            self.flush()
+            return "break"
+
+        for sequence, handler in (
+            ("<Control-s>", save_now),
+            ("<Control-S>", save_now),
+            ("<FocusOut>", lambda _: self._schedule_focus_check()),
+        ):
+            function_id = root.bind(sequence, handler, add="+")
+            if function_id:
+                self.autosave_bindings.append((sequence, function_id))
+
+    def _schedule_focus_check(self) -> None:
+        """Adia a verificação de foco até o Tk concluir a troca entre widgets."""
+
+        if self.dirty and self.focus_check_after is None:
+            self.focus_check_after = self.after_idle(self._flush_if_focus_lost)
+
+    def _cancel_focus_check(self) -> None:
+        """Cancela uma verificação de foco ainda não executada."""
+
+        if self.focus_check_after:
+            self.after_cancel(self.focus_check_after)
+            self.focus_check_after = None
+
+    def _flush_if_focus_lost(self) -> None:
+        """Grava as pendências quando nenhuma janela do aplicativo mantém o foco."""
+
+        self.focus_check_after = None
+        try:
+            focused = self.focus_get()
+        except (KeyError, tk.TclError):
+            focused = None
+        if focused is None:
+            self.flush()
+
     def _bind_keys(self) -> None:
         """Configura os atalhos de teclado globais."""
         self._unbind_keys()
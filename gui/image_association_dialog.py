@@ -9,6 +9,8 @@ from tkinter import ttk
 
 from PIL import Image, ImageTk
 
+from profiling import profiler
+
 
 class ImageAssociationDialog(tk.Toplevel):
     """Permite marcar imagens e visualizar a seleção antes de salvar os vínculos."""
@@ -98,9 +100,9 @@ class ImageAssociationDialog(tk.Toplevel):
         """Exibe a imagem clicada no painel lateral sem alterar seus vínculos."""
 
         try:
-            with Image.open(io.BytesIO(image["data"])) as source:
+            with profiler.span("image.decode"), Image.open(io.BytesIO(image["data"])) as source:
                 preview = source.copy()
-            preview.thumbnail((360, 300), Image.Resampling.LANCZOS)
+                preview.thumbnail((360, 300), Image.Resampling.LANCZOS)
             self.preview = ImageTk.PhotoImage(preview)
             self.preview_label.configure(image=self.preview, text="")
             self.description_var.set(image["description"] or "Sem descrição.")
@@ -10,6 +10,8 @@ from tkinter import filedialog, messagebox, ttk
 
 from PIL import Image, ImageGrab, ImageTk
 
+from profiling import profiler
+
 CROP_PRESETS = {
     "Quadrada (1080 × 1080)": (1080, 1080),
     "Card vertical (1080 × 1350)": (1080, 1350),
@@ -93,8 +95,9 @@ class ImageCropper(tk.Toplevel):
         if not path:
             return
         try:
-            with Image.open(path) as image:
-                self._set_source(image.copy(), Path(path).stem)
+            with profiler.span("image.decode"), Image.open(path) as image:
+                source = image.copy()
+            self._set_source(source, Path(path).stem)
         except (OSError, ValueError) as exc:
             messagebox.showerror("Imagem inválida", str(exc), parent=self)
 
@@ -111,8 +114,9 @@ class ImageCropper(tk.Toplevel):
             return
         if isinstance(clipboard, list) and clipboard:
             try:
-                with Image.open(clipboard[0]) as image:
-                    self._set_source(image.copy(), Path(clipboard[0]).stem)
+                with profiler.span("image.decode"), Image.open(clipboard[0]) as image:
+                    source = image.copy()
+                self._set_source(source, Path(clipboard[0]).stem)
                 return
             except (OSError, ValueError):
                 pass
@@ -182,8 +186,9 @@ class ImageCropper(tk.Toplevel):
                 max(1, round(self.source.width * self.scale)),
                 max(1, round(self.source.height * self.scale)),
             )
-            rendered = self.source.resize(preview_size, Image.Resampling.LANCZOS)
-            self.preview = ImageTk.PhotoImage(rendered)
+            with profiler.span("image.preview"):
+                rendered = self.source.resize(preview_size, Image.Resampling.LANCZOS)
+                self.preview = ImageTk.PhotoImage(rendered)
             self.canvas.create_image(self.offset_x, self.offset_y, image=self.preview, anchor="nw")
         left, top, right, bottom = self.frame_box
         width, height = int(self.canvas["width"]), int(self.canvas["height"])
@@ -244,16 +249,17 @@ class ImageCropper(tk.Toplevel):
             round((bottom - self.offset_y) / self.scale),
         )
         output_width, output_height = self._crop_dimensions()
-        cropped = self.source.crop(crop_box).resize((output_width, output_height), Image.Resampling.LANCZOS)
-        rgba = cropped.convert("RGBA")
-        has_transparency = rgba.getchannel("A").getextrema()[0] < 255
-        stream = io.BytesIO()
-        if has_transparency:
-            rgba.save(stream, format="PNG", optimize=True)
-            mime_type = "image/png"
-        else:
-            cropped.convert("RGB").save(stream, format="JPEG", quality=88, optimize=True, progressive=True)
-            mime_type = "image/jpeg"
+        with profiler.span("image.crop"):
+            cropped = self.source.crop(crop_box).resize((output_width, output_height), Image.Resampling.LANCZOS)
+            rgba = cropped.convert("RGBA")
+            has_transparency = rgba.getchannel("A").getextrema()[0] < 255
+            stream = io.BytesIO()
+            if has_transparency:
+                rgba.save(stream, format="PNG", optimize=True)
+                mime_type = "image/png"
+            else:
+                cropped.convert("RGB").save(stream, format="JPEG", quality=88, optimize=True, progressive=True)
+                mime_type = "image/jpeg"
         self.on_crop(
             {
                 "title": self.title_var.get().strip(),
@@ -8,8 +8,8 @@ from collections.abc import Callable
 from tkinter import ttk
 
 from gui.confirmation_dialog import ask_confirmation
-from gui.image_cropper import ImageCropper
 from gui.rounded_button import RoundedButton
+from profiling import profiled
 
 
 class ImagePanel(tk.Frame):
@@ -60,6 +60,7 @@ class ImagePanel(tk.Frame):
         )
         self.refresh()
 
+    @profiled("tree.images")
     def refresh(self, selected: dict | None = None) -> None:
         """Atualiza a biblioteca visual de imagens."""
 
@@ -84,6 +85,8 @@ class ImagePanel(tk.Frame):
     def add_image(self) -> None:
         """Abre o recortador para criar uma imagem final de tamanho controlado."""
 
+        from gui.image_cropper import ImageCropper
+
         ImageCropper(self, self._append_image)
 
     def _append_image(self, image: dict) -> None:
@@ -9,6 +9,7 @@ from tkinter import messagebox, ttk
 from gui.add_item_dialog import AddItemDialog, FormField
 from gui.confirmation_dialog import ask_confirmation
 from gui.rounded_button import RoundedButton
+from profiling import profiled
 
 
 class MetadataPanel(tk.Frame):
@@ -60,6 +61,7 @@ class MetadataPanel(tk.Frame):
         self.tree.bind("<Button-2>", self._show_context_menu)
         self.refresh_tree()
 
+    @profiled("tree.metadata")
     def refresh_tree(self, selected: dict | None = None) -> None:
         """Reconstrói a árvore e preserva a seleção quando possível."""
 
@@ -67,17 +69,16 @@ class MetadataPanel(tk.Frame):
         self.item_map = {}
         selected_id = ""
 
-        def add_nodes(parent_id: str, nodes: list[dict]) -> None:
-            nonlocal selected_id
-            for node in nodes:
-                value = "" if node["children"] else node["value"]
-                item_id = self.tree.insert(parent_id, "end", text=node["key"], values=(value,), open=True)
-                self.item_map[item_id] = node
-                if node is selected:
-                    selected_id = item_id
-                add_nodes(item_id, node["children"])
-
-        add_nodes("", self.metadata)
+        pending: list[tuple[str, dict]] = [("", node) for node in reversed(self.metadata)]
+        while pending:
+            parent_id, node = pending.pop()
+            value = "" if node["children"] else node["value"]
+            item_id = self.tree.insert(parent_id, "end", text=node["key"], values=(value,), open=True)
+            self.item_map[item_id] = node
+            if node is selected:
+                selected_id = item_id
+            pending.extend((item_id, child) for child in reversed(node["children"]))
+
         if selected_id:
             self.tree.selection_set(selected_id)
             self.tree.focus(selected_id)
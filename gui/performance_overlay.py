@@ -0,0 +1,110 @@
+"""Janela flutuante com o atraso do laço de eventos e as operações mais lentas do editor.
+
+O atraso exibido é medido pelo :class:`gui.watchdog.EventLoopWatchdog`, iniciado junto com a instrumentação.
+"""
+
+from __future__ import annotations
+
+import tkinter as tk
+from pathlib import Path
+from tkinter import filedialog, messagebox, ttk
+
+from profiling import Profiler, profiler
+
+
+class PerformanceOverlay(tk.Toplevel):
+    """Exibe percentis por operação, operações lentas recentes e exporta o trace do Chrome."""
+
+    def __init__(
+        self,
+        master: tk.Widget,
+        source: Profiler = profiler,
+        refresh_ms: int = 500,
+    ) -> None:
+        """Cria a janela e passa a atualizá-la periodicamente."""
+
+        super().__init__(master)
+        self.title("Desempenho")
+        self.transient(master.winfo_toplevel())
+        self.attributes("-topmost", True)
+        self.profiler = source
+        self.refresh_ms = refresh_ms
+        self.refresh_after: str | None = None
+
+        self.lag_var = tk.StringVar(value="Atraso do laço de eventos: aguardando medições…")
+        tk.Label(self, textvariable=self.lag_var, anchor="w", padx=8, pady=6).pack(fill="x")
+
+        self.operations = ttk.Treeview(
+            self, columns=("count", "p50", "p90", "p99", "max"), show="tree headings", height=9
+        )
+        self.operations.heading("#0", text="Operação", anchor="w")
+        self.operations.column("#0", width=210)
+        for column, title in (("count", "N"), ("p50", "p50"), ("p90", "p90"), ("p99", "p99"), ("max", "Máx.")):
+            self.operations.heading(column, text=title, anchor="e")
+            self.operations.column(column, width=62, anchor="e")
+        self.operations.pack(fill="both", expand=True, padx=8)
+
+        tk.Label(self, text="Operações lentas recentes (ms)", anchor="w", padx=8).pack(fill="x", pady=(6, 0))
+        self.slow = tk.Listbox(self, height=8, activestyle="none")
+        self.slow.pack(fill="both", expand=True, padx=8)
+
+        buttons = tk.Frame(self, padx=8, pady=8)
+        buttons.pack(fill="x")
+        tk.Button(buttons, text="Exportar trace…", command=self.export_trace).pack(side="left")
+        tk.Button(buttons, text="Limpar", command=self.clear).pack(side="left", padx=(6, 0))
+        tk.Button(buttons, text="Fechar", command=self.destroy).pack(side="right")
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
+
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Atualiza os números exibidos e agenda a próxima atualização."""
+
+        self.refresh_after = None
+        lag = self.profiler.lag_percentiles()
+        if lag["count"]:
+            self.lag_var.set(
+                f"Atraso do laço de eventos: p50 {lag['p50']:.1f} ms · p99 {lag['p99']:.1f} ms · "
+                f"máx. {lag['max']:.1f} ms"
+            )
+        self.operations.delete(*self.operations.get_children())
+        for name in self.profiler.operations():
+            summary = self.profiler.percentiles(name)
+            values = [summary["count"]] + [f"{summary[key]:.1f}" for key in ("p50", "p90", "p99", "max")]
+            self.operations.insert("", "end", text=name, values=values)
+        self.slow.delete(0, "end")
+        for span in self.profiler.slow_operations():
+            self.slow.insert("end", f"{span.start:9.2f} s  {span.duration * 1000:8.1f}  {span.name}")
+        self.refresh_after = self.after(self.refresh_ms, self.refresh)
+
+    def clear(self) -> None:
+        """Descarta as medições acumuladas e limpa a janela."""
+
+        self.profiler.reset()
+        if self.refresh_after:
+            self.after_cancel(self.refresh_after)
+        self.refresh()
+
+    def export_trace(self) -> None:
+        """Grava as medições em um arquivo JSON que pode ser aberto em ``chrome://tracing``."""
+
+        path = filedialog.asksaveasfilename(
+            parent=self,
+            defaultextension=".json",
+            initialfile="trace.json",
+            filetypes=[("Trace do Chrome", "*.json"), ("Todos os arquivos", "*.*")],
+        )
+        if not path:
+            return
+        try:
+            self.profiler.export_chrome_trace(Path(path))
+        except OSError as exc:
+            messagebox.showerror("Trace não exportado", str(exc), parent=self)
+
+    def destroy(self) -> None:
+        """Cancela a atualização periódica antes de fechar a janela."""
+
+        if self.refresh_after:
+            self.after_cancel(self.refresh_after)
+            self.refresh_after = None
+        super().destroy()
@@ -5,14 +5,20 @@ from __future__ import annotations
 import os
 import tkinter as tk
 from collections.abc import Callable
-from pathlib import Path
 from tkinter import messagebox, ttk
 
 import vlc
 
 from config import save_config
 from gui.rounded_button import RoundedButton
+from gui.scrub_preview import ScrubPreview
+from gui.seek_scheduler import SeekScheduler
 from logic import fmt_sec
+from mp4 import keyframe_index
+from profiling import profiled
+
+# As legendas exibidas vêm da lista em edição (``SubtitleOverlay``); o ``.srt`` ao lado do vídeo não é carregado.
+PLAYER_OPTIONS = ("--no-sub-autodetect-file",)
 
 
 class PlayerWidget(tk.Frame):
@@ -25,21 +31,29 @@ class PlayerWidget(tk.Frame):
         config: dict,
         on_drag_start: Callable[[], None],
         on_drag_end: Callable[[], None],
+        instance: vlc.Instance | None = None,
+        media: vlc.Media | None = None,
     ) -> None:
-        """Inicializa o player VLC e monta a interface de controle."""
+        """Inicializa o player VLC e monta a interface de controle.
+
+        ``instance`` e ``media`` permitem adotar uma instância e uma mídia já preparadas em segundo plano; o widget
+        passa a ser responsável por liberá-las.
+        """
 
         super().__init__(master)
         self.app_config = config
+        self.video_path = video_path
         self.small_jump = config.get("small_jump", 5)
         self.large_jump = config.get("large_jump", 20)
         self.on_drag_start_cb = on_drag_start
         self.on_drag_end_cb = on_drag_end
 
         # Instância e media player do VLC
-        self.vlc = vlc.Instance()
+        self.vlc = instance if instance is not None else vlc.Instance(*PLAYER_OPTIONS)
         self.player = self.vlc.media_player_new()
-        self.player.set_media(self.vlc.media_new(video_path))
+        self.player.set_media(media if media is not None else self.vlc.media_new(video_path))
         self.player.audio_set_volume(config.get("volume", 100))
+        self.seeks = SeekScheduler(self, self.player.set_time)
 
         # Canvas do vídeo com recuo nas bordas
         self.canvas = tk.Canvas(self, bg="black")
@@ -182,6 +196,7 @@ class PlayerWidget(tk.Frame):
         self.scale.bind("<MouseWheel>", self._on_progress_scroll)
         self.scale.bind("<Button-4>", self._on_progress_scroll)
         self.scale.bind("<Button-5>", self._on_progress_scroll)
+        self.scrub_preview = ScrubPreview(self.scale, video_path, self.player.get_length)
 
         self.embed_after: str | None = self.after(100, self._embed_and_play)
 
@@ -196,6 +211,8 @@ class PlayerWidget(tk.Frame):
     def destroy(self) -> None:
         """Libera recursos do player e instância VLC."""
         self._cancel_embed_schedule()
+        self.seeks.cancel()
+        self.scrub_preview.close()
         self.player.stop()
         self.player.release()
         self.vlc.release()
@@ -245,22 +262,27 @@ class PlayerWidget(tk.Frame):
             self.play_pause_btn.config(text="❚❚")
 
     def seek(self, scale_val: int) -> None:
-        """Move o vídeo para a posição proporcional ao slider."""
+        """Pede um salto para a posição proporcional ao slider, limitado em frequência durante o arraste."""
         dur = self.player.get_length()
         if dur > 0:
-            self.player.set_time(int(scale_val / 1000 * dur))
+            self.seeks.request(int(scale_val / 1000 * dur))
 
     def jump(self, secs: int) -> None:
-        """Avança ou retrocede o vídeo em segundos."""
-        current = max(0, self.player.get_time())
-        self._set_bounded_time(current + secs * 1000)
+        """Avança ou retrocede o vídeo em segundos, acumulando repetições rápidas em um único salto."""
+        current = self.seeks.expected(max(0, self.player.get_time()))
+        self.seeks.request(self._bounded_time(current + secs * 1000))
 
-    def _set_bounded_time(self, milliseconds: int) -> None:
-        """Move o vídeo respeitando zero e a duração conhecida da mídia."""
+    def _bounded_time(self, milliseconds: int) -> int:
+        """Limita o tempo entre zero e a duração conhecida da mídia."""
 
         duration = self.player.get_length()
         maximum = duration if duration > 0 else milliseconds
-        self.player.set_time(max(0, min(milliseconds, maximum)))
+        return max(0, min(milliseconds, maximum))
+
+    def _set_bounded_time(self, milliseconds: int) -> None:
+        """Move o vídeo na hora, respeitando zero e a duração conhecida da mídia."""
+
+        self.seeks.flush(self._bounded_time(milliseconds))
 
     def set_time_seconds(self, sec: int) -> None:
         """Move o vídeo para um segundo específico."""
@@ -278,16 +300,34 @@ class PlayerWidget(tk.Frame):
         """Retorna o tempo atual em milissegundos."""
         return max(0, self.player.get_time())
 
-    def set_subtitle_file(self, srt_path: str) -> None:
-        """Carrega e força o recarregamento dinâmico da legenda .srt no VLC em tempo real."""
-        path = Path(srt_path).resolve()
-        if path.exists():
-            result = self.player.add_slave(vlc.MediaSlaveType.subtitle, path.as_uri(), True)
-            if result != 0:
-                raise RuntimeError(f"O VLC não conseguiu carregar a legenda: {path}")
+    def get_chapter_time_seconds(self) -> int:
+        """Retorna o tempo atual em segundos para marcar capítulos, recuando ao quadro-chave se configurado."""
+        current = self.get_current_time_ms()
+        if self.app_config.get("snap_to_keyframe", False):
+            index = keyframe_index(self.video_path)
+            keyframe = index.at_or_before(current) if index else None
+            if keyframe is not None:
+                current = keyframe
+        return current // 1000
+
+    def seek_chapter(self, sec: int) -> None:
+        """Leva ao início de um capítulo, ou ao quadro-chave contido no mesmo segundo se os inícios são alinhados.
+
+        Com ``snap_to_keyframe``, os inícios marcados por :meth:`get_chapter_time_seconds` têm um quadro-chave nesse
+        segundo, e parar exatamente nele evita decodificar o GOP anterior. Sem a opção, o início pode estar no meio
+        de um GOP e o salto vai ao segundo exato, sem avançar até o próximo quadro-chave.
+        """
+        target = sec * 1000
+        if self.app_config.get("snap_to_keyframe", False):
+            index = keyframe_index(self.video_path)
+            keyframe = index.at_or_after(target) if index else None
+            if keyframe is not None and keyframe - target < 1000:
+                target = keyframe
+        self._set_bounded_time(target)
 
     def stop_video(self) -> None:
         """Interrompe a reprodução do vídeo e reseta a barra de tempo."""
+        self.seeks.cancel()
         self.player.stop()
         self.scale.config(command="")
         self.scale.set(0)
@@ -323,6 +363,7 @@ class PlayerWidget(tk.Frame):
         except OSError as exc:
             messagebox.showerror("Volume não salvo", str(exc), parent=self.winfo_toplevel())
 
+    @profiled("player.update_ui_loop_step")
     def update_ui_loop_step(self) -> None:
         """Atualiza a posição do slider e os rótulos de tempo."""
         dur = self.player.get_length()
@@ -344,9 +385,9 @@ class PlayerWidget(tk.Frame):
         self.on_drag_start_cb()
 
     def _drag_end(self, _: tk.Event) -> None:
-        """Move o vídeo e retoma as atualizações ao soltar o slider."""
+        """Aplica um único salto preciso para a posição final e retoma as atualizações ao soltar o slider."""
         val = self.scale.get()
         dur = self.player.get_length()
         if dur > 0:
-            self.player.set_time(int(val / 1000 * dur))
+            self.seeks.flush(int(val / 1000 * dur))
         self.on_drag_end_cb()
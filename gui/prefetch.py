@@ -0,0 +1,151 @@
+"""Pré-carregamento do próximo vídeo da pasta enquanto o atual está sendo editado.
+
+Uma thread auxiliar lê o ``.chp`` e o ``.srt`` do próximo vídeo e cria sua ``vlc.Media`` em uma instância própria
+do VLC, pedindo à libVLC a análise assíncrona com ``parse_with_options``. Ao trocar de vídeo, o editor adota os dados
+e a instância já prontos; se os arquivos do vídeo mudaram depois do pré-carregamento, eles são lidos de novo.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import vlc
+
+from gui.player_widget import PLAYER_OPTIONS
+from logic import VIDEO_EXTENSIONS, ChapterManager, DataLoadError, SubtitleManager
+from mp4 import keyframe_index
+
+PARSE_TIMEOUT_MS = 5_000
+
+
+def _natural_key(name: str) -> list[object]:
+    """Ordena ``Episódio 2`` antes de ``Episódio 10``, ignorando maiúsculas."""
+
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", name.casefold())]
+
+
+def next_video_in_folder(video_path: str) -> str | None:
+    """Retorna o vídeo seguinte da mesma pasta em ordem natural de nome, ou ``None`` no último."""
+
+    path = Path(video_path)
+    try:
+        siblings = [
+            entry.name
+            for entry in os.scandir(path.parent)
+            if entry.is_file() and Path(entry.name).suffix.lower() in VIDEO_EXTENSIONS
+        ]
+    except OSError:
+        return None
+    current_key = _natural_key(path.name)
+    following = [name for name in siblings if _natural_key(name) > current_key]
+    if not following:
+        return None
+    return str(path.with_name(min(following, key=_natural_key)))
+
+
+def _sidecar_stamps(video_path: str) -> tuple[int | None, ...]:
+    """Registra a data de modificação dos arquivos auxiliares para detectar alterações posteriores."""
+
+    base_path = os.path.splitext(video_path)[0]
+    stamps: list[int | None] = []
+    for suffix in (".chp", ".srt", ".journal"):
+        try:
+            stamps.append(os.stat(base_path + suffix).st_mtime_ns)
+        except FileNotFoundError:
+            stamps.append(None)
+    return tuple(stamps)
+
+
+class PrefetchedVideo(NamedTuple):
+    """Dados e mídia já preparados para um vídeo; quem os recebe passa a ser dono da instância do VLC."""
+
+    video_path: str
+    data: dict[str, Any]
+    subtitles: list[dict]
+    stamps: tuple[int | None, ...]
+    instance: Any
+    media: Any
+
+    def release(self) -> None:
+        """Libera a mídia e a instância do VLC que não chegaram a ser usadas."""
+
+        self.media.release()
+        self.instance.release()
+
+
+class VideoPrefetcher:
+    """Mantém no máximo um vídeo pré-carregado em segundo plano."""
+
+    def __init__(self, create_instance: Any = vlc.Instance) -> None:
+        """Cria o executor de uma única thread usado para o pré-carregamento."""
+
+        self.create_instance = create_instance
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="video-prefetch")
+        self.video_path: str | None = None
+        self.future: Future[PrefetchedVideo] | None = None
+
+    def _load(self, video_path: str) -> PrefetchedVideo:
+        """Lê os arquivos auxiliares e o índice de quadros-chave e inicia a análise da mídia na thread auxiliar."""
+
+        stamps = _sidecar_stamps(video_path)
+        keyframe_index(video_path)
+        data = ChapterManager(video_path).load()
+        subtitles = SubtitleManager(video_path).load()
+        instance = self.create_instance(*PLAYER_OPTIONS)
+        media = instance.media_new(video_path)
+        media.parse_with_options(vlc.MediaParseFlag.local, PARSE_TIMEOUT_MS)
+        return PrefetchedVideo(video_path, data, subtitles, stamps, instance, media)
+
+    def prefetch(self, video_path: str) -> None:
+        """Agenda o pré-carregamento de ``video_path``, descartando o anterior se for outro vídeo."""
+
+        if video_path == self.video_path:
+            return
+        self.discard()
+        self.video_path = video_path
+        self.future = self.executor.submit(self._load, video_path)
+
+    def take(self, video_path: str) -> PrefetchedVideo | None:
+        """Entrega o vídeo pré-carregado se ele corresponder a ``video_path`` e ainda estiver atual.
+
+        Se o pré-carregamento ainda estiver em andamento, aguarda sua conclusão, que é sempre mais curta que uma
+        carga a frio. Falhas de leitura resultam em ``None`` para que a carga normal apresente o erro.
+        """
+
+        if video_path != self.video_path or self.future is None:
+            self.discard()
+            return None
+        future, self.future, self.video_path = self.future, None, None
+        try:
+            prefetched = future.result()
+        except (DataLoadError, OSError, ValueError):
+            return None
+        if prefetched.stamps != _sidecar_stamps(video_path):
+            prefetched.release()
+            return None
+        return prefetched
+
+    def discard(self) -> None:
+        """Descarta o pré-carregamento atual, liberando os recursos do VLC quando ele terminar."""
+
+        future, self.future, self.video_path = self.future, None, None
+        if future is None or future.cancel():
+            return
+        future.add_done_callback(_release_unused)
+
+    def close(self) -> None:
+        """Descarta o pré-carregamento e encerra a thread auxiliar."""
+
+        self.discard()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _release_unused(future: Future[PrefetchedVideo]) -> None:
+    """Libera o resultado de um pré-carregamento descartado."""
+
+    if not future.cancelled() and future.exception() is None:
+        future.result().release()
@@ -0,0 +1,185 @@
+"""Abertura rápida de vídeos a partir do índice de sessões."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import tkinter as tk
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from tkinter import filedialog, messagebox, ttk
+
+from session_index import SessionIndex, VideoSummary
+from timecode import fmt_sec
+
+POLL_INTERVAL_MS = 100
+
+
+def _count(value: int | None) -> str:
+    """Formata uma contagem do resumo, indicando arquivos auxiliares ilegíveis."""
+
+    return "?" if value is None else str(value)
+
+
+class QuickOpenDialog(tk.Toplevel):
+    """Lista os vídeos indexados com seus resumos e abre o escolhido com duplo clique ou Enter.
+
+    A lista é exibida a partir do cache e atualizada logo em seguida com :meth:`SessionIndex.refresh`, executado em
+    uma thread de apoio para que a varredura das pastas não trave a janela.
+    """
+
+    def __init__(self, master: tk.Tk, index: SessionIndex, on_open: Callable[[str], None]) -> None:
+        """Cria a janela e exibe os resumos já guardados no índice."""
+
+        super().__init__(master)
+        self.title("Abertura rápida")
+        self.transient(master)
+        self.geometry("760x420")
+        self.index = index
+        self.on_open = on_open
+        self.summaries: list[VideoSummary] = []
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="quick-open")
+        self.future: Future[int] | None = None
+        self.refresh_pending = False
+        self.after_id: str | None = None
+
+        top = tk.Frame(self, padx=8, pady=6)
+        top.pack(fill="x")
+        tk.Label(top, text="Filtrar:").pack(side="left")
+        self.filter_var = tk.StringVar()
+        self.filter_var.trace_add("write", lambda *_: self.populate())
+        self.filter_entry = tk.Entry(top, textvariable=self.filter_var)
+        self.filter_entry.pack(side="left", fill="x", expand=True, padx=(4, 0))
+
+        columns = ("folder", "duration", "chapters", "cues", "images")
+        self.tree = ttk.Treeview(self, columns=columns, show="tree headings", selectmode="browse")
+        self.tree.heading("#0", text="Vídeo", anchor="w")
+        self.tree.column("#0", width=240)
+        self.tree.heading("folder", text="Pasta", anchor="w")
+        self.tree.column("folder", width=250)
+        for column, title in (("duration", "Duração"), ("chapters", "Capítulos"), ("cues", "Legendas")):
+            self.tree.heading(column, text=title, anchor="e")
+            self.tree.column(column, width=70, anchor="e")
+        self.tree.heading("images", text="Imagens", anchor="e")
+        self.tree.column("images", width=60, anchor="e")
+        self.tree.pack(fill="both", expand=True, padx=8)
+        self.tree.bind("<Double-1>", self.open_selected)
+        self.tree.bind("<Return>", self.open_selected)
+        self.filter_entry.bind("<Return>", self.open_selected)
+        self.filter_entry.bind("<Down>", self._focus_tree)
+
+        buttons = tk.Frame(self, padx=8, pady=8)
+        buttons.pack(fill="x")
+        tk.Button(buttons, text="Vigiar pasta…", command=self.add_folder).pack(side="left")
+        tk.Button(buttons, text="Abrir", command=self.open_selected).pack(side="right")
+        tk.Button(buttons, text="Fechar", command=self.destroy).pack(side="right", padx=(0, 6))
+        self.bind("<Escape>", lambda _: self.destroy())
+
+        self.reload()
+        self.filter_entry.focus_set()
+        self.after_idle(self.refresh)
+
+    def reload(self) -> None:
+        """Relê os resumos do índice e atualiza a lista."""
+
+        try:
+            self.summaries = self.index.summaries()
+        except (OSError, sqlite3.DatabaseError) as exc:
+            messagebox.showerror("Índice indisponível", str(exc), parent=self)
+            self.summaries = []
+        self.populate()
+
+    def refresh(self) -> None:
+        """Atualiza em segundo plano os resumos que mudaram; uma atualização pedida durante outra é feita em seguida."""
+
+        if not self.winfo_exists():
+            return
+        if self.future is not None:
+            self.refresh_pending = True
+            return
+        self.refresh_pending = False
+        self.future = self.executor.submit(self.index.refresh)
+        self.after_id = self.after(POLL_INTERVAL_MS, self._poll)
+
+    def _poll(self) -> None:
+        """Exibe o resultado da atualização quando ela termina."""
+
+        if self.future is None or not self.future.done():
+            self.after_id = self.after(POLL_INTERVAL_MS, self._poll)
+            return
+        self.after_id = None
+        future, self.future = self.future, None
+        try:
+            changed = future.result()
+        except (OSError, sqlite3.DatabaseError):
+            changed = 0
+        if changed:
+            self.reload()
+        if self.refresh_pending:
+            self.refresh()
+
+    def populate(self) -> None:
+        """Exibe os resumos cujo caminho contém o texto do filtro."""
+
+        needle = self.filter_var.get().casefold()
+        self.tree.delete(*self.tree.get_children())
+        for summary in self.summaries:
+            if needle and needle not in summary.path.casefold():
+                continue
+            duration = "" if summary.duration_ms is None else fmt_sec(summary.duration_ms // 1000)
+            self.tree.insert(
+                "",
+                "end",
+                iid=summary.path,
+                text=os.path.basename(summary.path),
+                values=(
+                    os.path.dirname(summary.path),
+                    duration,
+                    _count(summary.chapters),
+                    _count(summary.cues),
+                    _count(summary.images),
+                ),
+            )
+        children = self.tree.get_children()
+        if children:
+            self.tree.selection_set(children[0])
+
+    def _focus_tree(self, event: tk.Event | None = None) -> str:
+        """Leva o foco do filtro para a lista."""
+
+        self.tree.focus_set()
+        selection = self.tree.selection()
+        if selection:
+            self.tree.focus(selection[0])
+        return "break"
+
+    def open_selected(self, event: tk.Event | None = None) -> str:
+        """Fecha o diálogo e abre o vídeo selecionado."""
+
+        selection = self.tree.selection()
+        if selection:
+            self.destroy()
+            self.on_open(selection[0])
+        return "break"
+
+    def add_folder(self) -> None:
+        """Pergunta por uma pasta para vigiar e inclui seus vídeos na lista."""
+
+        folder = filedialog.askdirectory(parent=self, title="Vigiar pasta")
+        if not folder:
+            return
+        try:
+            self.index.add_folder(folder)
+        except (OSError, sqlite3.DatabaseError) as exc:
+            messagebox.showerror("Pasta não incluída", str(exc), parent=self)
+            return
+        self.refresh()
+
+    def destroy(self) -> None:
+        """Abandona a atualização em andamento antes de fechar a janela."""
+
+        if self.after_id is not None:
+            self.after_cancel(self.after_id)
+            self.after_id = None
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
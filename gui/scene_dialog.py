@@ -0,0 +1,133 @@
+"""Diálogo que sugere capítulos nas mudanças de cena detectadas pelo módulo ``scenes``."""
+
+from __future__ import annotations
+
+import threading
+import tkinter as tk
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from scenes import (
+    DEFAULT_THRESHOLD,
+    SceneTrack,
+    chapters_from_boundaries,
+    load_scene_track,
+    scene_boundaries,
+)
+from timecode import fmt_sec
+
+POLL_INTERVAL_MS = 250
+
+
+class SceneDialog(tk.Toplevel):
+    """Analisa o vídeo em segundo plano e permite ajustar o limiar antes de usar as mudanças de cena.
+
+    A análise só acontece uma vez por vídeo; mover o limiar apenas filtra a trilha de pontuações já calculada.
+    """
+
+    def __init__(
+        self,
+        master: tk.Widget,
+        video_path: str,
+        duration_ms: int,
+        on_insert: Callable[[list[dict]], bool],
+        on_markers: Callable[[list[int]], None],
+        load: Callable[[str, int, threading.Event], SceneTrack | None] = load_scene_track,
+    ) -> None:
+        """Cria o diálogo e inicia a análise do vídeo."""
+
+        super().__init__(master)
+        self.title("Sugerir capítulos pelas cenas")
+        self.transient(master.winfo_toplevel())
+        self.resizable(False, False)
+        self.duration_ms = duration_ms
+        self.on_insert = on_insert
+        self.on_markers = on_markers
+        self.track: SceneTrack | None = None
+        self.boundaries: list[int] = []
+        self.stop = threading.Event()
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scenes")
+        self.future: Future[SceneTrack | None] | None = self.executor.submit(load, video_path, duration_ms, self.stop)
+
+        content = tk.Frame(self, padx=10, pady=10)
+        content.pack(fill="both", expand=True)
+        self.status_var = tk.StringVar(value="Analisando as cenas do vídeo…")
+        tk.Label(content, textvariable=self.status_var, anchor="w", justify="left", wraplength=360).pack(fill="x")
+        self.threshold_var = tk.DoubleVar(value=DEFAULT_THRESHOLD)
+        self.threshold = tk.Scale(
+            content,
+            label="Sensibilidade (limiar de mudança)",
+            from_=0.05,
+            to=1.0,
+            resolution=0.01,
+            orient="horizontal",
+            length=360,
+            variable=self.threshold_var,
+            command=lambda _: self._retune(),
+            state="disabled",
+        )
+        self.threshold.pack(fill="x", pady=(8, 0))
+
+        footer = tk.Frame(self, padx=10, pady=10)
+        footer.pack(side="bottom", fill="x")
+        tk.Button(footer, text="Fechar", command=self.destroy).pack(side="right")
+        self.insert_button = tk.Button(footer, text="Inserir como capítulos", command=self._insert, state="disabled")
+        self.insert_button.pack(side="right", padx=(0, 6))
+        self.markers_button = tk.Button(
+            footer, text="Mostrar marcadores", command=lambda: self.on_markers(self.boundaries), state="disabled"
+        )
+        self.markers_button.pack(side="right", padx=(0, 6))
+
+        self.after_id: str | None = self.after(POLL_INTERVAL_MS, self._poll)
+
+    def _poll(self) -> None:
+        """Habilita os controles quando a análise termina ou mostra o erro."""
+
+        if self.future is None or not self.future.done():
+            self.after_id = self.after(POLL_INTERVAL_MS, self._poll)
+            return
+        self.after_id = None
+        future, self.future = self.future, None
+        try:
+            self.track = future.result()
+        except BrokenProcessPool:
+            self.status_var.set("Não foi possível analisar o vídeo: um processo de decodificação foi encerrado.")
+            return
+        except (OSError, ValueError, RuntimeError) as exc:
+            self.status_var.set(f"Não foi possível analisar o vídeo: {exc}")
+            return
+        if self.track is None:
+            return
+        for widget in (self.threshold, self.insert_button, self.markers_button):
+            widget.config(state="normal")
+        self._retune()
+
+    def _retune(self) -> None:
+        """Recalcula as mudanças de cena para o limiar atual."""
+
+        if self.track is None:
+            return
+        self.boundaries = scene_boundaries(self.track, self.threshold_var.get())
+        if not self.boundaries:
+            self.status_var.set("Nenhuma mudança de cena acima do limiar; reduza a sensibilidade.")
+            return
+        listed = ", ".join(fmt_sec(moment // 1000) for moment in self.boundaries[:6])
+        more = "…" if len(self.boundaries) > 6 else ""
+        self.status_var.set(f"{len(self.boundaries)} mudanças de cena: {listed}{more}")
+
+    def _insert(self) -> None:
+        """Entrega os capítulos sugeridos e fecha o diálogo se forem aceitos."""
+
+        if self.on_insert(chapters_from_boundaries(self.boundaries, self.duration_ms)):
+            self.destroy()
+
+    def destroy(self) -> None:
+        """Interrompe a análise em andamento antes de fechar o diálogo."""
+
+        self.stop.set()
+        if self.after_id is not None:
+            self.after_cancel(self.after_id)
+            self.after_id = None
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
@@ -0,0 +1,216 @@
+"""Pré-visualização de quadros ao passar o mouse sobre a barra de progresso do player.
+
+Uma única passagem em segundo plano decodifica, com o extrator de quadros sem janela das miniaturas, um quadro
+reduzido a cada intervalo e os reúne em uma folha (sprite sheet) PNG guardada no ``.previews``. Ao passar o mouse, o
+recorte correspondente da folha já carregada é copiado para a dica; nenhum quadro é decodificado nesse momento.
+"""
+
+from __future__ import annotations
+
+import base64
+import math
+import os
+import threading
+import tkinter as tk
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import NamedTuple
+
+from gui.thumbnails import FrameGrabber, encode_png
+from logic import PreviewCache, fmt_sec
+
+SPRITE_FRAME_WIDTH = 128
+SPRITE_FRAME_HEIGHT = 72
+SPRITE_COLUMNS = 10
+SPRITE_MIN_INTERVAL_MS = 10_000
+SPRITE_MAX_FRAMES = 360
+SPRITE_START_DELAY_MS = 5_000
+POLL_INTERVAL_MS = 500
+
+
+class SpriteSheet(NamedTuple):
+    """Folha PNG com um quadro a cada ``interval_ms``, em ``columns`` colunas, a partir do início do vídeo."""
+
+    stamp: str
+    interval_ms: int
+    columns: int
+    frame_width: int
+    frame_height: int
+    count: int
+    data: bytes
+
+    def cell(self, time_ms: int) -> tuple[int, int, int, int]:
+        """Retorna o retângulo ``(x0, y0, x1, y1)`` do quadro que representa ``time_ms``."""
+
+        index = min(max(0, time_ms // self.interval_ms), self.count - 1)
+        x0 = index % self.columns * self.frame_width
+        y0 = index // self.columns * self.frame_height
+        return x0, y0, x0 + self.frame_width, y0 + self.frame_height
+
+
+def sprite_interval(duration_ms: int) -> int:
+    """Escolhe o intervalo entre quadros: o mínimo, ou o necessário para não passar do limite de quadros."""
+
+    return max(SPRITE_MIN_INTERVAL_MS, math.ceil(duration_ms / SPRITE_MAX_FRAMES / 1000) * 1000)
+
+
+def video_stamp(video_path: str) -> str:
+    """Identifica a versão do arquivo de vídeo pelo tamanho e pela data de modificação."""
+
+    stat = os.stat(video_path)
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def build_sprite_sheet(
+    grabber: FrameGrabber, duration_ms: int, stamp: str, stop: threading.Event
+) -> SpriteSheet | None:
+    """Decodifica os quadros em ordem e os copia para a folha; retorna ``None`` se ``stop`` for sinalizado.
+
+    Um quadro que não chega a tempo repete o anterior, para que a folha continue alinhada ao intervalo.
+    """
+
+    if duration_ms <= 0:
+        return None
+    interval = sprite_interval(duration_ms)
+    count = math.ceil(duration_ms / interval)
+    columns = min(SPRITE_COLUMNS, count)
+    rows = math.ceil(count / columns)
+    width, height = grabber.width, grabber.height
+    frame_stride = width * 3
+    sheet_stride = columns * frame_stride
+    sheet = bytearray(sheet_stride * rows * height)
+    previous = bytes(frame_stride * height)
+    for index in range(count):
+        if stop.is_set():
+            return None
+        previous = grabber.grab(index * interval) or previous
+        offset = index // columns * height * sheet_stride + index % columns * frame_stride
+        for row in range(height):
+            start = offset + row * sheet_stride
+            sheet[start : start + frame_stride] = previous[row * frame_stride : (row + 1) * frame_stride]
+    data = encode_png(columns * width, rows * height, bytes(sheet))
+    return SpriteSheet(stamp, interval, columns, width, height, count, data)
+
+
+def create_sprite_grabber(video_path: str) -> FrameGrabber:
+    """Cria o extrator de quadros no tamanho dos recortes da folha."""
+
+    return FrameGrabber(video_path, max_width=SPRITE_FRAME_WIDTH, max_height=SPRITE_FRAME_HEIGHT)
+
+
+def load_or_build_sprite_sheet(
+    video_path: str,
+    stop: threading.Event,
+    create_grabber: Callable[[str], FrameGrabber] = create_sprite_grabber,
+) -> SpriteSheet | None:
+    """Reaproveita a folha do ``.previews`` se o vídeo não mudou; caso contrário, gera e grava uma nova."""
+
+    previews = PreviewCache(video_path)
+    stamp = video_stamp(video_path)
+    stored = previews.load_sprite_sheet()
+    if stored is not None and stored["stamp"] == stamp:
+        return SpriteSheet(**stored)
+    grabber = create_grabber(video_path)
+    try:
+        sheet = build_sprite_sheet(grabber, grabber.duration_ms, stamp, stop)
+    finally:
+        grabber.release()
+    if sheet is not None:
+        try:
+            previews.store_sprite_sheet(sheet._asdict())
+        except ValueError:
+            pass
+    return sheet
+
+
+class ScrubPreview:
+    """Dica com o quadro e o tempo sob o ponteiro na barra de progresso."""
+
+    def __init__(self, scale: tk.Scale, video_path: str, get_length: Callable[[], int]) -> None:
+        """Agenda a preparação da folha e passa a acompanhar o ponteiro sobre ``scale``."""
+
+        self.scale = scale
+        self.video_path = video_path
+        self.get_length = get_length
+        self.sheet: SpriteSheet | None = None
+        self.sheet_image: tk.PhotoImage | None = None
+        self.tile: tk.PhotoImage | None = None
+        self.tooltip: tk.Toplevel | None = None
+        self.label: tk.Label | None = None
+        self.stop = threading.Event()
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scrub-preview")
+        self.future: Future[SpriteSheet | None] | None = None
+        self.after_id: str | None = scale.after(SPRITE_START_DELAY_MS, self._start)
+        scale.bind("<Motion>", self._on_motion, add="+")
+        scale.bind("<Leave>", self.hide, add="+")
+
+    def _start(self) -> None:
+        """Inicia a passagem em segundo plano, depois que o player interativo já começou a reproduzir."""
+
+        self.future = self.executor.submit(load_or_build_sprite_sheet, self.video_path, self.stop)
+        self.after_id = self.scale.after(POLL_INTERVAL_MS, self._poll)
+
+    def _poll(self) -> None:
+        """Adota a folha quando a passagem termina; falhas deixam a barra sem pré-visualização."""
+
+        if self.future is None or not self.future.done():
+            self.after_id = self.scale.after(POLL_INTERVAL_MS, self._poll)
+            return
+        self.after_id = None
+        future, self.future = self.future, None
+        try:
+            sheet = future.result()
+        except (OSError, ValueError, AttributeError, NameError):
+            return
+        if sheet is not None:
+            self.sheet = sheet
+            self.sheet_image = tk.PhotoImage(master=self.scale, data=base64.b64encode(sheet.data))
+
+    def time_at(self, x: int, y: int) -> int | None:
+        """Converte a posição do ponteiro no tempo correspondente da barra, em milissegundos."""
+
+        length = self.get_length()
+        if length <= 0:
+            return None
+        value = float(self.scale.tk.call(self.scale, "get", x, y))
+        return round(value / float(self.scale.cget("to")) * length)
+
+    def _on_motion(self, event: tk.Event) -> None:
+        """Mostra o quadro sob o ponteiro, apenas recortando a folha já carregada."""
+
+        time_ms = self.time_at(event.x, event.y)
+        if self.sheet is None or self.sheet_image is None or time_ms is None:
+            return
+        if self.tooltip is None:
+            self.tile = tk.PhotoImage(master=self.scale, width=self.sheet.frame_width, height=self.sheet.frame_height)
+            self.tooltip = tk.Toplevel(self.scale)
+            self.tooltip.overrideredirect(True)
+            self.label = tk.Label(
+                self.tooltip, image=self.tile, compound="top", bg="#111111", fg="#ffffff", font=("Segoe UI", 8, "bold")
+            )
+            self.label.pack()
+        x0, y0, x1, y1 = self.sheet.cell(time_ms)
+        self.tile.tk.call(self.tile, "copy", self.sheet_image, "-from", x0, y0, x1, y1, "-to", 0, 0)
+        self.label.config(text=fmt_sec(time_ms // 1000))
+        x = event.x_root - self.sheet.frame_width // 2
+        y = self.scale.winfo_rooty() - self.sheet.frame_height - 24
+        self.tooltip.geometry(f"+{x}+{y}")
+        self.tooltip.deiconify()
+
+    def hide(self, _: tk.Event | None = None) -> None:
+        """Esconde a dica quando o ponteiro sai da barra."""
+
+        if self.tooltip is not None:
+            self.tooltip.withdraw()
+
+    def close(self) -> None:
+        """Interrompe a passagem em andamento e libera a dica."""
+
+        self.stop.set()
+        if self.after_id is not None:
+            self.scale.after_cancel(self.after_id)
+            self.after_id = None
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        if self.tooltip is not None:
+            self.tooltip.destroy()
+            self.tooltip = None
@@ -0,0 +1,94 @@
+"""Agendador de saltos do player: mantém só o destino mais recente e limita a frequência de ``set_time``.
+
+Cada ``set_time`` na libVLC pode custar uma decodificação desde o quadro-chave anterior. Arrastar a barra de progresso,
+segurar uma tecla de salto ou girar a roda do mouse gera dezenas de pedidos por segundo; o agendador aplica o
+primeiro imediatamente, guarda apenas o último dos seguintes e o aplica quando o intervalo mínimo termina.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+import tkinter as tk
+from collections.abc import Callable
+
+SEEK_INTERVAL_MS = 100
+
+
+class SeekScheduler:
+    """Aplica saltos com no máximo um ``set_time`` por intervalo, sempre para o destino mais recente."""
+
+    def __init__(
+        self,
+        widget: tk.Misc,
+        apply: Callable[[int], None],
+        interval_ms: int = SEEK_INTERVAL_MS,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """Prepara o agendador; ``apply`` recebe o destino em milissegundos."""
+
+        self.widget = widget
+        self.apply = apply
+        self.interval = interval_ms / 1000
+        self.clock = clock
+        self.pending: int | None = None
+        self.after_id: str | None = None
+        self.last_target: int | None = None
+        self.last_applied_at = -math.inf
+
+    def request(self, milliseconds: int) -> None:
+        """Pede um salto; dentro do intervalo mínimo, ele substitui o pedido anterior ainda não aplicado."""
+
+        self.pending = milliseconds
+        if self.after_id is not None:
+            return
+        wait = self.interval - (self.clock() - self.last_applied_at)
+        if wait <= 0:
+            self._apply_pending()
+        else:
+            self.after_id = self.widget.after(max(1, math.ceil(wait * 1000)), self._fire)
+
+    def flush(self, milliseconds: int | None = None) -> None:
+        """Aplica imediatamente o destino informado ou o pendente, descartando a espera."""
+
+        target = self.pending if milliseconds is None else milliseconds
+        self.cancel()
+        if target is not None:
+            self.pending = target
+            self._apply_pending()
+
+    def cancel(self) -> None:
+        """Descarta o destino pendente e a aplicação agendada."""
+
+        self.pending = None
+        if self.after_id is not None:
+            self.widget.after_cancel(self.after_id)
+            self.after_id = None
+
+    def expected(self, current_ms: int) -> int:
+        """Retorna a posição esperada após os saltos pedidos, para acumular saltos relativos em sequência.
+
+        O tempo informado pela libVLC só reflete um ``set_time`` depois de alguns quadros; até o fim do intervalo, o
+        último destino aplicado vale mais que ``current_ms``.
+        """
+
+        if self.pending is not None:
+            return self.pending
+        if self.last_target is not None and self.clock() - self.last_applied_at < self.interval:
+            return self.last_target
+        return current_ms
+
+    def _fire(self) -> None:
+        """Aplica o destino pendente ao fim do intervalo."""
+
+        self.after_id = None
+        if self.pending is not None:
+            self._apply_pending()
+
+    def _apply_pending(self) -> None:
+        """Envia o destino pendente ao player."""
+
+        target, self.pending = self.pending, None
+        self.last_target = target
+        self.last_applied_at = self.clock()
+        self.apply(target)
@@ -38,6 +38,15 @@ class SettingsWindow(tk.Toplevel):
         self.large_var = tk.StringVar(value=str(config.get("large_jump", 20)))
         tk.Entry(self, textvariable=self.large_var, width=8).grid(row=2, column=1)
 
+        tk.Label(self, text="Salvamento automático (ms)").grid(row=3, column=0, sticky="e")
+        self.autosave_var = tk.StringVar(value=str(config.get("autosave_ms", 750)))
+        tk.Entry(self, textvariable=self.autosave_var, width=8).grid(row=3, column=1)
+
+        self.snap_var = tk.BooleanVar(value=config.get("snap_to_keyframe", False))
+        tk.Checkbutton(self, text="Alinhar inícios de capítulo ao quadro-chave", variable=self.snap_var).grid(
+            row=4, column=0, columnspan=2, sticky="w"
+        )
+
         self.key_vars: dict[str, tk.StringVar] = {}
         labels = [
             ("play_pause", "Play/Pause"),
@@ -46,7 +55,7 @@ class SettingsWindow(tk.Toplevel):
             ("back_large", "Voltar longo"),
             ("fwd_large", "Avançar longo"),
         ]
-        for i, (key, lbl) in enumerate(labels, start=3):
+        for i, (key, lbl) in enumerate(labels, start=5):
             tk.Label(self, text=lbl).grid(row=i, column=0, sticky="e")
             var = tk.StringVar(value=config.get("keys", {}).get(key, ""))
             ent = tk.Entry(self, textvariable=var, width=15)
@@ -89,8 +98,11 @@ class SettingsWindow(tk.Toplevel):
             update_ms = int(self.update_var.get())
             small_jump = int(self.small_var.get())
             large_jump = int(self.large_var.get())
+            autosave_ms = int(self.autosave_var.get())
         except ValueError:
-            messagebox.showerror("Valores inválidos", "Atualização e saltos devem ser números inteiros.", parent=self)
+            messagebox.showerror(
+                "Valores inválidos", "Atualização, saltos e salvamento devem ser números inteiros.", parent=self
+            )
             return
         if not 50 <= update_ms <= 60_000:
             messagebox.showerror("Atualização inválida", "Use um intervalo entre 50 e 60000 ms.", parent=self)
@@ -98,10 +110,15 @@ class SettingsWindow(tk.Toplevel):
         if not 1 <= small_jump <= 3_600 or not 1 <= large_jump <= 3_600:
             messagebox.showerror("Salto inválido", "Use saltos entre 1 e 3600 segundos.", parent=self)
             return
+        if not 100 <= autosave_ms <= 60_000:
+            messagebox.showerror("Salvamento inválido", "Use um intervalo entre 100 e 60000 ms.", parent=self)
+            return
 
         self.app_config["update_ms"] = update_ms
         self.app_config["small_jump"] = small_jump
         self.app_config["large_jump"] = large_jump
+        self.app_config["autosave_ms"] = autosave_ms
+        self.app_config["snap_to_keyframe"] = self.snap_var.get()
         keys = self.app_config.setdefault("keys", {})
         for key, variable in self.key_vars.items():
             value = variable.get().strip() or keys.get(key, "")
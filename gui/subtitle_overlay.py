@@ -0,0 +1,71 @@
+"""Exibição das legendas em edição diretamente sobre o vídeo, pelo filtro de letreiro (marquee) da libVLC.
+
+As legendas não passam pelo arquivo ``.srt``: a cada passo o texto ativo é localizado por busca binária na lista em
+memória e só é enviado ao VLC quando muda. Assim uma edição aparece no vídeo na hora, e o ``.srt`` só é gravado pelo
+salvamento automático do editor.
+"""
+
+from __future__ import annotations
+
+import tkinter as tk
+
+import vlc
+
+from logic import SubtitleTimeline
+
+TICK_MS = 100
+MARQUEE_POSITION_BOTTOM = 8
+MARQUEE_MARGIN_Y = 24
+MARQUEE_COLOR = 0xFFFFFF
+
+
+class SubtitleOverlay:
+    """Mantém o letreiro do player sincronizado com as legendas ativas na posição atual."""
+
+    def __init__(self, widget: tk.Widget, player: vlc.MediaPlayer, subtitles: list[dict]) -> None:
+        """Habilita o letreiro no player e inicia o acompanhamento da reprodução."""
+
+        self.widget = widget
+        self.player = player
+        self.subtitles = subtitles
+        self.timeline: SubtitleTimeline | None = None
+        self.text: str | None = None
+        for option, value in (
+            (vlc.VideoMarqueeOption.Enable, 1),
+            (vlc.VideoMarqueeOption.Position, MARQUEE_POSITION_BOTTOM),
+            (vlc.VideoMarqueeOption.Y, MARQUEE_MARGIN_Y),
+            (vlc.VideoMarqueeOption.Color, MARQUEE_COLOR),
+            (vlc.VideoMarqueeOption.Timeout, 0),
+        ):
+            self.player.video_set_marquee_int(option, value)
+        self.after_id: str | None = widget.after(TICK_MS, self._tick)
+
+    def invalidate(self) -> None:
+        """Descarta o índice após uma edição e atualiza o texto exibido imediatamente."""
+
+        self.timeline = None
+        self.render()
+
+    def render(self) -> None:
+        """Envia ao VLC o texto das legendas ativas, se for diferente do exibido."""
+
+        if self.timeline is None:
+            self.timeline = SubtitleTimeline(self.subtitles)
+        text = "\n".join(self.timeline.active(max(0, self.player.get_time())))
+        if text != self.text:
+            self.player.video_set_marquee_string(vlc.VideoMarqueeOption.Text, text)
+            self.text = text
+
+    def _tick(self) -> None:
+        """Passo periódico que acompanha a posição de reprodução."""
+
+        self.render()
+        self.after_id = self.widget.after(TICK_MS, self._tick)
+
+    def close(self) -> None:
+        """Interrompe o acompanhamento e desliga o letreiro."""
+
+        if self.after_id is not None:
+            self.widget.after_cancel(self.after_id)
+            self.after_id = None
+        self.player.video_set_marquee_int(vlc.VideoMarqueeOption.Enable, 0)
@@ -9,11 +9,22 @@ from tkinter import messagebox, ttk
 from gui.add_item_dialog import AddItemDialog, FormField
 from gui.confirmation_dialog import ask_confirmation
 from gui.rounded_button import RoundedButton
-from logic import fmt_srt_time, parse_srt_time
+from logic import QC_ISSUES, SubtitleChecker, fmt_srt_time, issue_codes, parse_srt_time
+from profiling import profiled
+
+ALL_SUBTITLES = "Todas as legendas"
+WITH_ISSUES = "Com problemas"
+QC_COLORS = {
+    "overlap": "#f6c6c6",
+    "gap": "#f9dfc0",
+    "short": "#fbefb5",
+    "long": "#fbefb5",
+    "cps": "#dcd3f5",
+}
 
 
 class SubtitlePanel(tk.Frame):
-    """Painel de legendas com Treeview (tempo estendido), Scrollbar e menu de contexto."""
+    """Painel de legendas com Treeview (tempo estendido), verificação de qualidade, Scrollbar e menu de contexto."""
 
     def __init__(
         self,
@@ -31,6 +42,8 @@ class SubtitlePanel(tk.Frame):
         self.get_current_time_ms = get_current_time_ms
         self.on_jump_to_ms = on_jump_to_ms
         self.item_map: dict[str, dict] = {}
+        self.checker = SubtitleChecker(subtitles)
+        self.row_ids: list[str] = []
 
         btns = tk.Frame(self)
         btns.pack(side="top", fill="x", pady=(6, 4), padx=6)
@@ -40,13 +53,25 @@ class SubtitlePanel(tk.Frame):
         RoundedButton(btns, text="– remover", command=self.rm_subtitle, width=76, height=30, radius=10).pack(
             side="left", padx=2
         )
+        self.filter_var = tk.StringVar(value=ALL_SUBTITLES)
+        qc_filter = ttk.Combobox(
+            btns,
+            textvariable=self.filter_var,
+            values=(ALL_SUBTITLES, WITH_ISSUES, *QC_ISSUES.values()),
+            state="readonly",
+            width=16,
+        )
+        qc_filter.pack(side="right", padx=2)
+        qc_filter.bind("<<ComboboxSelected>>", lambda _: self.refresh_sub_tree())
+        self.issues_lbl = tk.Label(btns, text="", fg="#7a2020")
+        self.issues_lbl.pack(side="right", padx=4)
 
         sub_frame = tk.Frame(self, bd=0, relief="flat")
         sub_frame.pack(fill="both", expand=True, padx=4, pady=(2, 4))
 
         self.tree = ttk.Treeview(
             sub_frame,
-            columns=("start", "end", "text"),
+            columns=("start", "end", "text", "qc"),
             show="headings",
             selectmode="browse",
             height=15,
@@ -54,10 +79,14 @@ class SubtitlePanel(tk.Frame):
         self.tree.heading("start", text="Início", anchor="e")
         self.tree.heading("end", text="Fim", anchor="e")
         self.tree.heading("text", text="Texto da Legenda", anchor="w")
+        self.tree.heading("qc", text="Verificação", anchor="w")
 
         self.tree.column("start", width=100, anchor="e")
         self.tree.column("end", width=100, anchor="e")
         self.tree.column("text", width=220, anchor="w")
+        self.tree.column("qc", width=110, anchor="w")
+        for code, color in QC_COLORS.items():
+            self.tree.tag_configure(code, background=color)
 
         self.sub_scroll = ttk.Scrollbar(sub_frame, orient="vertical", command=self.tree.yview)
         self.tree.configure(yscrollcommand=self.sub_scroll.set)
@@ -78,26 +107,77 @@ class SubtitlePanel(tk.Frame):
 
         self.refresh_sub_tree()
 
-    def refresh_sub_tree(self, select_sub: dict | None = None) -> None:
-        """Atualiza a árvore com a lista de legendas e foca o item selecionado."""
+    @profiled("tree.subtitles")
+    def refresh_sub_tree(self, select_sub: dict | None = None, edited: dict | None = None) -> None:
+        """Atualiza a árvore com as legendas que passam no filtro, marcando os problemas, e foca o item selecionado.
+
+        Com ``edited`` (uma legenda alterada, já na posição ordenada), e mostrando todas as legendas, só a linha dela
+        e as linhas vizinhas cujos problemas mudaram são reescritas; nos demais casos a árvore é refeita.
+        """
+        if edited is not None and self.filter_var.get() == ALL_SUBTITLES and len(self.row_ids) == len(self.subtitles):
+            old = self.checker.positions.get(id(edited))
+            changed = self.checker.update(edited)
+            if old is not None and changed is not None:
+                self._refresh_rows(old, self.checker.positions[id(edited)], changed.tolist())
+                self._select(select_sub)
+                return
+        else:
+            self.checker.rebuild()
+        self._rebuild_tree(select_sub)
+
+    def _rebuild_tree(self, select_sub: dict | None) -> None:
+        """Recria todas as linhas da árvore com as máscaras atuais da verificação."""
         self.tree.delete(*self.tree.get_children())
         self.item_map = {}
-        found_id = None
-
-        for sub in self.subtitles:
-            item_id = self.tree.insert(
-                "",
-                "end",
-                values=(
-                    fmt_srt_time(sub["start"]),
-                    fmt_srt_time(sub["end"]),
-                    sub.get("text", ""),
-                ),
-            )
+        self.row_ids = []
+        masks = self.checker.masks.tolist()
+        self._show_issue_count()
+        wanted = self.filter_var.get()
+        wanted_code = next((code for code, label in QC_ISSUES.items() if label == wanted), None)
+
+        for sub, mask in zip(self.subtitles, masks):
+            codes = issue_codes(mask)
+            if (wanted == WITH_ISSUES and not codes) or (wanted_code is not None and wanted_code not in codes):
+                continue
+            item_id = self.tree.insert("", "end", values=self._row_values(sub, codes), tags=codes)
             self.item_map[item_id] = sub
-            if sub is select_sub:
-                found_id = item_id
+            self.row_ids.append(item_id)
+        if wanted != ALL_SUBTITLES:
+            self.row_ids = []
+        self._select(select_sub)
+
+    def _refresh_rows(self, old: int, new: int, changed: list[int]) -> None:
+        """Move a linha editada de ``old`` para ``new`` e reescreve as linhas das posições ``changed``."""
+        if new != old:
+            row_id = self.row_ids.pop(old)
+            self.row_ids.insert(new, row_id)
+            self.tree.move(row_id, "", new)
+        masks = self.checker.masks
+        for index in changed:
+            codes = issue_codes(int(masks[index]))
+            self.tree.item(self.row_ids[index], values=self._row_values(self.subtitles[index], codes), tags=codes)
+        self._show_issue_count()
+
+    def _show_issue_count(self) -> None:
+        """Mostra quantas legendas têm algum problema."""
+        flagged = int(self.checker.masks.astype(bool).sum())
+        self.issues_lbl.config(text=f"{flagged} com problemas" if flagged else "")
+
+    @staticmethod
+    def _row_values(sub: dict, codes: tuple[str, ...]) -> tuple[str, str, str, str]:
+        """Monta as colunas exibidas de uma legenda."""
+        return (
+            fmt_srt_time(sub["start"]),
+            fmt_srt_time(sub["end"]),
+            sub.get("text", ""),
+            ", ".join(QC_ISSUES[code] for code in codes),
+        )
 
+    def _select(self, select_sub: dict | None) -> None:
+        """Seleciona e mostra a linha da legenda indicada, se ela estiver na árvore."""
+        if select_sub is None:
+            return
+        found_id = next((item_id for item_id, sub in self.item_map.items() if sub is select_sub), None)
         if found_id:
             self.tree.selection_set(found_id)
             self.tree.focus(found_id)
@@ -195,7 +275,7 @@ class SubtitlePanel(tk.Frame):
             return
         node["start"] = cur_ms
         self.subtitles.sort(key=lambda x: x["start"])
-        self.refresh_sub_tree()
+        self.refresh_sub_tree(edited=node)
         self.on_save()
 
     def _set_end_from_current(self) -> None:
@@ -210,14 +290,14 @@ class SubtitlePanel(tk.Frame):
         if not self._validate_interval(node["start"], cur_ms):
             return
         node["end"] = cur_ms
-        self.refresh_sub_tree()
+        self.refresh_sub_tree(edited=node)
         self.on_save()
 
     def _inline_edit(self, event: tk.Event) -> None:
         """Permite editar tempos (com milissegundos) ou texto da legenda diretamente na árvore."""
         row_id = self.tree.identify_row(event.y)
         col = self.tree.identify_column(event.x)
-        if not row_id:
+        if not row_id or col not in ("#1", "#2", "#3"):
             return
         bbox = self.tree.bbox(row_id, col)
         if not bbox:
@@ -252,7 +332,7 @@ class SubtitlePanel(tk.Frame):
                     messagebox.showerror("Tempo Inválido", "Formato inválido. Use hh:mm:ss,mss ou mm:ss,mss.")
                     return
 
-            self.refresh_sub_tree()
+            self.refresh_sub_tree(edited=node)
             self.on_save()
 
         entry.bind("<Return>", commit)
@@ -0,0 +1,300 @@
+"""Miniaturas dos capítulos geradas em segundo plano por um segundo player libVLC sem janela.
+
+O player interativo nunca é usado para isso: uma thread auxiliar mantém uma instância própria do VLC que decodifica
+quadros reduzidos direto para um buffer em memória (``video_set_callbacks``), sem saída de vídeo nem áudio. Cada
+quadro é convertido em PNG na própria thread e guardado no ``.previews``, indexado pelo instante em milissegundos. O laço
+de eventos do Tk só consulta periodicamente a fila de resultados e cria as ``PhotoImage``, que o Tk decodifica
+nativamente, sem o Pillow.
+"""
+
+from __future__ import annotations
+
+import base64
+import ctypes
+import queue
+import struct
+import threading
+import time
+import tkinter as tk
+import zlib
+from collections.abc import Callable
+from typing import Any
+
+import vlc
+
+from logic import PreviewCache
+
+THUMBNAIL_WIDTH = 64
+THUMBNAIL_HEIGHT = 36
+THUMBNAIL_QUEUE_SIZE = 64
+POLL_INTERVAL_MS = 200
+GRAB_TIMEOUT_S = 3.0
+FRAME_TOLERANCE_MS = 500
+GRABBER_OPTIONS = ("--no-audio", "--no-spu", "--no-osd", "--no-video-title-show", "--avcodec-threads=1", "--quiet")
+
+
+def fit_size(width: int, height: int, max_width: int, max_height: int) -> tuple[int, int]:
+    """Reduz ``width`` x ``height`` para caber no retângulo, mantendo a proporção e dimensões pares."""
+
+    if width <= 0 or height <= 0:
+        return max_width, max_height
+    scale = min(max_width / width, max_height / height)
+    return max(2, round(width * scale / 2) * 2), max(2, round(height * scale / 2) * 2)
+
+
+def bgrx_to_rgb(frame: bytes) -> bytes:
+    """Converte pixels ``RV32`` (B, G, R, X) da libVLC em RGB compacto."""
+
+    rgb = bytearray(len(frame) // 4 * 3)
+    rgb[0::3] = frame[2::4]
+    rgb[1::3] = frame[1::4]
+    rgb[2::3] = frame[0::4]
+    return bytes(rgb)
+
+
+def encode_png(width: int, height: int, rgb: bytes) -> bytes:
+    """Codifica pixels RGB em um PNG sem filtros, suficiente para imagens pequenas."""
+
+    def chunk(kind: bytes, payload: bytes) -> bytes:
+        return struct.pack(">I", len(payload)) + kind + payload + struct.pack(">I", zlib.crc32(kind + payload))
+
+    stride = width * 3
+    raw = b"".join(b"\0" + rgb[row * stride : (row + 1) * stride] for row in range(height))
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(raw)) + chunk(b"IEND", b"")
+
+
+class FrameGrabber:
+    """Player libVLC sem janela que decodifica quadros reduzidos para um buffer próprio.
+
+    Deve ser criado, usado e liberado sempre na mesma thread auxiliar.
+    """
+
+    def __init__(
+        self,
+        video_path: str,
+        max_width: int = THUMBNAIL_WIDTH,
+        max_height: int = THUMBNAIL_HEIGHT,
+        create_instance: Any = vlc.Instance,
+    ) -> None:
+        """Analisa a mídia para obter a duração e a proporção do vídeo e prepara o buffer de quadros."""
+
+        self.instance = create_instance(*GRABBER_OPTIONS)
+        self.media = self.instance.media_new(video_path)
+        self.media.parse()
+        self.duration_ms = max(0, self.media.get_duration())
+        self.width, self.height = fit_size(*self._source_size(), max_width, max_height)
+        pitch = self.width * 4
+        # A libVLC exige planos alinhados em 32 bytes; o buffer tem folga para deslocar o início.
+        self.buffer = ctypes.create_string_buffer(pitch * self.height + 32)
+        self.address = ctypes.addressof(self.buffer) + (-ctypes.addressof(self.buffer) % 32)
+        self.frame = b""
+        self.frame_ready = threading.Event()
+        self.started = False
+
+        self.player = self.instance.media_player_new()
+        self.player.set_media(self.media)
+        # As funções precisam continuar referenciadas enquanto o player existir.
+        self._callbacks = (
+            vlc.CallbackDecorators.VideoLockCb(self._lock),
+            vlc.CallbackDecorators.VideoUnlockCb(self._unlock),
+            vlc.CallbackDecorators.VideoDisplayCb(self._display),
+        )
+        self.player.video_set_callbacks(*self._callbacks, None)
+        self.player.video_set_format("RV32", self.width, self.height, pitch)
+
+    def _source_size(self) -> tuple[int, int]:
+        """Retorna as dimensões da primeira trilha de vídeo, ou zero quando a análise não as informa."""
+
+        for track in self.media.tracks_get() or ():
+            if track.type == vlc.TrackType.video and track.video:
+                return track.video.contents.width, track.video.contents.height
+        return 0, 0
+
+    def _lock(self, _opaque: Any, planes: Any) -> None:
+        """Entrega à libVLC o endereço alinhado do buffer."""
+
+        planes[0] = self.address
+
+    def _unlock(self, _opaque: Any, _picture: Any, _planes: Any) -> None:
+        """Nada a fazer: o quadro só é copiado quando estiver pronto para exibição."""
+
+    def _display(self, _opaque: Any, _picture: Any) -> None:
+        """Copia o quadro pronto e avisa a thread que aguarda."""
+
+        self.frame = ctypes.string_at(self.address, self.width * self.height * 4)
+        self.frame_ready.set()
+
+    def grab(self, time_ms: int, timeout: float = GRAB_TIMEOUT_S) -> bytes | None:
+        """Decodifica o quadro em ``time_ms`` e retorna seus pixels RGB, ou ``None`` se ele não chegar a tempo."""
+
+        deadline = time.monotonic() + timeout
+        self.frame_ready.clear()
+        if not self.started:
+            self.started = True
+            self.player.play()
+            if not self.frame_ready.wait(timeout):
+                return None
+        self.player.set_pause(0)
+        self.frame_ready.clear()
+        self.player.set_time(time_ms)
+        try:
+            while self.frame_ready.wait(max(0.0, deadline - time.monotonic())):
+                self.frame_ready.clear()
+                if abs(self.player.get_time() - time_ms) <= FRAME_TOLERANCE_MS:
+                    return bgrx_to_rgb(self.frame)
+            return None
+        finally:
+            self.player.set_pause(1)
+
+    def release(self) -> None:
+        """Interrompe a decodificação e libera o player, a mídia e a instância."""
+
+        self.player.stop()
+        self.player.release()
+        self.media.release()
+        self.instance.release()
+
+
+class ThumbnailWorker:
+    """Thread que atende pedidos de miniatura com uma fila limitada e guarda os resultados no ``.previews``.
+
+    Os pedidos que não cabem na fila são descartados; quem pediu pode repeti-los depois. Os resultados, PNG ou
+    ``None`` quando o quadro não pôde ser obtido, ficam em ``results`` até serem retirados pelo laço do Tk.
+    """
+
+    def __init__(
+        self,
+        video_path: str,
+        create_grabber: Callable[[str], FrameGrabber] = FrameGrabber,
+        queue_size: int = THUMBNAIL_QUEUE_SIZE,
+    ) -> None:
+        """Inicia a thread auxiliar; o player só é criado no primeiro quadro ausente do cache."""
+
+        self.video_path = video_path
+        self.create_grabber = create_grabber
+        self.previews = PreviewCache(video_path)
+        self.requests: queue.Queue[int | None] = queue.Queue(maxsize=queue_size)
+        self.results: queue.SimpleQueue[tuple[int, bytes | None]] = queue.SimpleQueue()
+        self.thread = threading.Thread(target=self._run, name="chapter-thumbnails", daemon=True)
+        self.thread.start()
+
+    def request(self, time_ms: int) -> bool:
+        """Pede a miniatura de ``time_ms``; retorna ``False`` se a fila estiver cheia."""
+
+        try:
+            self.requests.put_nowait(time_ms)
+        except queue.Full:
+            return False
+        return True
+
+    def drain(self) -> list[tuple[int, bytes | None]]:
+        """Retira os resultados prontos sem bloquear."""
+
+        ready = []
+        while True:
+            try:
+                ready.append(self.results.get_nowait())
+            except queue.Empty:
+                return ready
+
+    def close(self) -> None:
+        """Descarta os pedidos pendentes e pede o encerramento da thread, sem aguardá-la."""
+
+        while True:
+            try:
+                self.requests.get_nowait()
+            except queue.Empty:
+                break
+        self.requests.put_nowait(None)
+
+    def _run(self) -> None:
+        """Atende os pedidos em ordem, consultando primeiro o cache do ``.previews``."""
+
+        cache = self.previews.load_thumbnails()
+        grabber: FrameGrabber | None = None
+        try:
+            while (time_ms := self.requests.get()) is not None:
+                if time_ms not in cache:
+                    if grabber is None:
+                        grabber = self.create_grabber(self.video_path)
+                    rgb = grabber.grab(time_ms)
+                    if rgb is None:
+                        self.results.put((time_ms, None))
+                        continue
+                    cache[time_ms] = encode_png(grabber.width, grabber.height, rgb)
+                    try:
+                        self.previews.store_thumbnail(time_ms, grabber.width, grabber.height, cache[time_ms])
+                    except ValueError:
+                        pass
+                self.results.put((time_ms, cache[time_ms]))
+        except (OSError, ValueError, AttributeError, NameError):
+            # Sem libVLC utilizável ou mídia legível: os capítulos seguem sem miniaturas.
+            while True:
+                self.results.put((time_ms, None))
+                if (time_ms := self.requests.get()) is None:
+                    break
+        finally:
+            if grabber is not None:
+                grabber.release()
+
+
+class ChapterThumbnails:
+    """Lado Tk das miniaturas: pede os quadros ao trabalhador e cria as imagens exibidas na árvore."""
+
+    def __init__(
+        self,
+        widget: tk.Misc,
+        video_path: str,
+        on_ready: Callable[[], None],
+        create_worker: Callable[[str], ThumbnailWorker] = ThumbnailWorker,
+    ) -> None:
+        """Inicia o trabalhador para ``video_path``; ``on_ready`` é chamado quando novas imagens chegam."""
+
+        self.widget = widget
+        self.on_ready = on_ready
+        self.worker = create_worker(video_path)
+        self.images: dict[int, tk.PhotoImage] = {}
+        self.waiting: set[int] = set()
+        self.failed: set[int] = set()
+        self.after_id: str | None = None
+
+    def image(self, seconds: int) -> tk.PhotoImage | None:
+        """Retorna a miniatura do instante, pedindo-a em segundo plano se ainda não existir."""
+
+        time_ms = seconds * 1000
+        image = self.images.get(time_ms)
+        if (
+            image is None
+            and time_ms not in self.waiting
+            and time_ms not in self.failed
+            and self.worker.request(time_ms)
+        ):
+            self.waiting.add(time_ms)
+            if self.after_id is None:
+                self.after_id = self.widget.after(POLL_INTERVAL_MS, self._poll)
+        return image
+
+    def _poll(self) -> None:
+        """Converte os resultados prontos em imagens e continua consultando enquanto houver pedidos."""
+
+        self.after_id = None
+        ready = self.worker.drain()
+        for time_ms, png in ready:
+            self.waiting.discard(time_ms)
+            if png is None:
+                self.failed.add(time_ms)
+            else:
+                self.images[time_ms] = tk.PhotoImage(master=self.widget, data=base64.b64encode(png))
+        if self.waiting:
+            self.after_id = self.widget.after(POLL_INTERVAL_MS, self._poll)
+        if any(png is not None for _, png in ready):
+            self.on_ready()
+
+    def close(self) -> None:
+        """Interrompe a consulta e encerra o trabalhador."""
+
+        if self.after_id is not None:
+            self.widget.after_cancel(self.after_id)
+            self.after_id = None
+        self.worker.close()
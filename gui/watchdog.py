@@ -0,0 +1,158 @@
+"""Vigia do laço de eventos do Tk que atribui travamentos à linha de código responsável.
+
+Um pulso ``after()`` de alta frequência mede o atraso entre o horário agendado e a execução. Enquanto esse atraso
+passa do limite, uma thread auxiliar amostra a pilha da thread principal com ``sys._current_frames``. Quando o laço
+volta a responder, o travamento é registrado no ``logging`` com o ponto de chamada mais frequente entre as amostras,
+dando preferência aos arquivos do próprio projeto.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+import time
+import tkinter as tk
+import traceback
+from collections import Counter, deque
+from dataclasses import dataclass
+from pathlib import Path
+
+from profiling import Profiler, profiler
+
+LOGGER = logging.getLogger(__name__)
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+MAX_STALLS = 50
+
+
+@dataclass(frozen=True)
+class Stall:
+    """Travamento observado: duração, ponto de chamada atribuído e pilha mais frequente."""
+
+    duration: float
+    call_site: str
+    hits: int
+    samples: int
+    stack: str
+
+
+def _call_site(stack: traceback.StackSummary) -> str:
+    """Retorna o quadro mais interno que pertence ao projeto, ou o mais interno da pilha."""
+
+    own_file = str(Path(__file__).resolve())
+    for frame in reversed(stack):
+        filename = str(Path(frame.filename).resolve())
+        if filename != own_file and filename.startswith(str(PROJECT_DIR)) and ".venv" not in filename:
+            return f"{Path(filename).relative_to(PROJECT_DIR).as_posix()}:{frame.lineno} em {frame.name}"
+    if not stack:
+        return "desconhecido"
+    frame = stack[-1]
+    return f"{frame.filename}:{frame.lineno} em {frame.name}"
+
+
+class EventLoopWatchdog:
+    """Mede o atraso do laço de eventos e amostra a pilha da thread principal durante travamentos."""
+
+    def __init__(
+        self,
+        widget: tk.Misc,
+        interval_ms: int = 20,
+        threshold_ms: int = 200,
+        sample_interval_ms: int = 10,
+        source: Profiler = profiler,
+        logger: logging.Logger = LOGGER,
+    ) -> None:
+        """Prepara o vigia; a medição começa em :meth:`start`."""
+
+        self.widget = widget
+        self.interval_ms = interval_ms
+        self.threshold = threshold_ms / 1000
+        self.sample_interval = sample_interval_ms / 1000
+        self.profiler = source
+        self.logger = logger
+        self.stalls: deque[Stall] = deque(maxlen=MAX_STALLS)
+        self.expected_at = 0.0
+        self.after_id: str | None = None
+        self.main_thread_id = threading.get_ident()
+        self._samples: list[traceback.StackSummary] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Agenda o primeiro pulso na thread do Tk e inicia a thread de amostragem."""
+
+        if self._sampler is not None:
+            return
+        self.main_thread_id = threading.get_ident()
+        self._stop.clear()
+        self._schedule()
+        self._sampler = threading.Thread(target=self._sample_loop, name="event-loop-watchdog", daemon=True)
+        self._sampler.start()
+
+    def stop(self) -> None:
+        """Cancela o pulso e encerra a thread de amostragem."""
+
+        self._stop.set()
+        if self.after_id is not None:
+            try:
+                self.widget.after_cancel(self.after_id)
+            except tk.TclError:
+                pass
+            self.after_id = None
+        if self._sampler is not None:
+            self._sampler.join(timeout=1)
+            self._sampler = None
+
+    def _schedule(self) -> None:
+        """Agenda o próximo pulso e registra o instante em que ele deveria rodar."""
+
+        self.expected_at = time.perf_counter() + self.interval_ms / 1000
+        self.after_id = self.widget.after(self.interval_ms, self._beat)
+
+    def _beat(self) -> None:
+        """Mede o atraso do pulso atual e relata o travamento, se houver."""
+
+        drift = time.perf_counter() - self.expected_at
+        with self._lock:
+            samples, self._samples = self._samples, []
+        self.profiler.record_lag(drift)
+        if drift >= self.threshold:
+            self._report(drift, samples)
+        self._schedule()
+
+    def _sample_loop(self) -> None:
+        """Amostra a pilha da thread principal enquanto o pulso estiver atrasado além do limite."""
+
+        while not self._stop.wait(self.sample_interval):
+            if time.perf_counter() - self.expected_at < self.threshold:
+                continue
+            frame = sys._current_frames().get(self.main_thread_id)
+            if frame is None:
+                continue
+            stack = traceback.extract_stack(frame)
+            with self._lock:
+                self._samples.append(stack)
+
+    def _report(self, drift: float, samples: list[traceback.StackSummary]) -> None:
+        """Atribui o travamento ao ponto de chamada mais amostrado e o registra no log e no perfilador."""
+
+        if samples:
+            sites = Counter(_call_site(stack) for stack in samples)
+            call_site, hits = sites.most_common(1)[0]
+            stack = next(stack for stack in samples if _call_site(stack) == call_site)
+            formatted = "".join(stack.format())
+        else:
+            call_site, hits, formatted = "sem amostras", 0, ""
+        stall = Stall(drift, call_site, hits, len(samples), formatted)
+        self.stalls.append(stall)
+        if self.profiler.enabled:
+            self.profiler.record("tk.stall", time.perf_counter() - drift, drift)
+        self.logger.warning(
+            "Laço de eventos travado por %.0f ms em %s (%d de %d amostras)\n%s",
+            drift * 1000,
+            call_site,
+            hits,
+            len(samples),
+            formatted,
+        )
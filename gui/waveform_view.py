@@ -0,0 +1,217 @@
+"""Faixa com a forma de onda do áudio e as legendas, exibida abaixo do player.
+
+O envelope é preparado uma única vez em segundo plano pelo módulo ``waveform``; o NumPy só é importado nessa thread.
+Cada redesenho pede ao envelope apenas o nível e o trecho visíveis, reduzidos a uma coluna por pixel, e desenha a
+onda como dois polígonos, de modo que rolar e ampliar continuam leves mesmo em filmes de várias horas.
+"""
+
+from __future__ import annotations
+
+import threading
+import tkinter as tk
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from waveform import Envelope
+
+WAVEFORM_HEIGHT = 72
+WAVEFORM_START_DELAY_MS = 3_000
+POLL_INTERVAL_MS = 500
+DEFAULT_SPAN_MS = 20_000
+MIN_SPAN_MS = 1_000
+ZOOM_FACTOR = 1.5
+PAN_FRACTION = 0.2
+PEAK_COLOR = "#3d6f9e"
+RMS_COLOR = "#7fb2e5"
+CUE_COLOR = "#f0c040"
+CURSOR_COLOR = "#ff5050"
+MARKER_COLOR = "#8fd18f"
+
+
+def _load_envelope(video_path: str, stop: threading.Event) -> Envelope | None:
+    """Importa o NumPy e prepara o envelope na thread auxiliar."""
+
+    from waveform import load_envelope
+
+    return load_envelope(video_path, stop)
+
+
+def wave_polygon(values: list[float], height: int) -> list[float]:
+    """Converte amplitudes de 0 a 1, uma por pixel, nos vértices de um polígono simétrico ao redor do centro."""
+
+    middle = height / 2
+    top = [coordinate for x, value in enumerate(values) for coordinate in (x, middle - value * middle)]
+    bottom = [
+        coordinate for x, value in reversed(list(enumerate(values))) for coordinate in (x, middle + value * middle)
+    ]
+    return top + bottom
+
+
+class WaveformView(tk.Canvas):
+    """Forma de onda com as legendas e marcadores sobrepostos; a roda rola, Ctrl+roda amplia e o clique salta."""
+
+    def __init__(
+        self,
+        master: tk.Widget,
+        video_path: str,
+        subtitles: list[dict],
+        on_seek_ms: Callable[[int], None],
+        load: Callable[[str, threading.Event], Envelope | None] = _load_envelope,
+    ) -> None:
+        """Cria a faixa vazia e agenda a preparação do envelope."""
+
+        super().__init__(master, height=WAVEFORM_HEIGHT, bg="#1b1b1b", highlightthickness=0)
+        self.video_path = video_path
+        self.subtitles = subtitles
+        self.on_seek_ms = on_seek_ms
+        self.load = load
+        self.envelope: Envelope | None = None
+        self.start_ms = 0
+        self.span_ms = DEFAULT_SPAN_MS
+        self.position_ms = 0
+        self.markers: list[int] = []
+        self.stop = threading.Event()
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="waveform")
+        self.future: Future[Envelope | None] | None = None
+        self.after_id: str | None = self.after(WAVEFORM_START_DELAY_MS, self._start)
+
+        self.bind("<Configure>", lambda _: self.redraw())
+        self.bind("<ButtonPress-1>", self._on_click)
+        self.bind("<MouseWheel>", self._on_wheel)
+        self.bind("<Button-4>", self._on_wheel)
+        self.bind("<Button-5>", self._on_wheel)
+        self.bind("<Control-MouseWheel>", self._on_zoom)
+        self.bind("<Control-Button-4>", self._on_zoom)
+        self.bind("<Control-Button-5>", self._on_zoom)
+
+    def _start(self) -> None:
+        """Inicia a análise em segundo plano."""
+
+        self.future = self.executor.submit(self.load, self.video_path, self.stop)
+        self.after_id = self.after(POLL_INTERVAL_MS, self._poll)
+
+    def _poll(self) -> None:
+        """Adota o envelope quando a análise termina; falhas deixam a faixa apenas com as legendas."""
+
+        if self.future is None or not self.future.done():
+            self.after_id = self.after(POLL_INTERVAL_MS, self._poll)
+            return
+        self.after_id = None
+        future, self.future = self.future, None
+        try:
+            self.envelope = future.result()
+        except (OSError, ValueError, RuntimeError):
+            self.envelope = None
+        self.redraw()
+
+    def time_at(self, x: int) -> int:
+        """Converte a coordenada horizontal no tempo correspondente, em milissegundos."""
+
+        return self.start_ms + round(x * self.span_ms / max(1, self.winfo_width()))
+
+    def _x(self, milliseconds: int, width: int) -> float:
+        """Converte um tempo na coordenada horizontal da faixa."""
+
+        return (milliseconds - self.start_ms) * width / self.span_ms
+
+    def redraw(self) -> None:
+        """Desenha o trecho visível: onda, caixas das legendas, marcadores e posição atual."""
+
+        self.delete("all")
+        width, height = self.winfo_width(), self.winfo_height()
+        if width <= 1:
+            return
+        end_ms = self.start_ms + self.span_ms
+        if self.envelope is not None:
+            columns = self.envelope.columns(self.start_ms, end_ms, width)
+            for channel, color in ((1, PEAK_COLOR), (0, RMS_COLOR)):
+                self.create_polygon(wave_polygon(columns[:, channel].tolist(), height), fill=color, outline="")
+        for subtitle in self.subtitles:
+            if subtitle["end"] < self.start_ms or subtitle["start"] > end_ms:
+                continue
+            x0, x1 = self._x(subtitle["start"], width), self._x(subtitle["end"], width)
+            self.create_rectangle(x0, 2, x1, height - 2, outline=CUE_COLOR, width=1)
+            text = subtitle.get("text", "").replace("\n", " ")
+            if text and x1 - x0 > 24:
+                self.create_text(
+                    x0 + 3, 4, text=text, anchor="nw", fill=CUE_COLOR, width=x1 - x0 - 6, font=("Segoe UI", 8)
+                )
+        for marker in self.markers:
+            if self.start_ms <= marker <= end_ms:
+                x = self._x(marker, width)
+                self.create_line(x, 0, x, height, fill=MARKER_COLOR, dash=(3, 2))
+        cursor = self._x(self.position_ms, width)
+        self.create_line(cursor, 0, cursor, height, fill=CURSOR_COLOR, tags=("cursor",))
+
+    def set_markers(self, markers: list[int]) -> None:
+        """Substitui os marcadores verticais, em milissegundos, como as mudanças de cena sugeridas."""
+
+        self.markers = list(markers)
+        self.redraw()
+
+    def set_position(self, milliseconds: int) -> None:
+        """Acompanha a reprodução, virando a página quando a posição muda para fora do trecho visível.
+
+        Com o vídeo parado, a posição não muda e o trecho rolado pelo usuário é mantido.
+        """
+
+        moved, self.position_ms = milliseconds != self.position_ms, milliseconds
+        if moved and not self.start_ms <= milliseconds < self.start_ms + self.span_ms:
+            self.start_ms = max(0, milliseconds - round(self.span_ms * PAN_FRACTION))
+            self.redraw()
+            return
+        width = self.winfo_width()
+        cursor = self._x(milliseconds, width)
+        self.coords("cursor", cursor, 0, cursor, self.winfo_height())
+
+    def pan(self, fraction: float) -> None:
+        """Desloca o trecho visível por uma fração de sua largura."""
+
+        self.start_ms = max(0, self.start_ms + round(self.span_ms * fraction))
+        self.redraw()
+
+    def zoom(self, factor: float, anchor_ms: int) -> None:
+        """Multiplica a largura do trecho por ``factor``, mantendo ``anchor_ms`` no mesmo ponto da tela."""
+
+        longest = max(DEFAULT_SPAN_MS, self.envelope.duration_ms if self.envelope is not None else 0)
+        span = min(longest, max(MIN_SPAN_MS, round(self.span_ms * factor)))
+        ratio = (anchor_ms - self.start_ms) / self.span_ms
+        self.start_ms = max(0, round(anchor_ms - ratio * span))
+        self.span_ms = span
+        self.redraw()
+
+    @staticmethod
+    def _wheel_direction(event: tk.Event) -> int:
+        """Retorna 1 para a roda para cima e -1 para baixo, no Windows e no X11."""
+
+        return 1 if event.delta > 0 or getattr(event, "num", 0) == 4 else -1
+
+    def _on_wheel(self, event: tk.Event) -> str:
+        """Rola o trecho visível para trás ou para frente."""
+
+        self.pan(-PAN_FRACTION if self._wheel_direction(event) > 0 else PAN_FRACTION)
+        return "break"
+
+    def _on_zoom(self, event: tk.Event) -> str:
+        """Amplia ou reduz ao redor do ponteiro."""
+
+        factor = 1 / ZOOM_FACTOR if self._wheel_direction(event) > 0 else ZOOM_FACTOR
+        self.zoom(factor, self.time_at(event.x))
+        return "break"
+
+    def _on_click(self, event: tk.Event) -> None:
+        """Salta para o tempo clicado."""
+
+        self.on_seek_ms(self.time_at(event.x))
+
+    def destroy(self) -> None:
+        """Interrompe a análise em andamento antes de destruir a faixa."""
+
+        self.stop.set()
+        if self.after_id is not None:
+            self.after_cancel(self.after_id)
+            self.after_id = None
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
@@ -1,13 +1,34 @@
 from __future__ import annotations
 
+import base64
+import hashlib
+import json
 import os
 import re
 import shutil
 import sqlite3
 import tempfile
 import uuid
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from profiling import profiled
+from timecode import (  # noqa: F401
+    fmt_sec,
+    fmt_srt_time,
+    parse_flexible_time,
+    parse_srt_time,
+    parse_time,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+VIDEO_EXTENSIONS = frozenset({".mp4", ".m4v", ".mov", ".mkv", ".avi", ".webm"})
+"""Extensões reconhecidas como vídeo ao percorrer pastas."""
 
 
 class DataLoadError(RuntimeError):
@@ -48,55 +69,6 @@ def _atomic_write_text(path: Path, content: str) -> None:
             temporary_path.unlink()
 
 
-def fmt_sec(sec: int) -> str:
-    """Converte segundos para formato ``hh:mm:ss`` ou ``mm:ss``."""
-
-    hours, sec = divmod(max(0, sec), 3600)
-    minutes, seconds = divmod(sec, 60)
-    return f"{hours:02d}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes:02d}:{seconds:02d}"
-
-
-def parse_time(txt: str) -> int:
-    """Converte strings ``hh:mm:ss`` ou ``mm:ss`` em segundos válidos."""
-
-    parts = [int(part) for part in txt.strip().split(":")]
-    if len(parts) == 2:
-        minutes, seconds = parts
-        hours = 0
-    elif len(parts) == 3:
-        hours, minutes, seconds = parts
-    else:
-        raise ValueError("O tempo deve estar no formato hh:mm:ss ou mm:ss")
-    if hours < 0 or not 0 <= minutes <= 59 or not 0 <= seconds <= 59:
-        raise ValueError("Os componentes do tempo estão fora do intervalo permitido")
-    return hours * 3600 + minutes * 60 + seconds
-
-
-def parse_flexible_time(txt: str) -> int:
-    """Converte ``hh:mm:ss``, ``mm:ss`` ou dígitos ``hhmmss`` em segundos."""
-
-    cleaned = txt.strip()
-    if ":" in cleaned:
-        return parse_time(cleaned)
-    if not cleaned.isdigit():
-        raise ValueError("O tempo deve conter apenas dígitos")
-
-    digits = cleaned[-6:]
-    if len(digits) <= 2:
-        hours, minutes, seconds = 0, 0, int(digits)
-    elif len(digits) <= 4:
-        hours = 0
-        minutes = int(digits[:-2])
-        seconds = int(digits[-2:])
-    else:
-        hours = int(digits[:-4])
-        minutes = int(digits[-4:-2])
-        seconds = int(digits[-2:])
-    if minutes > 59 or seconds > 59:
-        raise ValueError("Os minutos e segundos devem estar entre 00 e 59")
-    return hours * 3600 + minutes * 60 + seconds
-
-
 def _new_id() -> str:
     """Cria um identificador estável para relacionamentos no arquivo ``.chp``."""
 
@@ -126,79 +98,143 @@ def _normalize_image_ids(item: dict[str, Any], location: str) -> list[str]:
     return image_ids
 
 
-def _validate_chapter(chapter: object, location: str, parent: dict[str, Any] | None = None) -> dict[str, Any]:
-    """Valida a hierarquia e amplia o fim dos pais para conter seus descendentes."""
-
-    if not isinstance(chapter, dict):
-        raise TypeError(f"{location} não é um objeto")
-    title = chapter.get("title")
-    start = chapter.get("start")
-    end = chapter.get("end")
-    subs = chapter.get("subs", [])
-    if not isinstance(title, str) or not title.strip():
-        raise ValueError(f"{location} não possui título válido")
-    if isinstance(start, bool) or not isinstance(start, int) or start < 0:
-        raise ValueError(f"{location} possui início inválido")
-    if isinstance(end, bool) or not isinstance(end, int) or end < 0:
-        raise ValueError(f"{location} possui fim inválido")
-    end = max(start, end)
-    if parent is not None and start < parent["start"]:
-        raise ValueError(f"{location} começa antes do capítulo pai")
-    if not isinstance(subs, list):
-        raise TypeError(f"{location} possui subcapítulos inválidos")
-
-    record_id = _normalize_record_id(chapter, location)
-    image_ids = _normalize_image_ids(chapter, location)
-    normalized = {"id": record_id, "title": title.strip(), "start": start, "end": end, "subs": [], "images": image_ids}
-    normalized["subs"] = [
-        _validate_chapter(sub, f"{location}, subcapítulo {index}", normalized)
-        for index, sub in enumerate(subs, start=1)
+def _append_links(
+    link_rows: list[tuple[str, str, str, int]], record_type: str, record_id: str, image_ids: list[str]
+) -> None:
+    """Acrescenta as linhas de ``image_links`` de um registro, preservando a ordem das imagens."""
+
+    link_rows.extend((image_id, record_type, record_id, position) for position, image_id in enumerate(image_ids))
+
+
+class _Location:
+    """Descreve a posição de um nó na árvore e só monta o texto quando uma mensagem precisa dele."""
+
+    __slots__ = ("label", "parent")
+
+    def __init__(self, parent: _Location | None, label: str) -> None:
+        """Encadeia o trecho ``label`` à localização do nó pai."""
+
+        self.parent = parent
+        self.label = label
+
+    def __str__(self) -> str:
+        """Concatena os trechos desde a raiz, como nas mensagens de validação."""
+
+        labels: list[str] = []
+        node: _Location | None = self
+        while node is not None:
+            labels.append(node.label)
+            node = node.parent
+        return "".join(reversed(labels))
+
+
+def _validate_chapters(
+    chapters: list[object], chapter_rows: list[list[Any]], link_rows: list[tuple[str, str, str, int]]
+) -> None:
+    """Valida a hierarquia sem recursão e emite as linhas de ``chapters`` em pré-ordem.
+
+    O fim de cada linha (índice 5) é ampliado ao final para conter o maior fim de seus descendentes.
+    """
+
+    parent_indexes: list[int] = []
+    stack: list[tuple[object, _Location, int, int]] = [
+        (chapters[position], _Location(None, f"capítulo {position + 1}"), -1, position)
+        for position in range(len(chapters) - 1, -1, -1)
     ]
-    if normalized["subs"]:
-        normalized["end"] = max(normalized["end"], *(sub["end"] for sub in normalized["subs"]))
-    return normalized
-
-
-def _validate_metadata(items: object, location: str = "metadados") -> list[dict[str, Any]]:
-    """Valida nós de metadados, permitindo valores apenas nas folhas."""
-
-    if not isinstance(items, list):
-        raise TypeError(f"{location} deve ser uma lista")
-
-    normalized: list[dict[str, Any]] = []
-    keys: set[str] = set()
-    for index, item in enumerate(items, start=1):
-        item_location = f"{location}, item {index}"
-        if not isinstance(item, dict):
-            raise TypeError(f"{item_location} não é um objeto")
-        key = item.get("key")
-        value = item.get("value", "")
-        children = item.get("children", [])
-        if not isinstance(key, str) or not key.strip():
-            raise ValueError(f"{item_location} possui chave inválida")
-        key = key.strip()
-        if key in keys:
-            raise ValueError(f"{location} possui chaves repetidas: '{key}'")
-        if not isinstance(value, str):
-            raise TypeError(f"{item_location} possui valor inválido")
-        record_id = _normalize_record_id(item, item_location)
-        image_ids = _normalize_image_ids(item, item_location)
-        normalized_children = _validate_metadata(children, f"{item_location} ({key})")
-        if normalized_children and value:
-            raise ValueError(f"{item_location} possui filhos e não pode ter valor")
-        keys.add(key)
-        normalized.append(
-            {"id": record_id, "key": key, "value": value, "children": normalized_children, "images": image_ids}
+    while stack:
+        chapter, location, parent_index, position = stack.pop()
+        if not isinstance(chapter, dict):
+            raise TypeError(f"{location} não é um objeto")
+        title = chapter.get("title")
+        start = chapter.get("start")
+        end = chapter.get("end")
+        subs = chapter.get("subs", [])
+        if not isinstance(title, str) or not title.strip():
+            raise ValueError(f"{location} não possui título válido")
+        if isinstance(start, bool) or not isinstance(start, int) or start < 0:
+            raise ValueError(f"{location} possui início inválido")
+        if isinstance(end, bool) or not isinstance(end, int) or end < 0:
+            raise ValueError(f"{location} possui fim inválido")
+        parent = chapter_rows[parent_index] if parent_index >= 0 else None
+        if parent is not None and start < parent[4]:
+            raise ValueError(f"{location} começa antes do capítulo pai")
+        if not isinstance(subs, list):
+            raise TypeError(f"{location} possui subcapítulos inválidos")
+
+        record_id = _normalize_record_id(chapter, location)
+        image_ids = _normalize_image_ids(chapter, location)
+        row_index = len(chapter_rows)
+        chapter_rows.append(
+            [record_id, None if parent is None else parent[0], position, title.strip(), start, max(start, end)]
+        )
+        parent_indexes.append(parent_index)
+        _append_links(link_rows, "chapters", record_id, image_ids)
+        stack.extend(
+            (subs[sub_position], _Location(location, f", subcapítulo {sub_position + 1}"), row_index, sub_position)
+            for sub_position in range(len(subs) - 1, -1, -1)
         )
-    return normalized
-
 
-def _validate_casting(casting: object) -> list[dict[str, Any]]:
-    """Valida os integrantes do elenco e suas imagens associadas."""
+    for row_index in range(len(chapter_rows) - 1, -1, -1):
+        parent_index = parent_indexes[row_index]
+        if parent_index >= 0 and chapter_rows[row_index][5] > chapter_rows[parent_index][5]:
+            chapter_rows[parent_index][5] = chapter_rows[row_index][5]
+
+
+def _validate_metadata(
+    items: object,
+    metadata_rows: list[tuple[str, str | None, int, str, str]],
+    link_rows: list[tuple[str, str, str, int]],
+) -> None:
+    """Valida nós de metadados sem recursão, permitindo valores apenas nas folhas, e emite linhas em pré-ordem."""
+
+    # Entradas "list" abrem uma lista de irmãos, "item" valida um nó e "close" encerra um nó depois de
+    # seus descendentes, conferindo o valor e registrando a chave para os irmãos seguintes.
+    stack: list[tuple[Any, ...]] = [("list", items, _Location(None, "metadados"), None)]
+    while stack:
+        entry = stack.pop()
+        if entry[0] == "list":
+            _, children, location, parent_id = entry
+            if not isinstance(children, list):
+                raise TypeError(f"{location} deve ser uma lista")
+            keys: set[str] = set()
+            stack.extend(
+                ("item", children[position], location, parent_id, position, keys)
+                for position in range(len(children) - 1, -1, -1)
+            )
+        elif entry[0] == "close":
+            _, item_location, has_value, has_children, keys, key = entry
+            if has_children and has_value:
+                raise ValueError(f"{item_location} possui filhos e não pode ter valor")
+            keys.add(key)
+        else:
+            _, item, location, parent_id, position, keys = entry
+            item_location = _Location(location, f", item {position + 1}")
+            if not isinstance(item, dict):
+                raise TypeError(f"{item_location} não é um objeto")
+            key = item.get("key")
+            value = item.get("value", "")
+            children = item.get("children", [])
+            if not isinstance(key, str) or not key.strip():
+                raise ValueError(f"{item_location} possui chave inválida")
+            key = key.strip()
+            if key in keys:
+                raise ValueError(f"{location} possui chaves repetidas: '{key}'")
+            if not isinstance(value, str):
+                raise TypeError(f"{item_location} possui valor inválido")
+            record_id = _normalize_record_id(item, item_location)
+            image_ids = _normalize_image_ids(item, item_location)
+            metadata_rows.append((record_id, parent_id, position, key, value))
+            _append_links(link_rows, "metadata", record_id, image_ids)
+            stack.append(("close", item_location, bool(value), bool(children), keys, key))
+            stack.append(("list", children, _Location(item_location, f" ({key})"), record_id))
+
+
+def _validate_casting(casting: object, link_rows: list[tuple[str, str, str, int]]) -> list[tuple[str, int, str]]:
+    """Valida os integrantes do elenco e emite as linhas de elenco e de imagens associadas."""
 
     if not isinstance(casting, list):
         raise TypeError("o campo 'casting' deve ser uma lista")
-    normalized: list[dict[str, Any]] = []
+    rows: list[tuple[str, int, str]] = []
     for index, member in enumerate(casting, start=1):
         location = f"casting, item {index}"
         if isinstance(member, str):
@@ -209,22 +245,18 @@ def _validate_casting(casting: object) -> list[dict[str, Any]]:
         name = member.get("name")
         if not isinstance(name, str) or not name.strip():
             raise ValueError(f"{location} possui nome inválido")
-        normalized.append(
-            {
-                "id": _normalize_record_id(member, location),
-                "name": name.strip(),
-                "images": _normalize_image_ids(member, location),
-            }
-        )
-    return normalized
+        record_id = _normalize_record_id(member, location)
+        rows.append((record_id, index - 1, name.strip()))
+        _append_links(link_rows, "casting", record_id, _normalize_image_ids(member, location))
+    return rows
 
 
-def _validate_images(images: object) -> list[dict[str, Any]]:
-    """Valida imagens recortadas mantidas como BLOB no banco SQLite."""
+def _validate_images(images: object) -> list[tuple[str, str, str, int, int, str, bytes]]:
+    """Valida imagens recortadas mantidas como BLOB e emite as linhas da tabela ``images``."""
 
     if not isinstance(images, list):
         raise TypeError("as imagens devem ser uma lista")
-    normalized: list[dict[str, Any]] = []
+    rows: list[tuple[str, str, str, int, int, str, bytes]] = []
     for index, image in enumerate(images, start=1):
         location = f"imagem {index}"
         if not isinstance(image, dict):
@@ -245,18 +277,65 @@ def _validate_images(images: object) -> list[dict[str, Any]]:
             raise ValueError(f"{location} possui largura inválida")
         if isinstance(height, bool) or not isinstance(height, int) or height <= 0:
             raise ValueError(f"{location} possui altura inválida")
-        normalized.append(
-            {
-                "id": _normalize_record_id(image, location),
-                "title": title.strip(),
-                "description": description.strip(),
-                "data": data,
-                "mime_type": mime_type,
-                "width": width,
-                "height": height,
-            }
+        rows.append(
+            (
+                _normalize_record_id(image, location),
+                title.strip(),
+                description.strip(),
+                width,
+                height,
+                mime_type,
+                data,
+            )
         )
-    return normalized
+    return rows
+
+
+SCHEMA_MIGRATIONS: tuple[tuple[str, ...], ...] = (
+    # 1: tabelas estáveis do formato, idênticas às criadas antes do versionamento.
+    (
+        """CREATE TABLE IF NOT EXISTS chapters (
+            id TEXT PRIMARY KEY, parent_id TEXT REFERENCES chapters(id) ON DELETE CASCADE,
+            position INTEGER NOT NULL, title TEXT NOT NULL, start INTEGER NOT NULL, end INTEGER NOT NULL
+        )""",
+        """CREATE TABLE IF NOT EXISTS casting (
+            id TEXT PRIMARY KEY, position INTEGER NOT NULL, name TEXT NOT NULL
+        )""",
+        """CREATE TABLE IF NOT EXISTS metadata (
+            id TEXT PRIMARY KEY, parent_id TEXT REFERENCES metadata(id) ON DELETE CASCADE,
+            position INTEGER NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL DEFAULT '',
+            UNIQUE(parent_id, key)
+        )""",
+        """CREATE TABLE IF NOT EXISTS images (
+            id TEXT PRIMARY KEY, title TEXT NOT NULL DEFAULT '', description TEXT NOT NULL DEFAULT '',
+            width INTEGER NOT NULL, height INTEGER NOT NULL, mime_type TEXT NOT NULL, data BLOB NOT NULL
+        )""",
+        """CREATE TABLE IF NOT EXISTS image_links (
+            image_id TEXT NOT NULL REFERENCES images(id) ON DELETE CASCADE,
+            record_type TEXT NOT NULL CHECK(record_type IN ('chapters', 'casting', 'metadata')),
+            record_id TEXT NOT NULL, position INTEGER NOT NULL,
+            PRIMARY KEY(image_id, record_type, record_id),
+            UNIQUE(record_type, record_id, position)
+        )""",
+    ),
+    # 2 e 3: índices das consultas de carga e da exclusão em cascata por ``parent_id``. O índice de
+    # ``image_links(record_type, record_id, position)`` já existe pela restrição UNIQUE da versão 1.
+    ("CREATE INDEX IF NOT EXISTS chapters_parent_position ON chapters(parent_id, position)",),
+    ("CREATE INDEX IF NOT EXISTS metadata_parent_position ON metadata(parent_id, position)",),
+)
+"""Migrações ordenadas do ``.chp``; o arquivo registra em ``PRAGMA user_version`` quantas já aplicou."""
+
+PREVIEW_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS thumbnails (
+        time_ms INTEGER PRIMARY KEY, width INTEGER NOT NULL, height INTEGER NOT NULL, data BLOB NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS sprite_sheet (
+        id INTEGER PRIMARY KEY CHECK(id = 1), stamp TEXT NOT NULL, interval_ms INTEGER NOT NULL,
+        columns INTEGER NOT NULL, frame_width INTEGER NOT NULL, frame_height INTEGER NOT NULL,
+        count INTEGER NOT NULL, data BLOB NOT NULL
+    )""",
+)
+"""Tabelas do ``.previews``; por ser apenas um cache regenerável, o arquivo não tem versões nem migrações."""
 
 
 class ChapterManager:
@@ -266,6 +345,7 @@ class ChapterManager:
         """Cria um gerenciador para o arquivo de vídeo indicado."""
 
         self.chp_path = os.path.splitext(video_path)[0] + ".chp"
+        self.previews = PreviewCache(video_path)
 
     @staticmethod
     def _connect(path: Path) -> sqlite3.Connection:
@@ -277,34 +357,47 @@ class ChapterManager:
         return connection
 
     @staticmethod
-    def _create_schema(connection: sqlite3.Connection) -> None:
-        """Cria as tabelas estáveis do formato ``.chp`` quando necessário."""
-
-        connection.executescript("""
-            CREATE TABLE IF NOT EXISTS chapters (
-                id TEXT PRIMARY KEY, parent_id TEXT REFERENCES chapters(id) ON DELETE CASCADE,
-                position INTEGER NOT NULL, title TEXT NOT NULL, start INTEGER NOT NULL, end INTEGER NOT NULL
-            );
-            CREATE TABLE IF NOT EXISTS casting (
-                id TEXT PRIMARY KEY, position INTEGER NOT NULL, name TEXT NOT NULL
-            );
-            CREATE TABLE IF NOT EXISTS metadata (
-                id TEXT PRIMARY KEY, parent_id TEXT REFERENCES metadata(id) ON DELETE CASCADE,
-                position INTEGER NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL DEFAULT '',
-                UNIQUE(parent_id, key)
-            );
-            CREATE TABLE IF NOT EXISTS images (
-                id TEXT PRIMARY KEY, title TEXT NOT NULL DEFAULT '', description TEXT NOT NULL DEFAULT '',
-                width INTEGER NOT NULL, height INTEGER NOT NULL, mime_type TEXT NOT NULL, data BLOB NOT NULL
-            );
-            CREATE TABLE IF NOT EXISTS image_links (
-                image_id TEXT NOT NULL REFERENCES images(id) ON DELETE CASCADE,
-                record_type TEXT NOT NULL CHECK(record_type IN ('chapters', 'casting', 'metadata')),
-                record_id TEXT NOT NULL, position INTEGER NOT NULL,
-                PRIMARY KEY(image_id, record_type, record_id),
-                UNIQUE(record_type, record_id, position)
-            );
-            """)
+    def _connect_read_only(path: Path) -> sqlite3.Connection:
+        """Abre o ``.chp`` sem alterá-lo; um arquivo de versão anterior é copiado para a memória, onde é migrado."""
+
+        connection = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if version < len(SCHEMA_MIGRATIONS):
+                memory = sqlite3.connect(":memory:")
+                connection.backup(memory)
+                connection.close()
+                connection = memory
+        except sqlite3.DatabaseError:
+            connection.close()
+            raise
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA foreign_keys = ON")
+        return connection
+
+    @staticmethod
+    def _migrate_schema(connection: sqlite3.Connection) -> None:
+        """Aplica em uma única transação as migrações ainda ausentes do arquivo ``.chp``."""
+
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        if version > len(SCHEMA_MIGRATIONS):
+            raise sqlite3.DatabaseError(
+                f"o arquivo usa a versão {version} do formato, mais recente que a suportada ({len(SCHEMA_MIGRATIONS)})"
+            )
+        if version == len(SCHEMA_MIGRATIONS):
+            return
+        if connection.in_transaction:
+            connection.commit()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            for statements in SCHEMA_MIGRATIONS[version:]:
+                for statement in statements:
+                    connection.execute(statement)
+            connection.execute(f"PRAGMA user_version = {len(SCHEMA_MIGRATIONS)}")
+        except BaseException:
+            connection.rollback()
+            raise
+        connection.commit()
 
     @staticmethod
     def _image_links(connection: sqlite3.Connection) -> dict[tuple[str, str], list[str]]:
@@ -315,15 +408,19 @@ class ChapterManager:
             links.setdefault((row["record_type"], row["record_id"]), []).append(row["image_id"])
         return links
 
-    def load(self) -> dict[str, Any]:
-        """Carrega capítulos, elenco, metadados e imagens do arquivo ``.chp``."""
+    @profiled("chp.load")
+    def load(self, read_only: bool = False) -> dict[str, Any]:
+        """Carrega capítulos, elenco, metadados e imagens do arquivo ``.chp``.
+
+        Com ``read_only`` o arquivo não é modificado: migrações pendentes são aplicadas apenas em uma cópia na memória.
+        """
 
         path = Path(self.chp_path)
         if not path.exists():
             return {"chapters": [], "casting": [], "metadata": [], "images": []}
         try:
-            with self._connect(path) as connection:
-                self._create_schema(connection)
+            with self._connect_read_only(path) if read_only else self._connect(path) as connection:
+                self._migrate_schema(connection)
                 links = self._image_links(connection)
                 chapter_rows = connection.execute("SELECT * FROM chapters ORDER BY position").fetchall()
                 metadata_rows = connection.execute("SELECT * FROM metadata ORDER BY position").fetchall()
@@ -379,110 +476,165 @@ class ChapterManager:
             "images": images,
         }
 
-    def save(
-        self,
+    @staticmethod
+    def validate(
         chapters: list[dict],
         casting: list[dict],
         metadata: list[dict] | None = None,
         images: list[dict] | None = None,
-    ) -> None:
-        """Valida e grava todos os dados em uma única transação SQLite."""
+    ) -> tuple[list, list, list, list, list]:
+        """Valida os dados sem gravá-los e retorna as linhas de imagens, capítulos, elenco, metadados e vínculos."""
 
+        chapter_rows: list[list[Any]] = []
+        metadata_rows: list[tuple[str, str | None, int, str, str]] = []
+        link_rows: list[tuple[str, str, str, int]] = []
         try:
-            validated = [
-                _validate_chapter(chapter, f"capítulo {index}") for index, chapter in enumerate(chapters, start=1)
-            ]
+            _validate_chapters(chapters, chapter_rows, link_rows)
         except (TypeError, ValueError) as exc:
             raise ValueError(f"Os capítulos não foram salvos: {exc}") from exc
         try:
-            validated_metadata = _validate_metadata([] if metadata is None else metadata)
-            validated_casting = _validate_casting(casting)
-            validated_images = _validate_images([] if images is None else images)
+            _validate_metadata([] if metadata is None else metadata, metadata_rows, link_rows)
+            casting_rows = _validate_casting(casting, link_rows)
+            image_rows = _validate_images([] if images is None else images)
         except (TypeError, ValueError) as exc:
             raise ValueError(f"Os dados não foram salvos: {exc}") from exc
-        image_ids = {image["id"] for image in validated_images}
-
-        def insert_links(connection: sqlite3.Connection, record_type: str, record: dict) -> None:
-            for position, image_id in enumerate(record["images"]):
-                if image_id not in image_ids:
-                    raise ValueError(f"A imagem vinculada ao registro '{record['id']}' não existe")
-                connection.execute(
-                    "INSERT INTO image_links VALUES (?, ?, ?, ?)", (image_id, record_type, record["id"], position)
-                )
-
-        def insert_chapters(connection: sqlite3.Connection, nodes: list[dict], parent_id: str | None = None) -> None:
-            for position, node in enumerate(nodes):
-                connection.execute(
-                    "INSERT INTO chapters VALUES (?, ?, ?, ?, ?, ?)",
-                    (node["id"], parent_id, position, node["title"], node["start"], node["end"]),
-                )
-                insert_links(connection, "chapters", node)
-                insert_chapters(connection, node["subs"], node["id"])
-
-        def insert_metadata(connection: sqlite3.Connection, nodes: list[dict], parent_id: str | None = None) -> None:
-            for position, node in enumerate(nodes):
-                connection.execute(
-                    "INSERT INTO metadata VALUES (?, ?, ?, ?, ?)",
-                    (node["id"], parent_id, position, node["key"], node["value"]),
-                )
-                insert_links(connection, "metadata", node)
-                insert_metadata(connection, node["children"], node["id"])
+        image_ids = {row[0] for row in image_rows}
+        for image_id, _, record_id, _ in link_rows:
+            if image_id not in image_ids:
+                raise ValueError(f"A imagem vinculada ao registro '{record_id}' não existe")
+        return image_rows, chapter_rows, casting_rows, metadata_rows, link_rows
+
+    def save(
+        self,
+        chapters: list[dict],
+        casting: list[dict],
+        metadata: list[dict] | None = None,
+        images: list[dict] | None = None,
+    ) -> None:
+        """Valida e grava todos os dados em uma única transação SQLite.
+
+        A validação já produz as linhas de cada tabela, gravadas em seguida com poucos ``executemany``.
+        """
 
+        image_rows, chapter_rows, casting_rows, metadata_rows, link_rows = self.validate(
+            chapters, casting, metadata, images
+        )
         path = Path(self.chp_path)
         try:
             with self._connect(path) as connection:
-                self._create_schema(connection)
+                self._migrate_schema(connection)
                 connection.execute("DELETE FROM image_links")
                 connection.execute("DELETE FROM chapters")
                 connection.execute("DELETE FROM casting")
                 connection.execute("DELETE FROM metadata")
                 connection.execute("DELETE FROM images")
-                connection.executemany(
-                    "INSERT INTO images VALUES (?, ?, ?, ?, ?, ?, ?)",
-                    [
-                        (
-                            image["id"],
-                            image["title"],
-                            image["description"],
-                            image["width"],
-                            image["height"],
-                            image["mime_type"],
-                            image["data"],
-                        )
-                        for image in validated_images
-                    ],
-                )
-                insert_chapters(connection, validated)
-                for position, member in enumerate(validated_casting):
-                    connection.execute("INSERT INTO casting VALUES (?, ?, ?)", (member["id"], position, member["name"]))
-                    insert_links(connection, "casting", member)
-                insert_metadata(connection, validated_metadata)
+                connection.executemany("INSERT INTO images VALUES (?, ?, ?, ?, ?, ?, ?)", image_rows)
+                connection.executemany("INSERT INTO chapters VALUES (?, ?, ?, ?, ?, ?)", chapter_rows)
+                connection.executemany("INSERT INTO casting VALUES (?, ?, ?)", casting_rows)
+                connection.executemany("INSERT INTO metadata VALUES (?, ?, ?, ?, ?)", metadata_rows)
+                connection.executemany("INSERT INTO image_links VALUES (?, ?, ?, ?)", link_rows)
         except (OSError, sqlite3.DatabaseError) as exc:
             raise ValueError(f"Os dados não foram salvos: {exc}") from exc
+        self.previews.prune_thumbnails({row[4] * 1000 for row in chapter_rows})
+
+
+class PreviewCache:
+    """Cache SQLite ``.previews`` com as miniaturas dos capítulos e a folha de quadros da barra de progresso.
+
+    Fica fora do ``.chp`` porque é gravado em segundo plano: assim não muda a data que o diário de edições compara nem
+    cria arquivos de dados para vídeos apenas assistidos. Leituras de um cache ausente ou ilegível retornam vazio.
+    """
+
+    def __init__(self, video_path: str) -> None:
+        """Define o caminho do cache ao lado do vídeo."""
+
+        self.path = Path(os.path.splitext(video_path)[0] + ".previews")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Abre o cache, criando as tabelas que faltarem."""
+
+        connection = sqlite3.connect(self.path)
+        connection.row_factory = sqlite3.Row
+        for statement in PREVIEW_SCHEMA:
+            connection.execute(statement)
+        return connection
+
+    def _read(self, query: str) -> list[sqlite3.Row]:
+        """Executa uma consulta em modo somente leitura; um cache ausente ou corrompido não tem linhas."""
+
+        if not self.path.exists():
+            return []
+        try:
+            connection = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True)
+            try:
+                connection.row_factory = sqlite3.Row
+                return connection.execute(query).fetchall()
+            finally:
+                connection.close()
+        except sqlite3.Error:
+            return []
 
+    def _write(self, statement: str, parameters: Any, failure: str) -> None:
+        """Executa uma gravação em uma transação própria."""
 
-def fmt_srt_time(ms: int) -> str:
-    """Converte milissegundos em formato de legenda SRT ``hh:mm:ss,mss``."""
+        try:
+            connection = self._connect()
+            try:
+                with connection:
+                    connection.execute(statement, parameters)
+            finally:
+                connection.close()
+        except (OSError, sqlite3.Error) as exc:
+            raise ValueError(f"{failure}: {exc}") from exc
+
+    def load_thumbnails(self) -> dict[int, bytes]:
+        """Lê as miniaturas PNG, indexadas pelo instante em milissegundos."""
 
-    ms = max(0, ms)
-    seconds, milliseconds = divmod(ms, 1000)
-    hours, seconds = divmod(seconds, 3600)
-    minutes, seconds = divmod(seconds, 60)
-    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+        return {row["time_ms"]: row["data"] for row in self._read("SELECT time_ms, data FROM thumbnails")}
 
+    def store_thumbnail(self, time_ms: int, width: int, height: int, data: bytes) -> None:
+        """Grava ou substitui a miniatura PNG do instante ``time_ms``."""
+
+        self._write(
+            "INSERT OR REPLACE INTO thumbnails VALUES (?, ?, ?, ?)",
+            (time_ms, width, height, data),
+            "A miniatura não foi salva",
+        )
 
-def parse_srt_time(txt: str) -> int:
-    """Converte ``hh:mm:ss,mss`` ou ``mm:ss,mss`` em milissegundos."""
+    def prune_thumbnails(self, keep: set[int]) -> None:
+        """Apaga as miniaturas dos instantes que não são mais início de capítulo; falhas são ignoradas."""
+
+        stored = self._read("SELECT time_ms FROM thumbnails")
+        removed = [(row["time_ms"],) for row in stored if row["time_ms"] not in keep]
+        if not removed:
+            return
+        try:
+            connection = self._connect()
+            try:
+                with connection:
+                    connection.executemany("DELETE FROM thumbnails WHERE time_ms = ?", removed)
+            finally:
+                connection.close()
+        except (OSError, sqlite3.Error):
+            pass
+
+    def load_sprite_sheet(self) -> dict[str, Any] | None:
+        """Lê a folha de quadros da barra de progresso, se houver uma."""
+
+        rows = self._read(
+            "SELECT stamp, interval_ms, columns, frame_width, frame_height, count, data FROM sprite_sheet"
+        )
+        return dict(rows[0]) if rows else None
 
-    cleaned = txt.strip().replace(".", ",")
-    if "," not in cleaned:
-        return parse_flexible_time(cleaned) * 1000
+    def store_sprite_sheet(self, sheet: dict[str, Any]) -> None:
+        """Grava a folha de quadros da barra de progresso, substituindo a anterior."""
 
-    time_part, milliseconds_part = cleaned.split(",", 1)
-    if not milliseconds_part.isdigit() or len(milliseconds_part) > 3:
-        raise ValueError("Os milissegundos devem conter de um a três dígitos")
-    milliseconds = int(milliseconds_part.ljust(3, "0"))
-    return parse_time(time_part) * 1000 + milliseconds
+        self._write(
+            """INSERT OR REPLACE INTO sprite_sheet
+            VALUES (1, :stamp, :interval_ms, :columns, :frame_width, :frame_height, :count, :data)""",
+            sheet,
+            "A folha de quadros não foi salva",
+        )
 
 
 class SubtitleManager:
@@ -528,8 +680,9 @@ class SubtitleManager:
             subtitles.append({"start": start_ms, "end": end_ms, "text": text})
         return subtitles
 
-    def save(self, subtitles: list[dict]) -> None:
-        """Valida e grava a lista de legendas de forma atômica."""
+    @staticmethod
+    def validate(subtitles: list[dict]) -> list[dict]:
+        """Valida as legendas sem gravá-las e retorna cópias normalizadas em ordem de início."""
 
         validated: list[dict] = []
         for index, subtitle in enumerate(subtitles, start=1):
@@ -545,9 +698,350 @@ class SubtitleManager:
             validated.append({"start": start, "end": end, "text": text})
 
         validated.sort(key=lambda item: item["start"])
+        return validated
+
+    def save(self, subtitles: list[dict]) -> None:
+        """Valida e grava a lista de legendas de forma atômica."""
+
+        validated = self.validate(subtitles)
         blocks = [
             f"{index}\n{fmt_srt_time(subtitle['start'])} --> {fmt_srt_time(subtitle['end'])}\n{subtitle['text']}"
             for index, subtitle in enumerate(validated, start=1)
         ]
         content = "\n\n".join(blocks) + "\n" if blocks else ""
         _atomic_write_text(Path(self.srt_path), content)
+
+
+class SubtitleTimeline:
+    """Índice das legendas por tempo de início, para achar as legendas ativas por busca binária."""
+
+    def __init__(self, subtitles: list[dict]) -> None:
+        """Ordena as legendas e guarda, para cada posição, o maior fim até ela."""
+
+        cues = sorted((subtitle["start"], subtitle["end"], subtitle.get("text", "")) for subtitle in subtitles)
+        self.starts = [start for start, _, _ in cues]
+        self.ends = [end for _, end, _ in cues]
+        self.texts = [text for _, _, text in cues]
+        self.latest_ends = list(accumulate(self.ends, max))
+
+    def active(self, time_ms: int) -> list[str]:
+        """Retorna, em ordem de início, os textos das legendas que cobrem ``time_ms``.
+
+        A busca recua a partir da última legenda iniciada apenas enquanto alguma anterior ainda pode estar ativa.
+        """
+
+        texts: list[str] = []
+        index = bisect_right(self.starts, time_ms) - 1
+        while index >= 0 and self.latest_ends[index] > time_ms:
+            if self.ends[index] > time_ms:
+                texts.append(self.texts[index])
+            index -= 1
+        texts.reverse()
+        return texts
+
+
+QC_MIN_GAP_MS = 84
+QC_MIN_DURATION_MS = 833
+QC_MAX_DURATION_MS = 7_000
+QC_MAX_CPS = 20.0
+QC_ISSUES: dict[str, str] = {
+    "overlap": "Sobreposta",
+    "gap": "Intervalo curto",
+    "short": "Curta",
+    "long": "Longa",
+    "cps": "Leitura rápida",
+}
+"""Códigos dos problemas encontrados pela verificação de legendas e seus rótulos, em ordem de gravidade."""
+
+
+_QC_COMBINATIONS = tuple(
+    tuple(code for bit, code in enumerate(QC_ISSUES) if mask >> bit & 1) for mask in range(1 << len(QC_ISSUES))
+)
+
+
+def issue_codes(mask: int) -> tuple[str, ...]:
+    """Converte a máscara de uma legenda, com um bit por código na ordem de ``QC_ISSUES``, nos seus códigos."""
+
+    return _QC_COMBINATIONS[mask]
+
+
+def _visible_length(subtitle: dict) -> int:
+    """Conta os caracteres exibidos da legenda, sem as quebras de linha."""
+
+    text = subtitle.get("text", "")
+    return len(text) - text.count("\n")
+
+
+def _subtitle_columns(subtitles: list[dict]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Retorna as colunas de início, fim e caracteres (sem contar as quebras de linha) das legendas."""
+
+    import numpy as np
+
+    starts = np.array([subtitle["start"] for subtitle in subtitles], dtype=np.int64)
+    ends = np.array([subtitle["end"] for subtitle in subtitles], dtype=np.int64)
+    characters = np.array([_visible_length(subtitle) for subtitle in subtitles], dtype=np.int64)
+    return starts, ends, characters
+
+
+def _issue_masks(starts: np.ndarray, ends: np.ndarray, characters: np.ndarray) -> np.ndarray:
+    """Calcula as máscaras de problemas a partir das colunas das legendas.
+
+    Uma varredura sobre as legendas ordenadas pelo início marca as que se sobrepõem a alguma outra e os pares
+    separados por menos de ``QC_MIN_GAP_MS``; durações e caracteres por segundo são comparados com os limites de cada
+    legenda.
+    """
+
+    import numpy as np
+
+    count = len(starts)
+    order = np.argsort(starts, kind="stable")
+    sorted_starts, sorted_ends = starts[order], ends[order]
+    latest_end = np.maximum.accumulate(sorted_ends)
+    overlap = np.zeros(count, dtype=bool)
+    overlap[1:] = latest_end[:-1] > sorted_starts[1:]
+    overlap[:-1] |= sorted_starts[1:] < sorted_ends[:-1]
+    gaps = sorted_starts[1:] - latest_end[:-1]
+    tight = (gaps >= 0) & (gaps < QC_MIN_GAP_MS)
+    close = np.zeros(count, dtype=bool)
+    close[1:] = tight
+    close[:-1] |= tight
+
+    durations = ends - starts
+    masks = np.zeros(count, dtype=np.int64)
+    masks[order] = overlap.astype(np.int64) | close.astype(np.int64) << 1
+    masks |= (durations < QC_MIN_DURATION_MS).astype(np.int64) << 2
+    masks |= (durations > QC_MAX_DURATION_MS).astype(np.int64) << 3
+    masks |= (characters * 1000 > QC_MAX_CPS * np.maximum(durations, 1)).astype(np.int64) << 4
+    return masks
+
+
+def subtitle_issues(subtitles: list[dict]) -> np.ndarray:
+    """Verifica as legendas de uma vez e retorna, na ordem recebida, a máscara de problemas de cada uma.
+
+    Cada bit da máscara corresponde a um código de ``QC_ISSUES``, na mesma ordem; :func:`issue_codes` a converte.
+    Todo o cálculo é feito em arranjos do NumPy, importado só aqui para não pesar na abertura do programa.
+    """
+
+    return _issue_masks(*_subtitle_columns(subtitles))
+
+
+class SubtitleChecker:
+    """Verificação das legendas que mantém as colunas de início, fim e caracteres entre as edições.
+
+    Depois de editar uma legenda e reordenar a lista pelo início, :meth:`update` relê apenas essa legenda e a move
+    na posição das colunas; só a varredura vetorizada é refeita sobre todas. Inclusões, remoções e alterações em lote
+    pedem :meth:`rebuild`.
+    """
+
+    def __init__(self, subtitles: list[dict]) -> None:
+        """Lê as colunas de todas as legendas da lista, que continua compartilhada com o editor."""
+
+        self.subtitles = subtitles
+        self.rebuild()
+
+    def rebuild(self) -> np.ndarray:
+        """Relê todas as legendas e retorna as máscaras de problemas na ordem da lista."""
+
+        self.starts, self.ends, self.characters = _subtitle_columns(self.subtitles)
+        self.positions = {id(subtitle): index for index, subtitle in enumerate(self.subtitles)}
+        self.masks = _issue_masks(self.starts, self.ends, self.characters)
+        return self.masks
+
+    def update(self, subtitle: dict) -> np.ndarray | None:
+        """Relê a legenda editada, já reposicionada na lista ordenada pelo início, e refaz as máscaras.
+
+        Retorna as posições cujas máscaras mudaram, sempre incluindo a da legenda editada, ou ``None`` quando a lista
+        mudou de outra forma (tamanho diferente ou legenda desconhecida) e todas as legendas precisaram ser relidas.
+        """
+
+        import numpy as np
+
+        old = self.positions.get(id(subtitle))
+        if old is None or len(self.subtitles) != len(self.starts):
+            self.rebuild()
+            return None
+        new = bisect_left(self.subtitles, subtitle["start"], key=itemgetter("start"))
+        while new < len(self.subtitles) and self.subtitles[new] is not subtitle:
+            new += 1
+        if new == len(self.subtitles):
+            self.rebuild()
+            return None
+        previous = self.masks
+        for column in (self.starts, self.ends, self.characters, previous):
+            if new > old:
+                column[old:new] = column[old + 1 : new + 1]
+            elif new < old:
+                column[new + 1 : old + 1] = column[new:old]
+        self.starts[new], self.ends[new] = subtitle["start"], subtitle["end"]
+        self.characters[new] = _visible_length(subtitle)
+        previous[new] = -1
+        for index in range(min(old, new), max(old, new) + 1):
+            self.positions[id(self.subtitles[index])] = index
+        self.masks = _issue_masks(self.starts, self.ends, self.characters)
+        return np.flatnonzero(self.masks != previous)
+
+
+JOURNAL_SECTIONS: dict[str, str] = {
+    "chapters": "subs",
+    "casting": "",
+    "metadata": "children",
+    "images": "",
+    "subtitles": "",
+}
+"""Seções registradas no diário e a chave de filhos das que são árvores."""
+
+
+def _flatten_tree(nodes: list[dict], children_key: str) -> list[list]:
+    """Converte uma árvore em linhas ``[índice do pai, nó sem filhos]`` em pré-ordem, sem recursão.
+
+    O formato plano evita o limite de recursão do ``json`` em cadeias profundas de capítulos ou metadados.
+    """
+
+    rows: list[list] = []
+    pending: list[tuple[dict, int]] = [(node, -1) for node in reversed(nodes)]
+    while pending:
+        node, parent_index = pending.pop()
+        index = len(rows)
+        rows.append([parent_index, {key: value for key, value in node.items() if key != children_key}])
+        pending.extend((child, index) for child in reversed(node.get(children_key, [])))
+    return rows
+
+
+def _unflatten_tree(rows: list[list], children_key: str) -> list[dict]:
+    """Reconstrói a árvore produzida por :func:`_flatten_tree`."""
+
+    roots: list[dict] = []
+    nodes: list[dict] = []
+    for parent_index, fields in rows:
+        node = {**fields, children_key: []}
+        nodes.append(node)
+        (roots if parent_index < 0 else nodes[parent_index][children_key]).append(node)
+    return roots
+
+
+class EditJournal:
+    """Diário de edições em JSON Lines, acrescentado ao lado do ``.chp`` e do ``.srt``.
+
+    Cada registro guarda o estado de uma seção editada. As seções alteradas entre duas gravações do diário são
+    agrupadas em um único lote, com um ``fsync`` por lote. As imagens são registradas pelo hash do conteúdo, e cada
+    conteúdo é gravado uma única vez, no primeiro registro que o usa. Na abertura, um diário mais novo que os arquivos
+    do vídeo contém edições que não chegaram a ser gravadas e é reaplicado; após cada salvamento completo ele é
+    apagado.
+    """
+
+    def __init__(self, video_path: str) -> None:
+        """Define o caminho do diário e dos arquivos que ele protege."""
+
+        base_path = os.path.splitext(video_path)[0]
+        self.journal_path = base_path + ".journal"
+        self.sidecar_paths = (base_path + ".chp", base_path + ".srt")
+        self.staged: dict[str, list[dict]] = {}
+        self.written_blobs: set[str] = set()
+
+    def stage(self, section: str, data: list[dict]) -> None:
+        """Agenda a seção para o próximo lote; apenas o estado mais recente de cada seção é gravado."""
+
+        if section not in JOURNAL_SECTIONS:
+            raise ValueError(f"Seção de diário desconhecida: {section}")
+        self.staged[section] = data
+
+    def _encode(self, section: str, data: list[dict], blobs: dict[str, str]) -> Any:
+        """Prepara a seção para JSON: árvores planas e imagens pelo hash do conteúdo.
+
+        O conteúdo em base64 das imagens ainda não gravadas no diário é acrescentado a ``blobs``.
+        """
+
+        children_key = JOURNAL_SECTIONS[section]
+        if children_key:
+            return _flatten_tree(data, children_key)
+        if section == "images":
+            encoded = []
+            for image in data:
+                digest = hashlib.sha1(image["data"], usedforsecurity=False).hexdigest()
+                if digest not in self.written_blobs and digest not in blobs:
+                    blobs[digest] = base64.b64encode(image["data"]).decode("ascii")
+                encoded.append({**image, "data": digest})
+            return encoded
+        return data
+
+    @staticmethod
+    def _decode(section: str, payload: Any, blobs: dict[str, bytes]) -> list[dict]:
+        """Desfaz a transformação de :meth:`_encode` com o conteúdo das imagens lido até o registro."""
+
+        children_key = JOURNAL_SECTIONS[section]
+        if children_key:
+            return _unflatten_tree(payload, children_key)
+        if section == "images":
+            return [{**image, "data": blobs[image["data"]]} for image in payload]
+        return payload
+
+    def write_staged(self) -> None:
+        """Acrescenta as seções agendadas ao diário e força sua gravação em disco."""
+
+        if not self.staged:
+            return
+        blobs: dict[str, str] = {}
+        records = [
+            {"section": section, "data": self._encode(section, data, blobs)} for section, data in self.staged.items()
+        ]
+        if blobs:
+            records[0]["blobs"] = blobs
+        lines = [json.dumps(record, ensure_ascii=False) for record in records]
+        with open(self.journal_path, "a", encoding="utf-8") as file_handle:
+            file_handle.write("\n".join(lines) + "\n")
+            file_handle.flush()
+            os.fsync(file_handle.fileno())
+        self.written_blobs.update(blobs)
+        self.staged.clear()
+
+    def pending(self) -> dict[str, list[dict]]:
+        """Lê as edições ainda não gravadas; o último registro de cada seção vence.
+
+        Só são devolvidas as seções cujo arquivo de destino (``.chp`` ou ``.srt``) é mais antigo que o diário ou não
+        existe. Uma linha incompleta ou ilegível, como a deixada por uma queda durante a escrita, encerra a leitura.
+        """
+
+        path = Path(self.journal_path)
+        try:
+            journal_mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return {}
+        stale: set[str] = set()
+        for sidecar in self.sidecar_paths:
+            try:
+                if os.stat(sidecar).st_mtime_ns < journal_mtime:
+                    stale.add(sidecar)
+            except FileNotFoundError:
+                stale.add(sidecar)
+        if not stale:
+            return {}
+
+        sections: dict[str, list[dict]] = {}
+        blobs: dict[str, bytes] = {}
+        try:
+            with path.open("r", encoding="utf-8") as file_handle:
+                for line in file_handle:
+                    try:
+                        record = json.loads(line)
+                        section = record["section"]
+                        blobs.update(
+                            (digest, base64.b64decode(data)) for digest, data in record.get("blobs", {}).items()
+                        )
+                        sections[section] = self._decode(section, record["data"], blobs)
+                    except (ValueError, KeyError, TypeError, IndexError):
+                        break
+        except (OSError, UnicodeError) as exc:
+            raise DataLoadError(path, str(exc)) from exc
+        chp_path, srt_path = self.sidecar_paths
+        return {
+            section: data
+            for section, data in sections.items()
+            if (srt_path if section == "subtitles" else chp_path) in stale
+        }
+
+    def clear(self) -> None:
+        """Descarta o diário e as seções agendadas depois de um salvamento completo."""
+
+        self.staged.clear()
+        self.written_blobs.clear()
+        Path(self.journal_path).unlink(missing_ok=True)
@@ -0,0 +1,448 @@
+"""Leitura das caixas de arquivos MP4 sem decodificar nem carregar os dados de mídia.
+
+O arquivo é mapeado com ``mmap`` e apenas os cabeçalhos das caixas e as tabelas de amostras de ``moov`` são lidos;
+as páginas de ``mdat`` nunca são tocadas. O índice de quadros-chave da trilha de vídeo é montado a partir de
+``stss``, ``stts``, ``ctts`` e da lista de edição, em tabelas ``array`` compactas.
+
+Os capítulos Nero (``moov/udta/chpl``) são lidos da mesma forma. Na gravação, apenas ``moov`` é reconstruído; as
+demais caixas são copiadas por intervalos de bytes com ``os.copy_file_range`` quando disponível, e os deslocamentos
+de ``stco``/``co64`` são corrigidos se ``moov`` mudar de tamanho antes dos dados de mídia.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from typing import NamedTuple
+
+KEYFRAME_CACHE_SIZE = 32
+CHPL_UNITS_PER_MS = 10_000
+CHPL_MAX_CHAPTERS = 255
+COPY_CHUNK = 8 * 1024 * 1024
+
+
+class Mp4FormatError(ValueError):
+    """Indica uma estrutura de caixas MP4 ausente ou inconsistente."""
+
+
+class Box(NamedTuple):
+    """Caixa MP4: tipo, início do cabeçalho, início do conteúdo e fim."""
+
+    type: bytes
+    start: int
+    payload: int
+    end: int
+
+
+def iter_boxes(buffer: mmap.mmap | bytes, start: int, end: int) -> Iterator[Box]:
+    """Percorre as caixas irmãs entre ``start`` e ``end``, lendo apenas os cabeçalhos."""
+
+    offset = start
+    while offset + 8 <= end:
+        size, box_type = struct.unpack_from(">I4s", buffer, offset)
+        header = 8
+        if size == 1:
+            if offset + 16 > end:
+                raise Mp4FormatError(f"caixa {box_type!r} truncada em {offset}")
+            size = struct.unpack_from(">Q", buffer, offset + 8)[0]
+            header = 16
+        elif size == 0:
+            size = end - offset
+        if size < header or offset + size > end:
+            raise Mp4FormatError(f"caixa {box_type!r} com tamanho inválido em {offset}")
+        yield Box(box_type, offset, offset + header, offset + size)
+        offset += size
+
+
+def find_box(buffer: mmap.mmap | bytes, start: int, end: int, *path: bytes) -> Box | None:
+    """Retorna a primeira caixa que segue o caminho de tipos informado, ou ``None``."""
+
+    box = None
+    for box_type in path:
+        box = next((child for child in iter_boxes(buffer, start, end) if child.type == box_type), None)
+        if box is None:
+            return None
+        start, end = box.payload, box.end
+    return box
+
+
+def _table(buffer: mmap.mmap | bytes, box: Box, header: int, typecode: str, columns: int) -> array:
+    """Lê a tabela de inteiros big-endian de uma caixa completa após ``header`` bytes de campos fixos."""
+
+    count = struct.unpack_from(">I", buffer, box.payload + header)[0]
+    start = box.payload + header + 4
+    table = array(typecode)
+    stop = start + count * columns * table.itemsize
+    if stop > box.end:
+        raise Mp4FormatError(f"tabela {box.type!r} maior que a caixa")
+    table.frombytes(buffer[start:stop])
+    if sys.byteorder == "little":
+        table.byteswap()
+    return table
+
+
+class KeyframeIndex(NamedTuple):
+    """Instantes de apresentação, em milissegundos e em ordem crescente, dos quadros-chave da trilha de vídeo."""
+
+    times_ms: array
+
+    def at_or_before(self, milliseconds: int) -> int | None:
+        """Retorna o último quadro-chave até ``milliseconds``, ou ``None`` se não houver."""
+
+        position = bisect_right(self.times_ms, milliseconds)
+        return self.times_ms[position - 1] if position else None
+
+    def at_or_after(self, milliseconds: int) -> int | None:
+        """Retorna o primeiro quadro-chave a partir de ``milliseconds``, ou ``None`` se não houver."""
+
+        position = bisect_left(self.times_ms, milliseconds)
+        return self.times_ms[position] if position < len(self.times_ms) else None
+
+
+def _video_track(buffer: mmap.mmap | bytes, moov: Box) -> Box | None:
+    """Retorna a primeira trilha cujo manipulador é de vídeo."""
+
+    for trak in iter_boxes(buffer, moov.payload, moov.end):
+        if trak.type != b"trak":
+            continue
+        hdlr = find_box(buffer, trak.payload, trak.end, b"mdia", b"hdlr")
+        if hdlr is not None and buffer[hdlr.payload + 8 : hdlr.payload + 12] == b"vide":
+            return trak
+    return None
+
+
+def _media_start(buffer: mmap.mmap | bytes, trak: Box) -> int:
+    """Retorna o ``media_time`` da primeira edição não vazia, que desloca a apresentação da trilha."""
+
+    elst = find_box(buffer, trak.payload, trak.end, b"edts", b"elst")
+    if elst is None:
+        return 0
+    version = buffer[elst.payload]
+    count = struct.unpack_from(">I", buffer, elst.payload + 4)[0]
+    entry_format, entry_size = (">Qq", 20) if version == 1 else (">Ii", 12)
+    for index in range(count):
+        offset = elst.payload + 8 + index * entry_size
+        if offset + entry_size > elst.end:
+            break
+        media_time = struct.unpack_from(entry_format, buffer, offset)[1]
+        if media_time >= 0:
+            return media_time
+    return 0
+
+
+def parse_keyframe_index(buffer: mmap.mmap | bytes) -> KeyframeIndex | None:
+    """Monta o índice de quadros-chave da trilha de vídeo.
+
+    Retorna ``None`` quando não há trilha de vídeo ou quando ela não tem ``stss``, caso em que todo quadro é chave.
+    """
+
+    moov = find_box(buffer, 0, len(buffer), b"moov")
+    if moov is None:
+        raise Mp4FormatError("o arquivo não possui a caixa moov")
+    trak = _video_track(buffer, moov)
+    if trak is None:
+        return None
+    mdhd = find_box(buffer, trak.payload, trak.end, b"mdia", b"mdhd")
+    stbl = find_box(buffer, trak.payload, trak.end, b"mdia", b"minf", b"stbl")
+    if mdhd is None or stbl is None:
+        raise Mp4FormatError("a trilha de vídeo não possui mdhd ou stbl")
+    timescale_offset = 20 if buffer[mdhd.payload] == 1 else 12
+    timescale = struct.unpack_from(">I", buffer, mdhd.payload + timescale_offset)[0]
+    stss = find_box(buffer, stbl.payload, stbl.end, b"stss")
+    stts = find_box(buffer, stbl.payload, stbl.end, b"stts")
+    if stss is None:
+        return None
+    if stts is None or timescale == 0:
+        raise Mp4FormatError("a trilha de vídeo não possui stts ou escala de tempo")
+
+    sync = _table(buffer, stss, 4, "I", 1)
+    durations = _table(buffer, stts, 4, "I", 2)
+    ctts = find_box(buffer, stbl.payload, stbl.end, b"ctts")
+    offsets = array("i")
+    if ctts is not None:
+        offsets = _table(buffer, ctts, 4, "i" if buffer[ctts.payload] == 1 else "I", 2)
+    media_start = _media_start(buffer, trak)
+
+    times = array("q")
+    run = first_sample = decode_time = 0
+    offset_run = offset_first = 0
+    for sample_number in sync:
+        sample = sample_number - 1
+        while run * 2 < len(durations) and sample >= first_sample + durations[run * 2]:
+            decode_time += durations[run * 2] * durations[run * 2 + 1]
+            first_sample += durations[run * 2]
+            run += 1
+        if run * 2 >= len(durations):
+            break
+        presentation = decode_time + (sample - first_sample) * durations[run * 2 + 1]
+        while offset_run * 2 < len(offsets) and sample >= offset_first + offsets[offset_run * 2]:
+            offset_first += offsets[offset_run * 2]
+            offset_run += 1
+        if offset_run * 2 < len(offsets):
+            presentation += offsets[offset_run * 2 + 1]
+        times.append(max(0, presentation - media_start) * 1000 // timescale)
+    return KeyframeIndex(array("q", sorted(times)))
+
+
+def read_keyframe_index(video_path: str) -> KeyframeIndex | None:
+    """Mapeia o arquivo e lê seu índice de quadros-chave."""
+
+    with open(video_path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        return parse_keyframe_index(buffer)
+
+
+_keyframe_cache: dict[str, tuple[tuple[int, int], KeyframeIndex | None]] = {}
+_keyframe_cache_lock = threading.Lock()
+
+
+def keyframe_index(video_path: str) -> KeyframeIndex | None:
+    """Retorna o índice de quadros-chave em cache, relido apenas se o tamanho ou a data do arquivo mudarem.
+
+    Arquivos que não são MP4 ou que não puderam ser lidos resultam em ``None``. O cache é compartilhado entre a
+    thread do Tk e a do pré-carregamento; a leitura do arquivo acontece fora da trava.
+    """
+
+    path = os.path.abspath(video_path)
+    try:
+        status = os.stat(path)
+    except OSError:
+        return None
+    stamp = (status.st_size, status.st_mtime_ns)
+    with _keyframe_cache_lock:
+        cached = _keyframe_cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    try:
+        index = read_keyframe_index(path)
+    except (OSError, ValueError, struct.error):
+        index = None
+    with _keyframe_cache_lock:
+        _keyframe_cache.pop(path, None)
+        _keyframe_cache[path] = (stamp, index)
+        while len(_keyframe_cache) > KEYFRAME_CACHE_SIZE:
+            del _keyframe_cache[next(iter(_keyframe_cache))]
+    return index
+
+
+class ContainerChapter(NamedTuple):
+    """Capítulo gravado no contêiner: início em milissegundos e título."""
+
+    start_ms: int
+    title: str
+
+
+def _box(box_type: bytes, *parts: bytes) -> bytes:
+    """Monta uma caixa com cabeçalho de 32 bits."""
+
+    payload = b"".join(parts)
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+
+def movie_duration_ms(buffer: mmap.mmap | bytes) -> int | None:
+    """Retorna a duração do filme declarada em ``mvhd``, ou ``None`` se ausente."""
+
+    mvhd = find_box(buffer, 0, len(buffer), b"moov", b"mvhd")
+    if mvhd is None:
+        return None
+    if buffer[mvhd.payload] == 1:
+        timescale, duration = struct.unpack_from(">IQ", buffer, mvhd.payload + 20)
+    else:
+        timescale, duration = struct.unpack_from(">II", buffer, mvhd.payload + 12)
+    return duration * 1000 // timescale if timescale else None
+
+
+def parse_chapters(buffer: mmap.mmap | bytes) -> list[ContainerChapter]:
+    """Lê os capítulos Nero de ``moov/udta/chpl``; retorna lista vazia se não houver."""
+
+    chpl = find_box(buffer, 0, len(buffer), b"moov", b"udta", b"chpl")
+    if chpl is None:
+        return []
+    offset = chpl.payload + (8 if buffer[chpl.payload] else 4)
+    if offset >= chpl.end:
+        raise Mp4FormatError("caixa chpl truncada")
+    count = buffer[offset]
+    offset += 1
+    chapters: list[ContainerChapter] = []
+    for _ in range(count):
+        if offset + 9 > chpl.end:
+            raise Mp4FormatError("caixa chpl truncada")
+        start, length = struct.unpack_from(">QB", buffer, offset)
+        offset += 9
+        title = bytes(buffer[offset : offset + length]).decode("utf-8", errors="replace")
+        offset += length
+        chapters.append(ContainerChapter(start // CHPL_UNITS_PER_MS, title))
+    return chapters
+
+
+def _chpl_box(chapters: list[ContainerChapter]) -> bytes:
+    """Monta a caixa ``chpl`` versão 1, com títulos UTF-8 de até 255 bytes."""
+
+    if len(chapters) > CHPL_MAX_CHAPTERS:
+        raise Mp4FormatError(f"o formato Nero comporta no máximo {CHPL_MAX_CHAPTERS} capítulos ({len(chapters)})")
+    entries = [struct.pack(">BBBBIB", 1, 0, 0, 0, 0, len(chapters))]
+    for chapter in sorted(chapters, key=lambda item: item.start_ms):
+        title = chapter.title.encode("utf-8")[:255].decode("utf-8", errors="ignore").encode("utf-8")
+        entries.append(struct.pack(">QB", max(0, chapter.start_ms) * CHPL_UNITS_PER_MS, len(title)) + title)
+    return _box(b"chpl", *entries)
+
+
+def _rebuild_moov(buffer: mmap.mmap | bytes, moov: Box, chpl: bytes | None) -> bytearray:
+    """Copia ``moov`` trocando a caixa ``chpl`` de ``udta``; ``None`` apenas remove a existente."""
+
+    parts: list[bytes] = []
+    has_udta = False
+    for child in iter_boxes(buffer, moov.payload, moov.end):
+        if child.type != b"udta":
+            parts.append(buffer[child.start : child.end])
+            continue
+        has_udta = True
+        kept = [
+            buffer[item.start : item.end]
+            for item in iter_boxes(buffer, child.payload, child.end)
+            if item.type != b"chpl"
+        ]
+        parts.append(_box(b"udta", *kept, *([chpl] if chpl else [])))
+    if not has_udta and chpl:
+        parts.append(_box(b"udta", chpl))
+    return bytearray(_box(b"moov", *parts))
+
+
+def _shift_chunk_offsets(moov: bytearray, threshold: int, delta: int) -> None:
+    """Soma ``delta`` aos deslocamentos de blocos que apontam para depois de ``threshold``."""
+
+    for trak in iter_boxes(moov, 8, len(moov)):
+        if trak.type != b"trak":
+            continue
+        stbl = find_box(moov, trak.payload, trak.end, b"mdia", b"minf", b"stbl")
+        if stbl is None:
+            continue
+        for child in iter_boxes(moov, stbl.payload, stbl.end):
+            if child.type not in (b"stco", b"co64"):
+                continue
+            typecode = "I" if child.type == b"stco" else "Q"
+            offsets = _table(moov, child, 4, typecode, 1)
+            shifted = [offset + delta if offset >= threshold else offset for offset in offsets]
+            if typecode == "I" and shifted and max(shifted) > 0xFFFFFFFF:
+                raise Mp4FormatError("os novos deslocamentos exigiriam converter stco em co64")
+            table = array(typecode, shifted)
+            if sys.byteorder == "little":
+                table.byteswap()
+            start = child.payload + 8
+            moov[start : start + len(table) * table.itemsize] = table.tobytes()
+
+
+def _write_all(target_fd: int, data: bytes | bytearray) -> None:
+    """Grava todos os bytes no descritor, repetindo após gravações parciais."""
+
+    view = memoryview(data)
+    while view:
+        view = view[os.write(target_fd, view) :]
+
+
+def _copy_range(buffer: mmap.mmap, source_fd: int, target_fd: int, offset: int, size: int) -> None:
+    """Copia um intervalo do arquivo de origem para a posição atual do destino.
+
+    ``os.copy_file_range`` deixa a cópia com o kernel, que pode até compartilhar blocos em sistemas com reflink; se
+    ele não existir ou falhar, a cópia segue em fatias de 8 MiB do mapeamento de memória.
+    """
+
+    copy_file_range = getattr(os, "copy_file_range", None)
+    while size > 0:
+        if copy_file_range is not None:
+            try:
+                copied = copy_file_range(source_fd, target_fd, min(size, 1 << 30), offset)
+            except OSError:
+                copy_file_range = None
+                continue
+            if copied == 0:
+                raise Mp4FormatError("o arquivo de origem terminou antes do esperado")
+        else:
+            copied = min(size, COPY_CHUNK)
+            _write_all(target_fd, buffer[offset : offset + copied])
+        offset += copied
+        size -= copied
+
+
+def write_chapters(source: str, destination: str, chapters: list[ContainerChapter]) -> None:
+    """Grava ``source`` em ``destination`` com os capítulos Nero informados, sem recodificar.
+
+    A cópia é feita em um arquivo temporário na pasta de destino, que só então o substitui; uma lista vazia remove
+    os capítulos existentes.
+    """
+
+    destination_path = os.path.abspath(destination)
+    chpl = _chpl_box(chapters) if chapters else None
+    with open(source, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        boxes = list(iter_boxes(buffer, 0, len(buffer)))
+        if any(box.type == b"moof" for box in boxes):
+            raise Mp4FormatError("arquivos MP4 fragmentados não são suportados")
+        moov = next((box for box in boxes if box.type == b"moov"), None)
+        if moov is None:
+            raise Mp4FormatError("o arquivo não possui a caixa moov")
+        new_moov = _rebuild_moov(buffer, moov, chpl)
+        delta = len(new_moov) - (moov.end - moov.start)
+        if delta:
+            _shift_chunk_offsets(new_moov, moov.end, delta)
+
+        target_fd, temporary_path = tempfile.mkstemp(
+            dir=os.path.dirname(destination_path), prefix=f".{os.path.basename(destination_path)}.", suffix=".tmp"
+        )
+        try:
+            try:
+                for box in boxes:
+                    if box is moov:
+                        _write_all(target_fd, new_moov)
+                    else:
+                        _copy_range(buffer, handle.fileno(), target_fd, box.start, box.end - box.start)
+                _copy_range(buffer, handle.fileno(), target_fd, boxes[-1].end, len(buffer) - boxes[-1].end)
+                os.fsync(target_fd)
+            finally:
+                os.close(target_fd)
+            # ``mkstemp`` cria o arquivo só para o dono; a cópia recebe as permissões do vídeo de origem.
+            shutil.copymode(source, temporary_path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+    os.replace(temporary_path, destination_path)
+
+
+def chapters_for_container(chapters: list[dict], include_subchapters: bool) -> list[ContainerChapter]:
+    """Converte a árvore de capítulos em uma lista ordenada, com os subcapítulos ou só os principais."""
+
+    entries: list[ContainerChapter] = []
+    pending = list(reversed(chapters))
+    while pending:
+        node = pending.pop()
+        entries.append(ContainerChapter(node["start"] * 1000, node["title"]))
+        if include_subchapters:
+            pending.extend(reversed(node.get("subs", [])))
+    return sorted(entries, key=lambda entry: entry.start_ms)
+
+
+def chapters_from_container(entries: list[ContainerChapter], duration_ms: int | None) -> list[dict]:
+    """Converte capítulos do contêiner em capítulos principais; cada um termina onde o seguinte começa."""
+
+    ordered = sorted(entries, key=lambda entry: entry.start_ms)
+    chapters: list[dict] = []
+    for position, entry in enumerate(ordered):
+        start = entry.start_ms // 1000
+        following = ordered[position + 1].start_ms if position + 1 < len(ordered) else duration_ms
+        end = max(start, (following if following is not None else entry.start_ms) // 1000)
+        title = entry.title.strip() or f"Capítulo {position + 1}"
+        chapters.append({"title": title, "start": start, "end": end, "subs": []})
+    return chapters
+
+
+def import_chapters(video_path: str) -> list[dict]:
+    """Lê os capítulos Nero do vídeo no formato da árvore de capítulos do ``.chp``."""
+
+    with open(video_path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        return chapters_from_container(parse_chapters(buffer), movie_duration_ms(buffer))
@@ -0,0 +1,247 @@
+"""Instrumentação opcional das operações mais pesadas do editor.
+
+O perfilador fica desligado por padrão e só registra medições quando ativado pela chave ``profiling`` da
+configuração ou pela variável de ambiente ``EDITOR_PROFILING=1``. Desligado, cada ponto instrumentado custa apenas
+a verificação de um atributo. Ligado, mantém uma janela deslizante de durações por operação para calcular
+percentis, as últimas operações lentas, o atraso do laço de eventos do Tk e os eventos para exportação no formato
+de trace do Chrome (``chrome://tracing`` ou Perfetto).
+
+:func:`import_times` mede, em um interpretador novo, o custo de importação de cada módulo com ``-X importtime``.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import math
+import os
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, NamedTuple, ParamSpec, TypeVar
+
+PROFILING_ENV = "EDITOR_PROFILING"
+WINDOW_SIZE = 512
+SLOW_OPERATIONS = 20
+SLOW_THRESHOLD_MS = 50.0
+MAX_TRACE_EVENTS = 100_000
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class Span(NamedTuple):
+    """Uma execução medida: nome da operação, início relativo ao perfilador e duração em segundos."""
+
+    name: str
+    start: float
+    duration: float
+    thread_id: int
+
+
+def profiling_requested(config: dict[str, Any]) -> bool:
+    """Indica se a configuração ou o ambiente pedem a instrumentação."""
+
+    env_value = os.environ.get(PROFILING_ENV, "").strip().lower()
+    return config.get("profiling") is True or env_value in {"1", "true", "sim", "yes"}
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    """Retorna o percentil por posição mais próxima de uma lista já ordenada."""
+
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+class Profiler:
+    """Acumula durações por operação, operações lentas e atraso do laço de eventos."""
+
+    def __init__(
+        self,
+        window_size: int = WINDOW_SIZE,
+        slow_threshold_ms: float = SLOW_THRESHOLD_MS,
+        slow_operations: int = SLOW_OPERATIONS,
+    ) -> None:
+        """Cria um perfilador desligado com os limites informados."""
+
+        self.enabled = False
+        self.window_size = window_size
+        self.slow_threshold = slow_threshold_ms / 1000
+        self.origin = time.perf_counter()
+        self.durations: dict[str, deque[float]] = {}
+        self.slow: deque[Span] = deque(maxlen=slow_operations)
+        self.lag: deque[float] = deque(maxlen=window_size)
+        self.trace: deque[Span] = deque(maxlen=MAX_TRACE_EVENTS)
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        """Descarta todas as medições acumuladas."""
+
+        with self._lock:
+            self.origin = time.perf_counter()
+            self.durations.clear()
+            self.slow.clear()
+            self.lag.clear()
+            self.trace.clear()
+
+    def record(self, name: str, started: float, duration: float) -> None:
+        """Registra uma execução de ``name`` iniciada em ``started`` (``perf_counter``)."""
+
+        span = Span(name, started - self.origin, duration, threading.get_ident())
+        with self._lock:
+            window = self.durations.get(name)
+            if window is None:
+                window = self.durations[name] = deque(maxlen=self.window_size)
+            window.append(duration)
+            self.trace.append(span)
+            if duration >= self.slow_threshold:
+                self.slow.append(span)
+
+    def record_lag(self, seconds: float) -> None:
+        """Registra o atraso observado entre o agendamento e a execução de um ``after`` do Tk."""
+
+        with self._lock:
+            self.lag.append(max(0.0, seconds))
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Mede o bloco ``with`` quando o perfilador está ativo."""
+
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, started, time.perf_counter() - started)
+
+    def percentiles(self, name: str) -> dict[str, float]:
+        """Retorna contagem, p50, p90, p99 e máximo, em milissegundos, da janela de ``name``."""
+
+        with self._lock:
+            ordered = sorted(self.durations.get(name, ()))
+        return self._summary(ordered)
+
+    def lag_percentiles(self) -> dict[str, float]:
+        """Resume o atraso do laço de eventos como em :meth:`percentiles`."""
+
+        with self._lock:
+            ordered = sorted(self.lag)
+        return self._summary(ordered)
+
+    @staticmethod
+    def _summary(ordered: list[float]) -> dict[str, float]:
+        """Converte uma janela ordenada no resumo exibido pela sobreposição."""
+
+        if not ordered:
+            return {"count": 0, "p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0}
+        return {
+            "count": len(ordered),
+            "p50": _percentile(ordered, 0.50) * 1000,
+            "p90": _percentile(ordered, 0.90) * 1000,
+            "p99": _percentile(ordered, 0.99) * 1000,
+            "max": ordered[-1] * 1000,
+        }
+
+    def operations(self) -> list[str]:
+        """Lista, em ordem alfabética, as operações que já foram medidas."""
+
+        with self._lock:
+            return sorted(self.durations)
+
+    def slow_operations(self) -> list[Span]:
+        """Retorna as operações lentas mais recentes, da mais nova para a mais antiga."""
+
+        with self._lock:
+            return list(reversed(self.slow))
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Monta o documento de trace do Chrome com um evento completo (``ph: X``) por medição."""
+
+        with self._lock:
+            spans = list(self.trace)
+        pid = os.getpid()
+        return {
+            "displayTimeUnit": "ms",
+            "traceEvents": [
+                {
+                    "name": span.name,
+                    "cat": span.name.split(".", 1)[0],
+                    "ph": "X",
+                    "ts": round(span.start * 1_000_000, 3),
+                    "dur": round(span.duration * 1_000_000, 3),
+                    "pid": pid,
+                    "tid": span.thread_id,
+                }
+                for span in spans
+            ],
+        }
+
+    def export_chrome_trace(self, path: Path) -> None:
+        """Grava o trace do Chrome em ``path``."""
+
+        path.write_text(json.dumps(self.chrome_trace(), ensure_ascii=False), encoding="utf-8")
+
+
+class ImportTime(NamedTuple):
+    """Custo de importação de um módulo, em microssegundos, próprio e somado ao dos módulos que ele importa."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_import_times(report: str) -> list[ImportTime]:
+    """Interpreta as linhas ``import time: próprio | acumulado | módulo`` emitidas por ``-X importtime``."""
+
+    times: list[ImportTime] = []
+    for line in report.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        times.append(ImportTime(fields[2].strip(), int(fields[0]), int(fields[1])))
+    return times
+
+
+def import_times(statement: str, cwd: Path | None = None) -> list[ImportTime]:
+    """Executa ``statement`` em um interpretador novo com ``-X importtime`` e devolve o custo de cada módulo."""
+
+    import subprocess
+
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_import_times(completed.stderr)
+
+
+profiler = Profiler()
+
+
+def profiled(name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decora uma função para registrar sua duração no perfilador global quando ele estiver ativo."""
+
+    def decorator(function: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(function)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not profiler.enabled:
+                return function(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                profiler.record(name, started, time.perf_counter() - started)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,261 @@
+"""Detecção de mudanças de cena para sugerir os limites dos capítulos.
+
+O vídeo é dividido em intervalos de tempo decodificados em paralelo, um processo por intervalo. Cada processo abre
+um player libVLC sem janela nem áudio, limitado ao intervalo por ``:start-time``/``:stop-time`` e acelerado com
+``set_rate``, que entrega quadros de 32 x 18 pixels a um buffer próprio (``video_set_callbacks``) e guarda um a cada
+``SAMPLE_MS`` em tons de cinza. As pontuações, que combinam a diferença média absoluta entre quadros vizinhos com a
+diferença de seus histogramas, são calculadas de uma vez com NumPy e guardadas ao lado do vídeo (``.scenes``): mudar o
+limiar apenas filtra a trilha de pontuações, sem decodificar de novo.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import multiprocessing
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable
+from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
+from typing import Any, NamedTuple
+
+import numpy as np
+import vlc
+
+FRAME_WIDTH = 32
+FRAME_HEIGHT = 18
+SAMPLE_MS = 250
+DECODE_RATE = 4.0
+DECODE_POLL_S = 0.1
+HISTOGRAM_BINS = 16
+DEFAULT_THRESHOLD = 0.3
+MIN_SCENE_MS = 2_000
+DECODER_OPTIONS = ("--no-audio", "--no-spu", "--no-osd", "--no-video-title-show", "--avcodec-threads=1", "--quiet")
+
+
+class SceneTrack(NamedTuple):
+    """Pontuação de mudança de cena de cada quadro amostrado, de 0 (idêntico ao anterior) a 1."""
+
+    times_ms: np.ndarray
+    scores: np.ndarray
+
+
+def scenes_path(video_path: str) -> str:
+    """Retorna o caminho da trilha de pontuações guardada ao lado do vídeo."""
+
+    return os.path.splitext(video_path)[0] + ".scenes"
+
+
+_worker_stop: Any = None
+"""Evento de interrupção recebido por cada processo decodificador na sua criação."""
+
+
+def _init_worker(stop: Any) -> None:
+    """Guarda no processo decodificador o evento que interrompe a análise."""
+
+    global _worker_stop
+    _worker_stop = stop
+
+
+def decode_range(
+    video_path: str, start_ms: int, end_ms: int, stop: Any = None, create_instance: Any = vlc.Instance
+) -> tuple[np.ndarray, np.ndarray]:
+    """Decodifica ``[start_ms, end_ms)`` e retorna os instantes e os quadros amostrados em tons de cinza.
+
+    Executado em um processo próprio; as chamadas de quadro vêm da thread de vídeo da libVLC. A decodificação para
+    assim que ``stop`` (por padrão, o evento do processo decodificador) for sinalizado.
+    """
+
+    stop = _worker_stop if stop is None else stop
+
+    frame_bytes = FRAME_WIDTH * FRAME_HEIGHT * 4
+    buffer = ctypes.create_string_buffer(frame_bytes + 32)
+    address = ctypes.addressof(buffer) + (-ctypes.addressof(buffer) % 32)
+    frames: list[bytes] = []
+    times: list[int] = []
+    next_time = [start_ms]
+
+    try:
+        instance = create_instance(*DECODER_OPTIONS)
+    except NameError as exc:  # o python-vlc sinaliza assim a falta da biblioteca libVLC
+        raise OSError(f"A libVLC não está disponível: {exc}") from exc
+    if instance is None:
+        raise OSError("A libVLC não pôde ser iniciada")
+    media = instance.media_new(video_path)
+    media.add_option(f":start-time={start_ms / 1000:.3f}")
+    media.add_option(f":stop-time={end_ms / 1000:.3f}")
+    player = instance.media_player_new()
+    player.set_media(media)
+
+    def lock(_opaque: Any, planes: Any) -> None:
+        planes[0] = address
+
+    def unlock(_opaque: Any, _picture: Any, _planes: Any) -> None:
+        pass
+
+    def display(_opaque: Any, _picture: Any) -> None:
+        now = player.get_time()
+        if start_ms <= now < end_ms and now >= next_time[0]:
+            frames.append(ctypes.string_at(address, frame_bytes))
+            times.append(now)
+            next_time[0] = now + SAMPLE_MS
+
+    callbacks = (
+        vlc.CallbackDecorators.VideoLockCb(lock),
+        vlc.CallbackDecorators.VideoUnlockCb(unlock),
+        vlc.CallbackDecorators.VideoDisplayCb(display),
+    )
+    player.video_set_callbacks(*callbacks, None)
+    player.video_set_format("RV32", FRAME_WIDTH, FRAME_HEIGHT, FRAME_WIDTH * 4)
+    try:
+        player.play()
+        player.set_rate(DECODE_RATE)
+        while player.get_state() not in (vlc.State.Ended, vlc.State.Error, vlc.State.Stopped):
+            if stop is not None and stop.is_set():
+                break
+            time.sleep(DECODE_POLL_S)
+    finally:
+        player.stop()
+        player.release()
+        media.release()
+        instance.release()
+    pixels = np.frombuffer(b"".join(frames), dtype=np.uint8).reshape(-1, FRAME_HEIGHT, FRAME_WIDTH, 4)
+    gray = pixels[..., 2] * 0.299 + pixels[..., 1] * 0.587 + pixels[..., 0] * 0.114
+    return np.array(times, dtype=np.int64), gray.astype(np.uint8)
+
+
+def scene_scores(frames: np.ndarray) -> np.ndarray:
+    """Pontua cada quadro pela mudança em relação ao anterior; o primeiro recebe zero.
+
+    A pontuação é a média entre a diferença absoluta média dos pixels e a distância entre os histogramas de
+    ``HISTOGRAM_BINS`` faixas, ambas normalizadas de 0 a 1.
+    """
+
+    count = len(frames)
+    if count < 2:
+        return np.zeros(count, dtype=np.float32)
+    flat = frames.reshape(count, -1)
+    difference = np.abs(np.diff(flat.astype(np.int16), axis=0)).mean(axis=1) / 255
+    bins = (flat // (256 // HISTOGRAM_BINS)).astype(np.int64)
+    offsets = (np.arange(count)[:, None] * HISTOGRAM_BINS + bins).ravel()
+    histograms = np.bincount(offsets, minlength=count * HISTOGRAM_BINS).reshape(count, HISTOGRAM_BINS)
+    histograms = histograms / flat.shape[1]
+    distance = np.abs(np.diff(histograms, axis=0)).sum(axis=1) / 2
+    return np.concatenate(([0.0], (difference + distance) / 2)).astype(np.float32)
+
+
+def scene_boundaries(track: SceneTrack, threshold: float, min_scene_ms: int = MIN_SCENE_MS) -> list[int]:
+    """Escolhe os instantes de mudança de cena acima de ``threshold``, dos mais fortes aos mais fracos.
+
+    Um candidato é descartado se ficar a menos de ``min_scene_ms`` de outro já escolhido ou do início do vídeo.
+    """
+
+    candidates = np.flatnonzero((track.scores >= threshold) & (track.times_ms >= min_scene_ms))
+    ordered = candidates[np.argsort(-track.scores[candidates], kind="stable")]
+    # ``chosen`` fica em ordem, e só os vizinhos de cada candidato podem estar a menos de ``min_scene_ms``.
+    chosen: list[int] = []
+    for moment in track.times_ms[ordered].tolist():
+        position = bisect_left(chosen, moment)
+        if position and moment - chosen[position - 1] < min_scene_ms:
+            continue
+        if position < len(chosen) and chosen[position] - moment < min_scene_ms:
+            continue
+        chosen.insert(position, moment)
+    return chosen
+
+
+def split_ranges(duration_ms: int, parts: int) -> list[tuple[int, int]]:
+    """Divide a duração em ``parts`` intervalos contíguos alinhados ao intervalo de amostragem."""
+
+    step = -(-duration_ms // max(1, parts) // SAMPLE_MS) * SAMPLE_MS or SAMPLE_MS
+    return [(start, min(duration_ms, start + step)) for start in range(0, duration_ms, step)]
+
+
+def analyze_scenes(
+    video_path: str,
+    duration_ms: int,
+    stop: threading.Event,
+    workers: int = min(4, os.cpu_count() or 1),
+    decode: Callable[..., tuple[np.ndarray, np.ndarray]] = decode_range,
+) -> SceneTrack | None:
+    """Decodifica os intervalos em paralelo, junta os quadros em ordem e calcula as pontuações.
+
+    Com ``workers`` igual a 1 os intervalos são decodificados no próprio processo; caso contrário os processos são
+    iniciados por ``spawn``, pois um ``fork`` herdaria as threads do Tk e da libVLC da interface. Retorna ``None`` se
+    ``stop`` for sinalizado; os intervalos que ainda não começaram são cancelados e os em andamento são interrompidos.
+    """
+
+    ranges = split_ranges(duration_ms, workers)
+    results: list[tuple[np.ndarray, np.ndarray]] = []
+    if workers <= 1:
+        for start, end in ranges:
+            if stop.is_set():
+                return None
+            results.append(decode(video_path, start, end, stop))
+    else:
+        context = multiprocessing.get_context("spawn")
+        worker_stop = context.Event()
+        executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=context, initializer=_init_worker, initargs=(worker_stop,)
+        )
+        try:
+            futures = [executor.submit(decode, video_path, start, end) for start, end in ranges]
+            while True:
+                done, pending = wait(futures, timeout=DECODE_POLL_S, return_when=FIRST_EXCEPTION)
+                if stop.is_set():
+                    return None
+                if not pending or any(future.exception() for future in done):
+                    break
+            results = [future.result() for future in futures]
+        finally:
+            # Sem o evento, os processos que já decodificam seguiriam até o fim do intervalo, e o encerramento do
+            # interpretador esperaria por eles. Com ele, a espera abaixo dura no máximo um passo de DECODE_POLL_S
+            # (ou a partida de um processo ainda em criação, que precisa do evento vivo para recebê-lo).
+            worker_stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+    if stop.is_set():
+        return None
+    empty = (np.zeros(0, dtype=np.int64), np.zeros((0, FRAME_HEIGHT, FRAME_WIDTH), dtype=np.uint8))
+    times = np.concatenate([times for times, _ in results] or [empty[0]])
+    frames = np.concatenate([frames for _, frames in results] or [empty[1]])
+    return SceneTrack(times, scene_scores(frames))
+
+
+def load_scene_track(
+    video_path: str,
+    duration_ms: int,
+    stop: threading.Event,
+    analyze: Callable[[str, int, threading.Event], SceneTrack | None] = analyze_scenes,
+) -> SceneTrack | None:
+    """Lê a trilha guardada se for mais nova que o vídeo; caso contrário, analisa o vídeo e a grava.
+
+    Retorna ``None`` se ``stop`` interromper a análise.
+    """
+
+    path = scenes_path(video_path)
+    try:
+        if os.stat(path).st_mtime_ns >= os.stat(video_path).st_mtime_ns:
+            with np.load(path) as stored:
+                return SceneTrack(stored["times_ms"], stored["scores"])
+    except (OSError, ValueError, KeyError):
+        pass
+    track = analyze(video_path, duration_ms, stop)
+    if track is None:
+        return None
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as file_handle:
+        np.savez(file_handle, times_ms=track.times_ms, scores=track.scores)
+    os.replace(temporary, path)
+    return track
+
+
+def chapters_from_boundaries(boundaries: list[int], duration_ms: int) -> list[dict]:
+    """Converte os limites em capítulos de segundos inteiros, cada um terminando onde o seguinte começa."""
+
+    starts = sorted({0, *(moment // 1000 for moment in boundaries)})
+    ends = [*starts[1:], max(starts[-1], -(-duration_ms // 1000))]
+    return [
+        {"title": f"Cena {number}", "start": start, "end": end, "subs": []}
+        for number, (start, end) in enumerate(zip(starts, ends), start=1)
+    ]
@@ -0,0 +1,218 @@
+"""Índice persistente de sessões: vídeos recentes, pastas vigiadas e resumos dos arquivos auxiliares.
+
+O índice é um pequeno banco SQLite ao lado do ``config.json``. Para cada vídeo ele guarda duração, quantidade de
+capítulos, legendas e imagens e as datas de modificação do ``.chp`` e do ``.srt`` usadas no resumo; a atualização só
+relê os arquivos cujas datas mudaram, de modo que a abertura rápida lista centenas de projetos sem abrir cada ``.chp``.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import NamedTuple
+
+from logic import VIDEO_EXTENSIONS
+
+SESSION_INDEX_NAME = "sessoes.db"
+
+SESSION_MIGRATIONS: tuple[tuple[str, ...], ...] = (
+    # 1: vídeos com resumo em cache e pastas vigiadas.
+    (
+        """CREATE TABLE IF NOT EXISTS videos (
+            path TEXT PRIMARY KEY, opened_at REAL, duration_ms INTEGER,
+            chapters INTEGER, cues INTEGER, images INTEGER, chp_mtime INTEGER, srt_mtime INTEGER
+        )""",
+        "CREATE INDEX IF NOT EXISTS videos_opened_at ON videos(opened_at)",
+        "CREATE TABLE IF NOT EXISTS folders (path TEXT PRIMARY KEY, added_at REAL NOT NULL)",
+    ),
+)
+"""Migrações ordenadas do índice; o arquivo registra em ``PRAGMA user_version`` quantas já aplicou."""
+
+
+class VideoSummary(NamedTuple):
+    """Resumo em cache de um vídeo; contagens ``None`` indicam arquivo auxiliar ilegível."""
+
+    path: str
+    opened_at: float | None
+    duration_ms: int | None
+    chapters: int | None
+    cues: int | None
+    images: int | None
+
+
+def _mtime(path: str) -> int | None:
+    """Retorna a data de modificação em nanossegundos, ou ``None`` se o arquivo não existir."""
+
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _count_chp(chp_path: str) -> tuple[int | None, int | None]:
+    """Conta capítulos e imagens do ``.chp`` em modo somente leitura, sem carregar os registros."""
+
+    try:
+        with closing(sqlite3.connect(f"{Path(chp_path).as_uri()}?mode=ro", uri=True)) as connection:
+            chapters = connection.execute("SELECT count(*) FROM chapters").fetchone()[0]
+            images = connection.execute("SELECT count(*) FROM images").fetchone()[0]
+    except (OSError, sqlite3.DatabaseError):
+        return None, None
+    return chapters, images
+
+
+def _count_cues(srt_path: str) -> int | None:
+    """Conta as linhas de tempo do ``.srt`` sem interpretar os blocos."""
+
+    try:
+        with open(srt_path, encoding="utf-8-sig") as handle:
+            return sum(1 for line in handle if "-->" in line)
+    except (OSError, UnicodeError):
+        return None
+
+
+class SessionIndex:
+    """Mantém o índice de sessões; cada operação abre e fecha sua própria conexão."""
+
+    def __init__(self, path: Path) -> None:
+        """Define o arquivo do índice, criado na primeira gravação."""
+
+        self.path = Path(path)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Abre o índice aplicando as migrações ausentes."""
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        try:
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if version > len(SESSION_MIGRATIONS):
+                raise sqlite3.DatabaseError(
+                    f"o índice usa a versão {version}, mais recente que a suportada ({len(SESSION_MIGRATIONS)})"
+                )
+            if version < len(SESSION_MIGRATIONS):
+                with connection:
+                    for statements in SESSION_MIGRATIONS[version:]:
+                        for statement in statements:
+                            connection.execute(statement)
+                    connection.execute(f"PRAGMA user_version = {len(SESSION_MIGRATIONS)}")
+        except BaseException:
+            connection.close()
+            raise
+        return connection
+
+    @staticmethod
+    def _summary_row(video_path: str) -> tuple[int | None, int | None, int | None, int | None, int | None]:
+        """Lê contagens e datas dos arquivos auxiliares de um vídeo."""
+
+        base_path = os.path.splitext(video_path)[0]
+        chp_mtime = _mtime(base_path + ".chp")
+        srt_mtime = _mtime(base_path + ".srt")
+        chapters, images = _count_chp(base_path + ".chp") if chp_mtime is not None else (0, 0)
+        cues = _count_cues(base_path + ".srt") if srt_mtime is not None else 0
+        return chapters, cues, images, chp_mtime, srt_mtime
+
+    def record_open(self, video_path: str) -> None:
+        """Registra a abertura do vídeo e atualiza seu resumo."""
+
+        video_path = os.path.abspath(video_path)
+        row = self._summary_row(video_path)
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                """INSERT INTO videos (path, opened_at, chapters, cues, images, chp_mtime, srt_mtime)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(path) DO UPDATE SET opened_at = excluded.opened_at, chapters = excluded.chapters,
+                    cues = excluded.cues, images = excluded.images, chp_mtime = excluded.chp_mtime,
+                    srt_mtime = excluded.srt_mtime""",
+                (video_path, time.time(), *row),
+            )
+
+    def record_duration(self, video_path: str, duration_ms: int) -> None:
+        """Guarda a duração informada pelo player, ignorando valores desconhecidos."""
+
+        if duration_ms <= 0:
+            return
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "UPDATE videos SET duration_ms = ? WHERE path = ?", (duration_ms, os.path.abspath(video_path))
+            )
+
+    def add_folder(self, folder: str) -> None:
+        """Passa a vigiar a pasta; seus vídeos entram no índice na próxima atualização."""
+
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR IGNORE INTO folders (path, added_at) VALUES (?, ?)", (os.path.abspath(folder), time.time())
+            )
+
+    def remove_folder(self, folder: str) -> None:
+        """Deixa de vigiar a pasta e remove os vídeos dela que nunca foram abertos."""
+
+        folder = os.path.abspath(folder)
+        with closing(self._connect()) as connection, connection:
+            connection.execute("DELETE FROM folders WHERE path = ?", (folder,))
+            paths = connection.execute("SELECT path FROM videos WHERE opened_at IS NULL").fetchall()
+            connection.executemany(
+                "DELETE FROM videos WHERE path = ?", [row for row in paths if os.path.dirname(row[0]) == folder]
+            )
+
+    def folders(self) -> list[str]:
+        """Retorna as pastas vigiadas em ordem de inclusão."""
+
+        with closing(self._connect()) as connection:
+            return [row[0] for row in connection.execute("SELECT path FROM folders ORDER BY added_at")]
+
+    def refresh(self) -> int:
+        """Atualiza o índice de forma incremental e retorna quantos vídeos tiveram o resumo relido.
+
+        Vídeos novos das pastas vigiadas são incluídos, vídeos apagados são removidos e apenas os vídeos cujo ``.chp``
+        ou ``.srt`` mudou de data são resumidos outra vez.
+        """
+
+        with closing(self._connect()) as connection:
+            known = {
+                row[0]: (row[1], row[2]) for row in connection.execute("SELECT path, chp_mtime, srt_mtime FROM videos")
+            }
+            folders = [row[0] for row in connection.execute("SELECT path FROM folders")]
+        candidates = dict.fromkeys(known)
+        for folder in folders:
+            try:
+                entries = list(os.scandir(folder))
+            except OSError:
+                continue
+            for entry in entries:
+                if Path(entry.name).suffix.lower() in VIDEO_EXTENSIONS and entry.is_file():
+                    candidates.setdefault(entry.path)
+
+        removed: list[tuple[str]] = []
+        updated: list[tuple] = []
+        for video_path in candidates:
+            if not os.path.isfile(video_path):
+                removed.append((video_path,))
+                continue
+            base_path = os.path.splitext(video_path)[0]
+            stamps = (_mtime(base_path + ".chp"), _mtime(base_path + ".srt"))
+            if known.get(video_path) == stamps:
+                continue
+            updated.append((video_path, *self._summary_row(video_path)))
+
+        with closing(self._connect()) as connection, connection:
+            connection.executemany("DELETE FROM videos WHERE path = ?", removed)
+            connection.executemany(
+                """INSERT INTO videos (path, chapters, cues, images, chp_mtime, srt_mtime) VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(path) DO UPDATE SET chapters = excluded.chapters, cues = excluded.cues,
+                    images = excluded.images, chp_mtime = excluded.chp_mtime, srt_mtime = excluded.srt_mtime""",
+                updated,
+            )
+        return len(updated)
+
+    def summaries(self) -> list[VideoSummary]:
+        """Retorna os resumos em cache, com os recentes primeiro e os demais por caminho."""
+
+        with closing(self._connect()) as connection:
+            rows = connection.execute("""SELECT path, opened_at, duration_ms, chapters, cues, images FROM videos
+                ORDER BY opened_at IS NULL, opened_at DESC, path""").fetchall()
+        return [VideoSummary(*row) for row in rows]
@@ -0,0 +1,139 @@
+"""Detecção de fala por energia e cruzamentos por zero sobre o envelope de áudio já calculado.
+
+Cada janela de 5 ms do primeiro nível do envelope (``waveform``) é classificada de uma vez com NumPy: é fala quando
+a energia passa em uma margem do ruído de fundo estimado, ou quando fica um pouco abaixo disso mas tem muitos
+cruzamentos por zero, como nas consoantes surdas. Pausas curtas são preenchidas, trechos curtos demais são
+descartados e trechos longos são divididos no ponto mais silencioso. O resultado é usado para criar legendas vazias
+nos trechos de fala ou para aproximar das pausas as bordas das legendas existentes.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from waveform import BIN_MS, CHANNELS, Envelope
+
+SPEECH_MARGIN_DB = 12.0
+UNVOICED_MARGIN_DB = 6.0
+NOISE_PERCENTILE = 10
+MIN_LEVEL_DB = -55.0
+ZCR_MIN = 0.15
+MIN_SPEECH_MS = 250
+MIN_PAUSE_MS = 300
+MAX_CUE_MS = 7_000
+SNAP_MS = 400
+
+
+def _decibels(rms: np.ndarray) -> np.ndarray:
+    """Converte RMS de 0 a 1 em dBFS, limitando o silêncio absoluto a -100 dB."""
+
+    return 20 * np.log10(np.maximum(rms, 1e-5))
+
+
+def speech_mask(rms: np.ndarray, crossings: np.ndarray) -> np.ndarray:
+    """Classifica cada janela como fala ou silêncio com limiares relativos ao ruído de fundo."""
+
+    decibels = _decibels(rms)
+    if not len(decibels):
+        return np.zeros(0, dtype=bool)
+    threshold = max(float(np.percentile(decibels, NOISE_PERCENTILE)) + SPEECH_MARGIN_DB, MIN_LEVEL_DB)
+    unvoiced = (decibels >= threshold - UNVOICED_MARGIN_DB) & (crossings >= ZCR_MIN)
+    return (decibels >= threshold) | unvoiced
+
+
+def _runs(mask: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Retorna o início e o fim (exclusivo) de cada sequência de ``True``."""
+
+    changes = np.flatnonzero(np.diff(np.concatenate(([False], mask, [False])).astype(np.int8)))
+    return changes[0::2], changes[1::2]
+
+
+def speech_segments(envelope: Envelope) -> list[tuple[int, int]]:
+    """Detecta os trechos de fala, em milissegundos, no primeiro nível do envelope."""
+
+    level = np.asarray(envelope.level(0), dtype=np.float32)
+    if not len(level):
+        return []
+    rms, crossings = level[:, CHANNELS.index("rms")], level[:, CHANNELS.index("zcr")]
+    starts, ends = _runs(speech_mask(rms, crossings))
+    if not len(starts):
+        return []
+    long_pauses = (starts[1:] - ends[:-1]) * BIN_MS >= MIN_PAUSE_MS
+    starts = starts[np.concatenate(([True], long_pauses))]
+    ends = ends[np.concatenate((long_pauses, [True]))]
+    long_enough = (ends - starts) * BIN_MS >= MIN_SPEECH_MS
+    decibels = _decibels(rms)
+    max_bins = MAX_CUE_MS // BIN_MS
+    segments: list[tuple[int, int]] = []
+    pending = list(zip(starts[long_enough].tolist(), ends[long_enough].tolist()))
+    while pending:
+        start, end = pending.pop()
+        if end - start <= max_bins:
+            segments.append((start * BIN_MS, end * BIN_MS))
+            continue
+        third = (end - start) // 3
+        cut = start + third + int(np.argmin(decibels[start + third : end - third]))
+        pending.extend(((start, cut), (cut, end)))
+    segments.sort()
+    return segments
+
+
+def cue_skeletons(segments: list[tuple[int, int]], subtitles: list[dict]) -> list[dict]:
+    """Cria legendas vazias para os trechos de fala que não se sobrepõem a nenhuma legenda existente."""
+
+    if not segments:
+        return []
+    bounds = np.array(segments, dtype=np.int64).reshape(-1, 2)
+    if subtitles:
+        cues = np.array(sorted((sub["start"], sub["end"]) for sub in subtitles), dtype=np.int64)
+        latest_end = np.maximum.accumulate(cues[:, 1])
+        before = np.searchsorted(cues[:, 0], bounds[:, 1], side="left")
+        covered = (before > 0) & (latest_end[np.maximum(before - 1, 0)] > bounds[:, 0])
+        bounds = bounds[~covered]
+    return [{"start": start, "end": end, "text": ""} for start, end in bounds.tolist()]
+
+
+def _nearest(targets: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Retorna, para cada valor, o alvo mais próximo em ``targets`` ordenado."""
+
+    right = np.clip(np.searchsorted(targets, values), 0, len(targets) - 1)
+    left = np.maximum(right - 1, 0)
+    closer_left = np.abs(targets[left] - values) <= np.abs(targets[right] - values)
+    return np.where(closer_left, targets[left], targets[right])
+
+
+def snap_cues(subtitles: list[dict], segments: list[tuple[int, int]]) -> int:
+    """Aproxima início e fim de cada legenda da borda de fala mais próxima, até ``SNAP_MS``.
+
+    As legendas são alteradas no lugar, sem criar sobreposições: o fim não passa do início original da legenda
+    seguinte e o início não recua para antes do fim da anterior. A que ficaria com fim antes do início é mantida.
+    Retorna quantas mudaram.
+    """
+
+    if not subtitles or not segments:
+        return 0
+    bounds = np.array(segments, dtype=np.int64)
+    cues = np.array([(sub["start"], sub["end"]) for sub in subtitles], dtype=np.int64)
+    starts = _nearest(bounds[:, 0], cues[:, 0])
+    ends = _nearest(bounds[:, 1], cues[:, 1])
+    starts = np.where(np.abs(starts - cues[:, 0]) <= SNAP_MS, starts, cues[:, 0]).tolist()
+    ends = np.where(np.abs(ends - cues[:, 1]) <= SNAP_MS, ends, cues[:, 1]).tolist()
+    order = np.argsort(cues[:, 0], kind="stable").tolist()
+    originals = cues.tolist()
+
+    changed = 0
+    latest_end: int | None = None
+    for position, index in enumerate(order):
+        original_start, original_end = originals[index]
+        start, end = starts[index], ends[index]
+        if latest_end is not None:
+            start = max(start, min(latest_end, original_start))
+        if position + 1 < len(order):
+            end = min(end, max(originals[order[position + 1]][0], original_end))
+        if end <= start:
+            start, end = original_start, original_end
+        if (start, end) != (original_start, original_end):
+            subtitles[index]["start"], subtitles[index]["end"] = start, end
+            changed += 1
+        latest_end = end if latest_end is None else max(latest_end, end)
+    return changed
@@ -6,6 +6,34 @@ from collections.abc import Iterator
 import pytest
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Registra a opção que habilita os benchmarks da interface e define o relatório JSON."""
+
+    parser.addoption(
+        "--gui-benchmark",
+        metavar="ARQUIVO",
+        default=None,
+        help="executa os benchmarks da interface e grava os resultados neste arquivo JSON",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Declara o marcador dos benchmarks da interface."""
+
+    config.addinivalue_line("markers", "gui_benchmark: benchmark da interface, habilitado por --gui-benchmark")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Ignora os benchmarks da interface antes que qualquer fixture, como a raiz Tk, seja criada."""
+
+    if config.getoption("--gui-benchmark"):
+        return
+    skip = pytest.mark.skip(reason="benchmarks da interface desativados; use --gui-benchmark=ARQUIVO")
+    for item in items:
+        if "gui_benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
 @pytest.fixture(scope="session")
 def tk_root() -> Iterator[tk.Tk]:
     """Mantém uma única raiz Tk durante a sessão para evitar falhas intermitentes no Windows."""
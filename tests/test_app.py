@@ -1,6 +1,9 @@
 """Testes para verificações auxiliares do app.py."""
 
+import subprocess
+import sys
 import tkinter as tk
+from pathlib import Path
 from unittest.mock import Mock
 
 from app import AboutDialog, check_vlc_installed, replace_editor, reveal_in_explorer
@@ -12,6 +15,26 @@ def test_check_vlc_installed_returns_bool() -> None:
     assert isinstance(result, bool)
 
 
+def test_inicializacao_nao_importa_pillow() -> None:
+    """Os módulos que dependem do Pillow só são importados quando uma janela de imagem é aberta."""
+
+    statement = "import sys, app, gui; sys.exit('PIL' in sys.modules)"
+    completed = subprocess.run(
+        [sys.executable, "-c", statement], cwd=Path(__file__).resolve().parent.parent, check=False
+    )
+    assert completed.returncode == 0
+
+
+def test_importar_app_adia_indice_e_multiprocessamento() -> None:
+    """O índice de sessões e o ``multiprocessing`` só são importados quando ``main`` precisa deles."""
+
+    statement = "import sys, app; sys.exit('session_index' in sys.modules or 'multiprocessing' in sys.modules)"
+    completed = subprocess.run(
+        [sys.executable, "-c", statement], cwd=Path(__file__).resolve().parent.parent, check=False
+    )
+    assert completed.returncode == 0
+
+
 def test_reveal_in_explorer_nonexistent_file() -> None:
     """Testa se reveal_in_explorer lida com arquivo inexistente sem lançar exceção."""
     reveal_in_explorer("non_existent_file.mp4")
@@ -0,0 +1,51 @@
+"""Testes dos geradores e da comparação com a linha de base dos benchmarks."""
+
+from pathlib import Path
+
+from benchmarks.generators import chapter_tree, count_chapters, image_set, write_srt
+from benchmarks.harness import BenchmarkResult, compare, measure, report
+from logic import ChapterManager, SubtitleManager
+
+
+def test_geradores_produzem_dados_aceitos_pelos_gerenciadores(tmp_path: Path) -> None:
+    """Garante que os benchmarks meçam arquivos válidos, e não caminhos de erro."""
+
+    manager = SubtitleManager(str(tmp_path / "video.mp4"))
+    write_srt(Path(manager.srt_path), 25)
+    assert len(manager.load()) == 25
+
+    chapters = chapter_tree(depth=3, breadth=4)
+    assert count_chapters(chapters) == 4 + 16 + 64
+    images = image_set(2, 1_000)
+    chapter_manager = ChapterManager(str(tmp_path / "video.mp4"))
+    chapter_manager.save(chapters, [], [], images)
+    loaded = chapter_manager.load()
+    assert count_chapters(loaded["chapters"]) == 84
+    assert [len(image["data"]) for image in loaded["images"]] == [1_000, 1_000]
+
+
+def test_measure_registra_tempos_e_pico_de_memoria() -> None:
+    """Executa o preparo antes de cada medição e captura as alocações do caso."""
+
+    calls: list[str] = []
+
+    result = measure("caso", lambda: calls.append("run") or bytearray(1_000_000), lambda: calls.append("setup"), 3)
+
+    assert calls == ["setup", "run"] * 4
+    assert result.repeat == 3
+    assert result.best_seconds <= result.median_seconds
+    assert result.peak_bytes >= 1_000_000
+
+
+def test_compare_aponta_apenas_casos_acima_do_limite() -> None:
+    """Ignora variações toleradas e casos sem correspondente na linha de base."""
+
+    baseline = report([BenchmarkResult("a", 1.0, 1.0, 0, 1), BenchmarkResult("b", 1.0, 1.0, 0, 1)])
+    current = report(
+        [BenchmarkResult("a", 1.2, 1.2, 0, 1), BenchmarkResult("b", 1.4, 1.4, 0, 1), BenchmarkResult("c", 9, 9, 0, 1)]
+    )
+
+    regressions = compare(current, baseline, threshold=0.25)
+
+    assert [regression.name for regression in regressions] == ["b"]
+    assert regressions[0].ratio == 1.4
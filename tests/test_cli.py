@@ -0,0 +1,86 @@
+"""Testes da validação em lote dos arquivos auxiliares pela linha de comando."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+import cli
+from logic import ChapterManager, SubtitleManager
+
+
+def _library(root: Path) -> None:
+    """Cria uma biblioteca com um par válido, uma legenda sem ``.chp`` e um ``.chp`` ilegível."""
+
+    season = root / "temporada.1"
+    season.mkdir()
+    ChapterManager(str(season / "ep.1.mp4")).save([{"title": "Abertura", "start": 0, "end": 30}], [])
+    SubtitleManager(str(season / "ep.1.mp4")).save([{"start": 0, "end": 900, "text": "Olá"}])
+    SubtitleManager(str(root / "extra.mkv")).save([{"start": 0, "end": 10, "text": "a"}])
+    (root / "quebrado.chp").write_bytes(b"isto nao e sqlite")
+
+
+def test_encontra_um_arquivo_auxiliar_por_video(tmp_path: Path) -> None:
+    """``.chp`` e ``.srt`` do mesmo vídeo contam uma só vez, inclusive com pontos no nome."""
+
+    _library(tmp_path)
+
+    sidecars = cli.find_sidecars([tmp_path])
+
+    assert [Path(path).relative_to(tmp_path).as_posix() for path in sidecars] == [
+        "extra.srt",
+        "quebrado.chp",
+        "temporada.1/ep.1.chp",
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_relatorio_e_codigo_de_saida(tmp_path: Path, capsys: pytest.CaptureFixture[str], workers: int) -> None:
+    """Arquivos ilegíveis aparecem no relatório e fazem o comando terminar com código 1."""
+
+    _library(tmp_path)
+
+    assert cli.main(["--workers", str(workers), str(tmp_path)]) == 1
+
+    output = capsys.readouterr().out
+    assert "1 capítulos, 1 legendas" in output
+    assert "ERRO: Não foi possível carregar" in output
+    assert "3 vídeos regravados" in output
+    assert "1 com erro, 1 ilegíveis" in output
+    assert not (tmp_path / "extra.chp").exists()
+
+
+def test_check_nao_regrava(tmp_path: Path) -> None:
+    """Com ``--check`` os arquivos válidos são apenas validados."""
+
+    video = str(tmp_path / "aula.mp4")
+    SubtitleManager(video).save([{"start": 0, "end": 10, "text": "a"}])
+    srt = tmp_path / "aula.srt"
+    modified = srt.stat().st_mtime_ns
+
+    assert cli.main(["--check", "--workers", "1", str(tmp_path)]) == 0
+    assert srt.stat().st_mtime_ns == modified
+    assert not (tmp_path / "aula.srt.bak").exists()
+
+
+def test_check_nao_migra_chp_de_versao_anterior(tmp_path: Path) -> None:
+    """Um ``.chp`` sem versão é validado em uma cópia na memória; bytes e data do arquivo não mudam."""
+
+    chp = tmp_path / "antigo.chp"
+    connection = sqlite3.connect(chp)
+    with connection:
+        connection.executescript("""
+            CREATE TABLE chapters (
+                id TEXT PRIMARY KEY, parent_id TEXT REFERENCES chapters(id) ON DELETE CASCADE,
+                position INTEGER NOT NULL, title TEXT NOT NULL, start INTEGER NOT NULL, end INTEGER NOT NULL
+            );
+            INSERT INTO chapters VALUES ('c1', NULL, 0, 'Antigo', 0, 10);
+            """)
+    connection.close()
+    content = chp.read_bytes()
+    modified = chp.stat().st_mtime_ns
+
+    assert cli.main(["--check", "--workers", "1", str(chp)]) == 0
+
+    assert chp.read_bytes() == content
+    assert chp.stat().st_mtime_ns == modified
@@ -44,11 +44,15 @@ def test_load_save_config(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> No
 def test_normalize_config_restaura_tipos_e_limites() -> None:
     """Garante que valores semanticamente inválidos retornem aos padrões."""
 
-    normalized = normalize_config({"update_ms": 0, "small_jump": "abc", "large_jump": -2, "volume": 200})
+    normalized = normalize_config(
+        {"update_ms": 0, "small_jump": "abc", "large_jump": -2, "volume": 200, "autosave_ms": 10, "snap_to_keyframe": 1}
+    )
     assert normalized["update_ms"] == 500
+    assert normalized["autosave_ms"] == 750
     assert normalized["small_jump"] == 5
     assert normalized["large_jump"] == 20
     assert normalized["volume"] == 100
+    assert normalized["snap_to_keyframe"] is False
 
 
 def test_load_config_corrompida_preserva_backup(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
@@ -1,6 +1,10 @@
 """Testes unitários para os componentes da interface gráfica (pacote gui)."""
 
+import threading
 import tkinter as tk
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from types import SimpleNamespace
 from unittest.mock import Mock
 
@@ -9,10 +13,17 @@ import pytest
 from gui import ChapterEditor, SettingsWindow
 from gui.add_item_dialog import AddItemDialog, FormField
 from gui.chapter_panel import ChapterPanel
+from gui.editor import JOURNAL_BATCH_MS, PRELOAD_DELAY_MS
 from gui.image_association_dialog import ImageAssociationDialog
 from gui.metadata_panel import MetadataPanel
 from gui.player_widget import PlayerWidget
+from gui.quick_open import QuickOpenDialog
+from gui.scene_dialog import SceneDialog
 from gui.settings_dialog import SettingsWindow as DirectSettingsWindow
+from gui.subtitle_overlay import SubtitleOverlay
+from gui.subtitle_panel import ALL_SUBTITLES, SubtitlePanel
+from logic import SubtitleChecker
+from mp4 import KeyframeIndex
 
 
 def _confirm_add_dialog(_, __, fields, on_submit):
@@ -118,6 +129,202 @@ def test_reconfigurar_atalhos_remove_bindings_anteriores() -> None:
     root.unbind.assert_called_once_with("<space>", "old_id")
 
 
+def _editor_com_salvamento_adiado() -> ChapterEditor:
+    """Monta um editor sem widgets reais, com gravações e agendamentos simulados."""
+
+    editor = object.__new__(ChapterEditor)
+    editor.dirty = set()
+    editor.autosave_ms = 750
+    editor.autosave_after = None
+    editor.focus_check_after = None
+    editor.journal = Mock()
+    editor.journal_after = None
+    editor.base_title = "Editor de Capítulos"
+    editor.after = Mock(side_effect=["after-1", "after-2", "after-3"])
+    editor.after_cancel = Mock()
+    editor.winfo_toplevel = Mock(return_value=Mock())
+    editor.save_data = Mock(return_value=True)
+    editor.save_subtitles = Mock(return_value=True)
+    editor.waveform = Mock()
+    editor.subtitle_overlay = Mock()
+    return editor
+
+
+def test_edicoes_reiniciam_o_salvamento_automatico() -> None:
+    """Várias edições seguidas resultam em uma única gravação do arquivo afetado."""
+
+    editor = _editor_com_salvamento_adiado()
+    title = editor.winfo_toplevel.return_value.title
+
+    editor.mark_chp_dirty()
+    editor.mark_chp_dirty()
+
+    assert [call.args[0] for call in editor.after.call_args_list] == [750, 750]
+    editor.after_cancel.assert_called_once_with("after-1")
+    editor.save_data.assert_not_called()
+    title.assert_called_with("Editor de Capítulos •")
+
+    assert editor.flush() is True
+
+    editor.save_data.assert_called_once_with()
+    editor.save_subtitles.assert_not_called()
+    editor.after_cancel.assert_called_with("after-2")
+    title.assert_called_with("Editor de Capítulos")
+    assert editor.dirty == set()
+
+
+def test_falha_ao_salvar_mantem_arquivo_pendente() -> None:
+    """Uma gravação recusada mantém o indicador e a pendência apenas do arquivo afetado."""
+
+    editor = _editor_com_salvamento_adiado()
+    editor.save_subtitles.return_value = False
+    editor.mark_chp_dirty()
+    editor.mark_srt_dirty()
+
+    assert editor.flush() is False
+
+    assert editor.dirty == {"srt"}
+    editor.winfo_toplevel.return_value.title.assert_called_with("Editor de Capítulos •")
+
+
+def test_descartar_evita_nova_tentativa_ao_fechar() -> None:
+    """Depois de o usuário aceitar o descarte, o fechamento do editor não tenta gravar nem avisa de novo."""
+
+    editor = _editor_com_salvamento_adiado()
+    editor.save_data.return_value = False
+    editor.mark_chp_dirty()
+    assert editor.flush() is False
+
+    editor.discard()
+
+    editor.journal.clear.assert_called_once_with()
+    editor.journal.write_staged.assert_called_once_with()
+    assert editor.dirty == set()
+    assert editor.flush() is True
+    editor.save_data.assert_called_once_with()
+    editor.winfo_toplevel.return_value.title.assert_called_with("Editor de Capítulos")
+
+
+def test_diario_invalido_nao_e_adotado_na_abertura() -> None:
+    """Seções recuperadas que o salvamento recusaria são ignoradas; as válidas substituem as carregadas."""
+
+    data = {"chapters": [], "casting": [], "metadata": [], "images": [], "subtitles": []}
+    chapters = [{"title": "Abertura", "start": 0, "end": 5, "subs": []}]
+    subtitles = [{"start": 0, "end": 500, "text": "Olá"}]
+
+    assert ChapterEditor._valid_recovery(data, {"chapters": chapters, "subtitles": subtitles}) == {
+        "chapters": chapters,
+        "subtitles": subtitles,
+    }
+    invalid = {"chapters": [{"title": "", "start": 0, "end": 5, "subs": []}], "subtitles": ["?"]}
+    assert ChapterEditor._valid_recovery(data, invalid) == {}
+    dangling = {"casting": [{"id": "c1", "name": "Ana", "images": ["sem-imagem"]}], "subtitles": subtitles}
+    assert ChapterEditor._valid_recovery(data, dangling) == {"subtitles": subtitles}
+
+
+def test_exportacao_copia_o_video_fora_da_thread_do_tk(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A cópia roda em uma thread auxiliar e o resultado é avisado pelo acompanhamento agendado com ``after``."""
+
+    threads: list[str] = []
+    monkeypatch.setattr("gui.editor.write_chapters", lambda *_: threads.append(threading.current_thread().name))
+    monkeypatch.setattr("gui.editor.filedialog.asksaveasfilename", Mock(return_value="/tmp/saida.mp4"))
+    messages = Mock()
+    messages.askyesnocancel.return_value = False
+    monkeypatch.setattr("gui.editor.messagebox", messages)
+    editor = _editor_com_salvamento_adiado()
+    editor.chaps = [{"title": "Abertura", "start": 0, "end": 5, "subs": []}]
+    editor.player_widget = SimpleNamespace(video_path="/tmp/aula.mp4")
+    editor.export_future = None
+
+    editor.export_container_chapters()
+    editor.export_future.result(timeout=5)
+    poll = editor.after.call_args.args[1]
+    poll()
+
+    assert threads and threads[0] != threading.current_thread().name
+    assert editor.export_future is None
+    messages.showinfo.assert_called_once()
+    editor.winfo_toplevel.return_value.config.assert_called_with(cursor="")
+
+
+def test_perda_de_foco_grava_somente_fora_do_aplicativo() -> None:
+    """A troca de foco entre widgets não grava; a saída da janela grava as pendências."""
+
+    editor = _editor_com_salvamento_adiado()
+    editor.dirty = {"chp"}
+    editor.flush = Mock()
+    editor.focus_get = Mock(return_value=Mock())
+
+    editor._flush_if_focus_lost()
+    editor.flush.assert_not_called()
+
+    editor.focus_get.return_value = None
+    editor._flush_if_focus_lost()
+    editor.flush.assert_called_once_with()
+
+
+def test_edicao_registra_secao_no_diario_em_lote() -> None:
+    """Edições seguidas agendam um único lote do diário e marcam o arquivo correspondente."""
+
+    editor = _editor_com_salvamento_adiado()
+    editor.subtitles = [{"start": 0, "end": 500, "text": "Olá"}]
+
+    editor.record_edit("subtitles")
+    editor.record_edit("subtitles")
+
+    assert editor.journal.stage.call_count == 2
+    editor.journal.stage.assert_called_with("subtitles", editor.subtitles)
+    assert editor.after.call_args_list[0].args == (JOURNAL_BATCH_MS, editor._write_journal)
+    assert editor.after.call_count == 3
+    assert editor.dirty == {"srt"}
+
+    assert editor.flush() is True
+    editor.journal.clear.assert_called_once_with()
+
+
+def test_falha_ao_salvar_preserva_diario() -> None:
+    """Sem salvamento completo, o lote pendente é gravado no diário em vez de descartado."""
+
+    editor = _editor_com_salvamento_adiado()
+    editor.save_data.return_value = False
+    editor.mark_chp_dirty()
+
+    assert editor.flush() is False
+
+    editor.journal.write_staged.assert_called_once_with()
+    editor.journal.clear.assert_not_called()
+
+
+def test_abas_criam_paineis_sob_demanda_e_pre_carregam_a_seguinte() -> None:
+    """Somente a aba exibida é criada de imediato; a próxima é preparada depois, uma única vez."""
+
+    editor = object.__new__(ChapterEditor)
+    built: list[str] = []
+    tabs = (".n.capitulos", ".n.legendas", ".n.casting")
+    editor.tab_builders = {tab: (lambda _, name=tab: built.append(name)) for tab in tabs}
+    editor.notebook = Mock()
+    editor.notebook.tabs.return_value = tabs
+    editor.notebook.select.return_value = ".n.capitulos"
+    editor.nametowidget = Mock(side_effect=lambda name: name)
+    editor.preload_after = None
+    editor.after = Mock(return_value="preload-1")
+
+    editor._show_current_tab()
+
+    assert built == [".n.capitulos"]
+    editor.after.assert_called_once_with(PRELOAD_DELAY_MS, editor._preload_next_tab)
+    editor._preload_next_tab()
+    assert built == [".n.capitulos", ".n.legendas"]
+
+    editor.notebook.select.return_value = ".n.legendas"
+    editor._show_current_tab()
+    editor._preload_next_tab()
+    editor._show_current_tab()
+    assert built == [".n.capitulos", ".n.legendas", ".n.casting"]
+    assert editor.tab_builders == {}
+    assert editor.after.call_count == 2
+
+
 def test_tempo_atual_do_player_nunca_e_negativo() -> None:
     """Normaliza o valor -1 retornado pelo VLC antes da mídia ficar pronta."""
 
@@ -129,6 +336,42 @@ def test_tempo_atual_do_player_nunca_e_negativo() -> None:
     assert player_widget.get_current_time_ms() == 0
 
 
+def test_capitulos_usam_quadros_chave(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Com inícios alinhados, o salto para no quadro-chave do mesmo segundo e a marcação recua até ele."""
+
+    monkeypatch.setattr("gui.player_widget.keyframe_index", lambda _: KeyframeIndex(array("q", [0, 4080, 10080])))
+    player_widget = object.__new__(PlayerWidget)
+    player_widget.video_path = "aula.mp4"
+    player_widget.app_config = {"snap_to_keyframe": False}
+    player_widget.player = Mock()
+    player_widget.player.get_time.return_value = 9_500
+    player_widget._set_bounded_time = Mock()
+
+    player_widget.seek_chapter(4)
+    assert player_widget.get_chapter_time_seconds() == 9
+    player_widget.app_config["snap_to_keyframe"] = True
+    player_widget.seek_chapter(4)
+    player_widget.seek_chapter(6)
+    assert [call.args[0] for call in player_widget._set_bounded_time.call_args_list] == [4000, 4080, 6000]
+    assert player_widget.get_chapter_time_seconds() == 4
+
+
+def test_dialogo_de_cenas_mostra_falha_de_processo_decodificador() -> None:
+    """Um decodificador encerrado à força vira uma mensagem no diálogo, sem escapar para o laço do Tk."""
+
+    dialog = object.__new__(SceneDialog)
+    dialog.status_var = Mock()
+    dialog.after = Mock()
+    future: Future = Future()
+    future.set_exception(BrokenProcessPool("processo encerrado"))
+    dialog.future = future
+
+    dialog._poll()
+
+    assert "decodificação" in dialog.status_var.set.call_args.args[0]
+    assert dialog.future is None and dialog.after_id is None
+
+
 def test_cancelar_incorporacao_pendente_do_player() -> None:
     """Evita que um callback atrasado tente usar um canvas já destruído."""
 
@@ -199,6 +442,27 @@ def test_adicionar_capitulo_cria_irmao_do_selecionado(monkeypatch: pytest.Monkey
     assert root_chapter["end"] == 28
 
 
+def test_ordenar_capitulos_em_cadeia_profunda_sem_recursao() -> None:
+    """Ordena irmãos em todos os níveis mesmo acima do limite de recursão do Python."""
+
+    root: list[dict] = []
+    siblings = root
+    for level in range(5_000):
+        later = {"title": "B", "start": level + 1, "end": level + 1, "subs": []}
+        earlier = {"title": "A", "start": level, "end": level, "subs": []}
+        siblings.extend([later, earlier])
+        siblings = earlier["subs"]
+    panel = object.__new__(ChapterPanel)
+    panel.chaps = root
+
+    panel._sort_chapters()
+
+    level_items = root
+    while level_items:
+        assert [chapter["title"] for chapter in level_items] == ["A", "B"]
+        level_items = level_items[0]["subs"]
+
+
 def test_adicionar_filho_transfere_valor_do_metadado(monkeypatch: pytest.MonkeyPatch) -> None:
     """Move o valor do pai para o novo filho, que permanece uma folha."""
 
@@ -256,3 +520,79 @@ def test_formulario_de_inclusao_foca_e_seleciona_primeiro_campo(tk_root: tk.Tk)
         dialog.destroy()
     finally:
         tk_root.withdraw()
+
+
+def test_letreiro_mostra_edicoes_sem_gravar_nem_recarregar_legenda() -> None:
+    """O texto ativo vai ao VLC só quando muda, e uma edição aparece sem ``add_slave``."""
+
+    widget = Mock()
+    widget.after.return_value = "tick"
+    player = Mock()
+    player.get_time.return_value = 1_500
+    subtitles = [{"start": 1_000, "end": 2_000, "text": "Olá"}]
+    overlay = SubtitleOverlay(widget, player, subtitles)
+
+    overlay.render()
+    overlay.render()
+    subtitles[0]["text"] = "Olá, mundo"
+    overlay.invalidate()
+    overlay.close()
+
+    texts = [call.args[1] for call in player.video_set_marquee_string.call_args_list]
+    assert texts == ["Olá", "Olá, mundo"]
+    player.add_slave.assert_not_called()
+    widget.after_cancel.assert_called_once_with("tick")
+
+
+def test_edicao_de_legenda_reescreve_so_as_linhas_afetadas() -> None:
+    """Mover uma legenda reposiciona a linha dela e reescreve apenas as linhas cujos problemas mudaram."""
+
+    subtitles = [{"start": index * 3_000, "end": index * 3_000 + 2_000, "text": f"L{index}"} for index in range(6)]
+    panel = object.__new__(SubtitlePanel)
+    panel.subtitles = subtitles
+    panel.checker = SubtitleChecker(subtitles)
+    panel.tree = Mock()
+    panel.filter_var = Mock(get=Mock(return_value=ALL_SUBTITLES))
+    panel.issues_lbl = Mock()
+    panel.row_ids = [f"I{index}" for index in range(6)]
+    panel.item_map = dict(zip(panel.row_ids, subtitles))
+
+    moved = subtitles[4]
+    moved["start"], moved["end"] = 3_500, 4_500
+    subtitles.sort(key=lambda item: item["start"])
+    panel.refresh_sub_tree(edited=moved)
+
+    panel.tree.delete.assert_not_called()
+    panel.tree.move.assert_called_once_with("I4", "", 2)
+    assert panel.row_ids == ["I0", "I1", "I4", "I2", "I3", "I5"]
+    rewritten = {call.args[0]: call.kwargs["tags"] for call in panel.tree.item.call_args_list}
+    assert rewritten == {"I1": ("overlap",), "I4": ("overlap",)}
+    panel.issues_lbl.config.assert_called_once_with(text="2 com problemas")
+
+
+def test_abertura_rapida_atualiza_indice_fora_da_thread_do_tk() -> None:
+    """A varredura do índice roda no executor; a lista só é relida quando o resultado chega e houve mudança."""
+
+    threads: list[str] = []
+    dialog = object.__new__(QuickOpenDialog)
+    dialog.index = Mock(refresh=Mock(side_effect=lambda: threads.append(threading.current_thread().name) or 2))
+    dialog.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="quick-open")
+    dialog.future = None
+    dialog.refresh_pending = False
+    dialog.after_id = None
+    dialog.winfo_exists = Mock(return_value=True)
+    dialog.after = Mock(return_value="poll")
+    dialog.reload = Mock()
+
+    dialog.refresh()
+    dialog.refresh()
+    dialog.future.result(timeout=5)
+    dialog._poll()
+    dialog.future.result(timeout=5)
+    dialog._poll()
+    dialog.executor.shutdown()
+
+    assert len(threads) == 2
+    assert all(name.startswith("quick-open") for name in threads)
+    assert dialog.reload.call_count == 2
+    assert dialog.future is None and not dialog.refresh_pending
@@ -0,0 +1,182 @@
+"""Benchmarks da interface: construção de painéis, atualização completa e edição de um item.
+
+Ficam desativados por padrão. Para executá-los sem monitor, com o VLC substituído por um dublê::
+
+    xvfb-run -a python -m pytest tests/test_gui_benchmarks.py --gui-benchmark=gui_benchmarks.json
+"""
+
+import tkinter as tk
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from benchmarks.generators import metadata_tree, subtitle_list
+from benchmarks.harness import BenchmarkResult, measure, report, write_report
+from gui.chapter_panel import ChapterPanel
+from gui.editor import ChapterEditor
+from gui.metadata_panel import MetadataPanel
+from gui.subtitle_panel import SubtitlePanel
+from logic import ChapterManager, SubtitleManager
+
+pytestmark = pytest.mark.gui_benchmark
+
+SIZES = (100, 1_000, 10_000)
+
+
+@pytest.fixture(scope="module")
+def gui_benchmark_results(request: pytest.FixtureRequest) -> Iterator[list[BenchmarkResult]]:
+    """Acumula os resultados do módulo e grava o relatório JSON ao final."""
+
+    output = request.config.getoption("--gui-benchmark")
+    results: list[BenchmarkResult] = []
+    yield results
+    write_report(Path(output), report(results))
+
+
+@pytest.fixture
+def fake_vlc(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Substitui o libVLC por um dublê que se comporta como mídia parada e sem duração."""
+
+    vlc = Mock()
+    player = vlc.Instance.return_value.media_player_new.return_value
+    player.get_length.return_value = 0
+    player.get_time.return_value = 0
+    player.is_playing.return_value = False
+    player.add_slave.return_value = 0
+    monkeypatch.setattr("gui.player_widget.vlc", vlc)
+    monkeypatch.setattr("gui.thumbnails.vlc", vlc)
+    return vlc
+
+
+def _chapters(count: int) -> list[dict]:
+    """Cria ``count`` capítulos: um décimo na raiz e os demais como subcapítulos."""
+
+    chapters = []
+    for index in range(max(1, count // 10)):
+        start = index * 100
+        subs = [{"title": f"Sub {sub}", "start": start + sub, "end": start + sub + 5, "subs": []} for sub in range(9)]
+        chapters.append({"title": f"Capítulo {index}", "start": start, "end": start + 50, "subs": subs})
+    return chapters
+
+
+def _measure_panel(
+    results: list[BenchmarkResult],
+    tk_root: tk.Tk,
+    name: str,
+    build: Callable[[tk.Widget], tk.Widget],
+    refresh: Callable[[tk.Widget], None],
+    edit: Callable[[tk.Widget], None],
+) -> None:
+    """Mede construção, atualização completa e edição de um item de um painel."""
+
+    panels: list[tk.Widget] = []
+
+    def construct() -> None:
+        panels.append(build(tk_root))
+        tk_root.update_idletasks()
+
+    def discard() -> None:
+        while panels:
+            panels.pop().destroy()
+
+    results.append(measure(f"{name}.construct", construct, discard, repeat=3))
+    discard()
+    panel = build(tk_root)
+    try:
+        results.append(measure(f"{name}.refresh", lambda: (refresh(panel), tk_root.update_idletasks()), repeat=3))
+        results.append(measure(f"{name}.edit", lambda: (edit(panel), tk_root.update_idletasks()), repeat=3))
+    finally:
+        panel.destroy()
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_benchmark_painel_de_capitulos(gui_benchmark_results: list[BenchmarkResult], tk_root: tk.Tk, size: int) -> None:
+    """Mede o painel de capítulos com ``size`` itens."""
+
+    chapters = _chapters(size)
+
+    def edit(panel: ChapterPanel) -> None:
+        chapters[0]["title"] = f"{chapters[0]['title']}!"
+        panel.refresh_chap_tree(select_chap=chapters[0])
+        panel.on_save()
+
+    _measure_panel(
+        gui_benchmark_results,
+        tk_root,
+        f"gui.chapter_panel[{size}]",
+        lambda master: ChapterPanel(master, chapters, Mock(), Mock(return_value=0), Mock(), Mock()),
+        lambda panel: panel.refresh_chap_tree(),
+        edit,
+    )
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_benchmark_painel_de_legendas(gui_benchmark_results: list[BenchmarkResult], tk_root: tk.Tk, size: int) -> None:
+    """Mede o painel de legendas com ``size`` blocos."""
+
+    subtitles = subtitle_list(size)
+
+    def edit(panel: SubtitlePanel) -> None:
+        subtitles[0]["text"] = f"{subtitles[0]['text']}!"
+        panel.refresh_sub_tree(select_sub=subtitles[0], edited=subtitles[0])
+        panel.on_save()
+
+    _measure_panel(
+        gui_benchmark_results,
+        tk_root,
+        f"gui.subtitle_panel[{size}]",
+        lambda master: SubtitlePanel(master, subtitles, Mock(), Mock(return_value=0), Mock()),
+        lambda panel: panel.refresh_sub_tree(),
+        edit,
+    )
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_benchmark_painel_de_metadados(gui_benchmark_results: list[BenchmarkResult], tk_root: tk.Tk, size: int) -> None:
+    """Mede o painel de metadados com ``size`` chaves folha distribuídas em dois níveis."""
+
+    metadata = metadata_tree(depth=2, breadth=1)
+    metadata[0]["children"] = [{"key": f"chave_{index}", "value": "valor", "children": []} for index in range(size)]
+
+    def edit(panel: MetadataPanel) -> None:
+        leaf = metadata[0]["children"][0]
+        leaf["value"] = f"{leaf['value']}!"
+        panel.refresh_tree(leaf)
+        panel.on_save()
+
+    _measure_panel(
+        gui_benchmark_results,
+        tk_root,
+        f"gui.metadata_panel[{size}]",
+        lambda master: MetadataPanel(master, metadata, Mock(), Mock()),
+        lambda panel: panel.refresh_tree(),
+        edit,
+    )
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_benchmark_abertura_do_editor(
+    gui_benchmark_results: list[BenchmarkResult], tk_root: tk.Tk, fake_vlc: Mock, tmp_path: Path, size: int
+) -> None:
+    """Mede ``ChapterEditor.__init__`` com ``size`` capítulos e ``size`` legendas gravados em disco."""
+
+    video_path = str(tmp_path / "video.mp4")
+    ChapterManager(video_path).save(_chapters(size), [], metadata_tree(depth=2, breadth=10))
+    SubtitleManager(video_path).save(subtitle_list(size))
+    config = {"update_ms": 60_000, "keys": {}}
+    editors: list[ChapterEditor] = []
+
+    def open_editor() -> None:
+        editors.append(ChapterEditor(tk_root, video_path, config))
+        tk_root.update_idletasks()
+
+    def close_editors() -> None:
+        while editors:
+            editors.pop().destroy()
+
+    try:
+        gui_benchmark_results.append(measure(f"gui.editor_open[{size}]", open_editor, close_editors, repeat=3))
+    finally:
+        close_editors()
@@ -1,12 +1,18 @@
 """Testes da persistência SQLite ``.chp`` e das regras temporais."""
 
+import json
+import os
+import sqlite3
 from pathlib import Path
 
 import pytest
 
 from logic import (
+    SCHEMA_MIGRATIONS,
     ChapterManager,
     DataLoadError,
+    EditJournal,
+    SubtitleManager,
     fmt_sec,
     parse_flexible_time,
     parse_time,
@@ -158,3 +164,220 @@ def test_chapter_manager_rejeita_valor_em_metadado_com_filhos(tmp_path: Path) ->
 
     with pytest.raises(ValueError, match="dados"):
         ChapterManager(str(tmp_path / "video.mp4")).save([], [], metadata)
+
+
+def test_chapter_manager_migra_arquivo_sem_versao_e_cria_indices(tmp_path: Path) -> None:
+    """Atualiza arquivos anteriores ao versionamento sem perder os dados existentes."""
+
+    chp_path = tmp_path / "video.chp"
+    with sqlite3.connect(chp_path) as connection:
+        connection.executescript("""
+            CREATE TABLE chapters (
+                id TEXT PRIMARY KEY, parent_id TEXT REFERENCES chapters(id) ON DELETE CASCADE,
+                position INTEGER NOT NULL, title TEXT NOT NULL, start INTEGER NOT NULL, end INTEGER NOT NULL
+            );
+            INSERT INTO chapters VALUES ('c1', NULL, 0, 'Antigo', 0, 10);
+            """)
+    connection.close()
+
+    loaded = ChapterManager(str(tmp_path / "video.mp4")).load()
+
+    assert loaded["chapters"][0]["title"] == "Antigo"
+    with sqlite3.connect(chp_path) as connection:
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        indexes = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        tables = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    connection.close()
+    assert version == len(SCHEMA_MIGRATIONS) == 3
+    assert not {"thumbnails", "sprite_sheet"} & tables
+    assert {"chapters_parent_position", "metadata_parent_position"} <= indexes
+
+
+def test_chapter_manager_rejeita_versao_de_formato_mais_recente(tmp_path: Path) -> None:
+    """Não tenta reinterpretar arquivos gravados por uma versão futura do aplicativo."""
+
+    chp_path = tmp_path / "video.chp"
+    with sqlite3.connect(chp_path) as connection:
+        connection.execute(f"PRAGMA user_version = {len(SCHEMA_MIGRATIONS) + 1}")
+    connection.close()
+
+    with pytest.raises(DataLoadError, match="versão"):
+        ChapterManager(str(tmp_path / "video.mp4")).load()
+
+
+def test_chapter_manager_rejeita_imagem_inexistente_sem_alterar_arquivo(tmp_path: Path) -> None:
+    """Valida os vínculos de imagens antes de abrir a transação de gravação."""
+
+    manager = ChapterManager(str(tmp_path / "video.mp4"))
+    manager.save([{"title": "Original", "start": 0, "end": 10, "subs": []}], [])
+
+    chapters = [{"title": "Novo", "start": 0, "end": 10, "subs": [], "images": ["ausente"]}]
+    with pytest.raises(ValueError, match="não existe"):
+        manager.save(chapters, [])
+    assert manager.load()["chapters"][0]["title"] == "Original"
+
+
+def _deep_chain(depth: int, key: str, children_key: str, **fields: object) -> list[dict]:
+    """Monta uma cadeia com ``depth`` níveis, cada nó contendo apenas um filho."""
+
+    root: list[dict] = []
+    siblings = root
+    for level in range(depth):
+        node = {key: f"Nível {level}", **fields, children_key: []}
+        siblings.append(node)
+        siblings = node[children_key]
+    return root
+
+
+def test_chapter_manager_grava_e_carrega_cadeias_de_5000_niveis(tmp_path: Path) -> None:
+    """Persiste hierarquias profundas sem esbarrar no limite de recursão do Python."""
+
+    depth = 5_000
+    chapters = _deep_chain(depth, "title", "subs", start=0, end=1)
+    chapters[0]["end"] = 0
+    deepest = chapters[0]
+    while deepest["subs"]:
+        deepest = deepest["subs"][0]
+    deepest["end"] = 900
+    metadata = _deep_chain(depth, "key", "children", value="")
+    manager = ChapterManager(str(tmp_path / "video.mp4"))
+
+    manager.save(chapters, [], metadata)
+
+    loaded = manager.load()
+    levels = 0
+    node = loaded["chapters"][0]
+    assert node["end"] == 900
+    while node["subs"]:
+        node = node["subs"][0]
+        levels += 1
+    assert levels == depth - 1
+    levels = 0
+    node = loaded["metadata"][0]
+    while node["children"]:
+        node = node["children"][0]
+        levels += 1
+    assert levels == depth - 1
+
+
+def test_chapter_manager_localiza_erro_em_cadeia_profunda(tmp_path: Path) -> None:
+    """Mantém o caminho completo do nó inválido nas mensagens de erro."""
+
+    chapters = _deep_chain(5_000, "title", "subs", start=0, end=1)
+    deepest = chapters[0]
+    while deepest["subs"]:
+        deepest = deepest["subs"][0]
+    deepest["title"] = " "
+
+    with pytest.raises(ValueError) as error:
+        ChapterManager(str(tmp_path / "video.mp4")).save(chapters, [])
+    assert str(error.value).startswith("Os capítulos não foram salvos: capítulo 1, subcapítulo 1, subcapítulo 1")
+    assert str(error.value).endswith("subcapítulo 1 não possui título válido")
+    assert str(error.value).count("subcapítulo 1") == 4_999
+
+
+def _age(path: str, seconds: int) -> None:
+    """Recua o horário de modificação de ``path`` para simular um arquivo mais antigo."""
+
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 1_000_000_000))
+
+
+def test_diario_reaplica_ultima_versao_de_cada_secao(tmp_path: Path) -> None:
+    """Lotes sucessivos acumulam registros e a leitura devolve o estado mais recente de cada seção."""
+
+    journal = EditJournal(str(tmp_path / "video.mp4"))
+    subtitles = [{"start": 0, "end": 500, "text": "Olá"}]
+    images = [{"id": "img", "title": "Capa", "description": "", "data": b"\x00\xff", "mime_type": "image/png"}]
+    journal.stage("subtitles", subtitles)
+    journal.stage("images", images)
+    journal.write_staged()
+    subtitles.append({"start": 600, "end": 900, "text": "Tchau"})
+    journal.stage("subtitles", subtitles)
+    journal.write_staged()
+
+    assert len(Path(journal.journal_path).read_text(encoding="utf-8").splitlines()) == 3
+    recovered = journal.pending()
+    assert recovered["subtitles"] == subtitles
+    assert recovered["images"][0]["data"] == b"\x00\xff"
+    assert journal.staged == {}
+
+
+def test_diario_grava_cada_imagem_uma_unica_vez(tmp_path: Path) -> None:
+    """Editar os dados de uma imagem registra só o hash do conteúdo já gravado; o conteúdo novo é acrescentado."""
+
+    journal = EditJournal(str(tmp_path / "video.mp4"))
+    cover = {"id": "capa", "title": "Capa", "description": "", "data": b"\x01" * 4096, "mime_type": "image/png"}
+    journal.stage("images", [cover])
+    journal.write_staged()
+    first_size = os.path.getsize(journal.journal_path)
+
+    cover["title"] = "Capa editada"
+    journal.stage("images", [cover])
+    journal.write_staged()
+    assert os.path.getsize(journal.journal_path) - first_size < 1024
+
+    back = {**cover, "id": "verso", "data": b"\x02" * 4096}
+    journal.stage("images", [cover, back])
+    journal.write_staged()
+
+    records = [json.loads(line) for line in Path(journal.journal_path).read_text(encoding="utf-8").splitlines()]
+    assert [len(record.get("blobs", {})) for record in records] == [1, 0, 1]
+    recovered = journal.pending()["images"]
+    assert [(image["title"], image["data"]) for image in recovered] == [
+        ("Capa editada", b"\x01" * 4096),
+        ("Capa editada", b"\x02" * 4096),
+    ]
+
+
+def test_diario_grava_arvores_profundas_sem_recursao(tmp_path: Path) -> None:
+    """Cadeias de 5.000 níveis são gravadas em formato plano, abaixo do limite de recursão do ``json``."""
+
+    chapters = _deep_chain(5_000, "title", "subs", start=0, end=1)
+    journal = EditJournal(str(tmp_path / "video.mp4"))
+    journal.stage("chapters", chapters)
+    journal.write_staged()
+
+    node = journal.pending()["chapters"][0]
+    levels = 0
+    while node["subs"]:
+        node = node["subs"][0]
+        levels += 1
+    assert levels == 4_999
+    assert node == {"title": "Nível 4999", "start": 0, "end": 1, "subs": []}
+
+
+def test_diario_ignora_secoes_ja_gravadas_e_linha_incompleta(tmp_path: Path) -> None:
+    """Arquivos mais novos que o diário já contêm suas seções; uma linha truncada encerra a leitura."""
+
+    video_path = str(tmp_path / "video.mp4")
+    journal = EditJournal(video_path)
+    journal.stage("casting", [{"name": "Ana", "role": "Pessoa"}])
+    journal.stage("subtitles", [{"start": 0, "end": 500, "text": "Olá"}])
+    journal.write_staged()
+    with open(journal.journal_path, "a", encoding="utf-8") as file_handle:
+        file_handle.write('{"section": "casting", "data": [{"na')
+    SubtitleManager(video_path).save([])
+    _age(journal.journal_path, 10)
+
+    assert journal.pending() == {"casting": [{"name": "Ana", "role": "Pessoa"}]}
+
+    ChapterManager(video_path).save([], [])
+    assert journal.pending() == {}
+
+
+def test_diario_apagado_apos_salvamento(tmp_path: Path) -> None:
+    """Depois de um salvamento completo, o diário e as seções agendadas são descartados."""
+
+    journal = EditJournal(str(tmp_path / "video.mp4"))
+    journal.stage("metadata", [])
+    journal.write_staged()
+    journal.stage("casting", [])
+
+    journal.clear()
+
+    assert not Path(journal.journal_path).exists()
+    assert journal.staged == {}
+    assert journal.pending() == {}
+    with pytest.raises(ValueError, match="desconhecida"):
+        journal.stage("capitulos", [])
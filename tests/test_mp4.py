@@ -0,0 +1,202 @@
+"""Testes da leitura de caixas MP4 e do índice de quadros-chave com arquivos montados em memória."""
+
+import stat
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+import mp4
+from mp4 import Mp4FormatError, keyframe_index, parse_keyframe_index
+
+
+def box(box_type: bytes, *parts: bytes) -> bytes:
+    """Monta uma caixa com cabeçalho de 32 bits."""
+
+    payload = b"".join(parts)
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+
+def full_box(box_type: bytes, version: int, *parts: bytes) -> bytes:
+    """Monta uma caixa completa com versão e flags zeradas."""
+
+    return box(box_type, bytes([version, 0, 0, 0]), *parts)
+
+
+def table(rows: list[tuple[int, ...]], row_format: str = ">II") -> bytes:
+    """Monta uma tabela de amostras precedida da quantidade de linhas."""
+
+    return struct.pack(">I", len(rows)) + b"".join(struct.pack(row_format, *row) for row in rows)
+
+
+MEDIA = bytes(range(256)) * 4
+
+
+def sample_mp4(with_stss: bool = True, faststart: bool = False, udta: bytes = b"") -> bytes:
+    """Monta um MP4 com uma trilha de áudio e uma de vídeo de 300 quadros em escala 12800.
+
+    Os quadros-chave são 1, 101 e 201; as durações mudam no quadro 151 e o deslocamento de composição no 101. O
+    ``stco`` aponta para dois blocos do ``mdat``, que fica depois de ``moov`` quando ``faststart`` é verdadeiro.
+    """
+
+    def moov(chunk_base: int) -> bytes:
+        stbl_children = [
+            full_box(b"stts", 0, table([(150, 512), (150, 1024)])),
+            full_box(b"ctts", 0, table([(100, 1024), (200, 2048)])),
+            full_box(b"stco", 0, table([(chunk_base,), (chunk_base + 512,)], ">I")),
+        ]
+        if with_stss:
+            stbl_children.append(full_box(b"stss", 0, table([(1,), (101,), (201,)], ">I")))
+        video = box(
+            b"trak",
+            box(b"edts", full_box(b"elst", 0, table([(1000, 1024, 0x10000)], ">Iii"))),
+            box(
+                b"mdia",
+                full_box(b"mdhd", 0, struct.pack(">IIII", 0, 0, 12800, 0)),
+                full_box(b"hdlr", 0, b"\0\0\0\0vide", bytes(12)),
+                box(b"minf", box(b"stbl", *stbl_children)),
+            ),
+        )
+        audio = box(b"trak", box(b"mdia", full_box(b"hdlr", 0, b"\0\0\0\0soun", bytes(12))))
+        mvhd = full_box(b"mvhd", 0, struct.pack(">IIII", 0, 0, 1000, 75_500))
+        return box(b"moov", mvhd, audio, video, *([box(b"udta", udta)] if udta else []))
+
+    ftyp = box(b"ftyp", b"isom\0\0\0\0")
+    mdat_header = struct.pack(">I4sQ", 1, b"mdat", 16 + len(MEDIA))
+    if faststart:
+        base = len(ftyp) + len(moov(0)) + len(mdat_header)
+        return ftyp + moov(base) + mdat_header + MEDIA
+    return ftyp + mdat_header + MEDIA + moov(len(ftyp) + len(mdat_header))
+
+
+def chunk_offsets(data: bytes) -> list[int]:
+    """Lê os deslocamentos do ``stco`` da trilha de vídeo."""
+
+    moov = mp4.find_box(data, 0, len(data), b"moov")
+    video = [trak for trak in mp4.iter_boxes(data, moov.payload, moov.end) if trak.type == b"trak"][1]
+    stco = mp4.find_box(data, video.payload, video.end, b"mdia", b"minf", b"stbl", b"stco")
+    return list(mp4._table(data, stco, 4, "I", 1))
+
+
+def test_indice_considera_duracoes_composicao_e_edicao() -> None:
+    """Os instantes combinam ``stts``, ``ctts`` e o ``media_time`` da lista de edição."""
+
+    index = parse_keyframe_index(sample_mp4())
+
+    assert index is not None
+    assert list(index.times_ms) == [0, 4080, 10080]
+    assert index.at_or_before(5000) == 4080
+    assert index.at_or_after(5000) == 10080
+    assert index.at_or_after(10081) is None
+    assert index.at_or_before(-1) is None
+
+
+def test_sem_stss_todos_os_quadros_sao_chave() -> None:
+    """Sem tabela de quadros-chave, não há índice para alinhar."""
+
+    assert parse_keyframe_index(sample_mp4(with_stss=False)) is None
+
+
+def test_caixa_truncada_e_rejeitada() -> None:
+    """Um tamanho de caixa além do arquivo é tratado como arquivo inválido."""
+
+    with pytest.raises(Mp4FormatError):
+        parse_keyframe_index(sample_mp4()[:-10])
+
+
+def test_cache_por_tamanho_e_data(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """O índice é relido apenas quando o arquivo muda; arquivos que não são MP4 resultam em ``None``."""
+
+    video = tmp_path / "aula.mp4"
+    video.write_bytes(sample_mp4())
+    reads: list[str] = []
+    original = mp4.read_keyframe_index
+    monkeypatch.setattr(mp4, "read_keyframe_index", lambda path: reads.append(path) or original(path))
+
+    first = keyframe_index(str(video))
+    assert keyframe_index(str(video)) is first
+    video.write_bytes(sample_mp4(with_stss=False))
+
+    assert keyframe_index(str(video)) is None
+    assert len(reads) == 2
+    (tmp_path / "texto.mp4").write_text("não é vídeo", encoding="utf-8")
+    assert keyframe_index(str(tmp_path / "texto.mp4")) is None
+    assert keyframe_index(str(tmp_path / "inexistente.mp4")) is None
+
+
+def test_cache_compartilhado_entre_threads(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Consultas simultâneas de várias threads, com despejos constantes, não corrompem o cache."""
+
+    monkeypatch.setattr(mp4, "KEYFRAME_CACHE_SIZE", 2)
+    monkeypatch.setattr(mp4, "_keyframe_cache", {})
+    videos = []
+    for number in range(6):
+        video = tmp_path / f"aula{number}.mp4"
+        video.write_bytes(sample_mp4())
+        videos.append(str(video))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(keyframe_index, videos * 50))
+
+    assert all(result is not None for result in results)
+    assert len(mp4._keyframe_cache) <= 2
+
+
+@pytest.mark.parametrize("faststart", [True, False])
+def test_exporta_capitulos_sem_alterar_midia(tmp_path: Path, faststart: bool) -> None:
+    """Os capítulos entram em ``udta/chpl``, os blocos apontam para os mesmos bytes e as permissões são mantidas."""
+
+    source = tmp_path / "aula.mp4"
+    source.write_bytes(sample_mp4(faststart=faststart, udta=box(b"\xa9nam", b"titulo")))
+    source.chmod(0o644)
+    destination = tmp_path / "aula (capítulos).mp4"
+    chapters = [
+        {"title": "Abertura", "start": 0, "end": 30, "subs": [{"title": "Vinheta", "start": 5, "end": 10}]},
+        {"title": "Conteúdo", "start": 30, "end": 75},
+    ]
+
+    mp4.write_chapters(str(source), str(destination), mp4.chapters_for_container(chapters, True))
+
+    assert stat.S_IMODE(destination.stat().st_mode) == 0o644
+    original, exported = source.read_bytes(), destination.read_bytes()
+    for before, after in zip(chunk_offsets(original), chunk_offsets(exported), strict=True):
+        assert exported[after : after + 512] == original[before : before + 512]
+        assert (after - before != 0) == faststart
+    assert mp4.parse_chapters(exported) == [(0, "Abertura"), (5_000, "Vinheta"), (30_000, "Conteúdo")]
+    assert mp4.find_box(exported, 0, len(exported), b"moov", b"udta", b"\xa9nam") is not None
+    assert parse_keyframe_index(exported) == parse_keyframe_index(original)
+    assert mp4.import_chapters(str(destination)) == [
+        {"title": "Abertura", "start": 0, "end": 5, "subs": []},
+        {"title": "Vinheta", "start": 5, "end": 30, "subs": []},
+        {"title": "Conteúdo", "start": 30, "end": 75, "subs": []},
+    ]
+
+
+def test_regravar_sem_capitulos_e_sem_copy_file_range(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A cópia em fatias substitui o arquivo no lugar e uma lista vazia remove o ``chpl``."""
+
+    monkeypatch.delattr(mp4.os, "copy_file_range", raising=False)
+    video = tmp_path / "aula.mp4"
+    video.write_bytes(sample_mp4(faststart=True))
+    mp4.write_chapters(str(video), str(video), [mp4.ContainerChapter(1_500, "Único " + "é" * 200)])
+
+    [chapter] = mp4.parse_chapters(video.read_bytes())
+    assert chapter.start_ms == 1_500
+    assert len(chapter.title.encode("utf-8")) <= 255
+
+    mp4.write_chapters(str(video), str(video), [])
+    assert mp4.parse_chapters(video.read_bytes()) == []
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_limite_de_capitulos_nero(tmp_path: Path) -> None:
+    """O formato guarda a quantidade em um byte; exportar mais capítulos falha sem criar o destino."""
+
+    source = tmp_path / "aula.mp4"
+    source.write_bytes(sample_mp4())
+    chapters = [mp4.ContainerChapter(index * 1000, f"C{index}") for index in range(256)]
+
+    with pytest.raises(Mp4FormatError, match="255"):
+        mp4.write_chapters(str(source), str(tmp_path / "saida.mp4"), chapters)
+    assert not (tmp_path / "saida.mp4").exists()
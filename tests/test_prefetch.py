@@ -0,0 +1,87 @@
+"""Testes do pré-carregamento do próximo vídeo da pasta com uma instância do VLC simulada."""
+
+import os
+from pathlib import Path
+from unittest.mock import Mock
+
+from gui.player_widget import PLAYER_OPTIONS
+from gui.prefetch import VideoPrefetcher, next_video_in_folder
+
+
+def _touch(folder: Path, *names: str) -> None:
+    """Cria arquivos vazios na pasta informada."""
+
+    for name in names:
+        (folder / name).write_bytes(b"")
+
+
+def test_proximo_video_segue_ordem_natural(tmp_path: Path) -> None:
+    """``Episódio 10`` vem depois de ``Episódio 2`` e arquivos que não são vídeo são ignorados."""
+
+    _touch(tmp_path, "Episódio 1.mp4", "Episódio 2.MKV", "Episódio 10.mp4", "Episódio 3.srt", "Episódio 3.chp")
+
+    assert next_video_in_folder(str(tmp_path / "Episódio 1.mp4")) == str(tmp_path / "Episódio 2.MKV")
+    assert next_video_in_folder(str(tmp_path / "Episódio 2.MKV")) == str(tmp_path / "Episódio 10.mp4")
+    assert next_video_in_folder(str(tmp_path / "Episódio 10.mp4")) is None
+
+
+def test_entrega_dados_e_midia_pre_analisada(tmp_path: Path) -> None:
+    """O vídeo pré-carregado traz capítulos, legendas e a mídia cuja análise já foi solicitada."""
+
+    _touch(tmp_path, "b.mp4")
+    video = str(tmp_path / "b.mp4")
+    (tmp_path / "b.srt").write_text("1\n00:00:01,000 --> 00:00:02,000\nOlá\n", encoding="utf-8")
+    instance = Mock()
+    create_instance = Mock(return_value=instance)
+    prefetcher = VideoPrefetcher(create_instance=create_instance)
+    try:
+        prefetcher.prefetch(video)
+        prefetched = prefetcher.take(video)
+    finally:
+        prefetcher.close()
+
+    assert prefetched is not None
+    assert prefetched.instance is instance
+    assert [cue["text"] for cue in prefetched.subtitles] == ["Olá"]
+    assert prefetched.data["chapters"] == []
+    create_instance.assert_called_once_with(*PLAYER_OPTIONS)
+    instance.media_new.assert_called_once_with(video)
+    prefetched.media.parse_with_options.assert_called_once()
+    instance.release.assert_not_called()
+
+
+def test_arquivo_auxiliar_alterado_descarta_pre_carregamento(tmp_path: Path) -> None:
+    """Se o ``.chp`` mudou depois do pré-carregamento, os recursos são liberados e a carga é refeita."""
+
+    _touch(tmp_path, "b.mp4")
+    video = str(tmp_path / "b.mp4")
+    instance = Mock()
+    prefetcher = VideoPrefetcher(create_instance=lambda *_: instance)
+    try:
+        prefetcher.prefetch(video)
+        prefetcher.future.result()
+        chp = tmp_path / "b.chp"
+        chp.write_bytes(b"")
+        os.utime(chp, ns=(1, 1))
+        assert prefetcher.take(video) is None
+    finally:
+        prefetcher.close()
+
+    instance.release.assert_called_once()
+
+
+def test_outro_video_descarta_e_libera(tmp_path: Path) -> None:
+    """Pedir um vídeo diferente do pré-carregado libera a instância preparada."""
+
+    _touch(tmp_path, "b.mp4", "c.mp4")
+    instance = Mock()
+    prefetcher = VideoPrefetcher(create_instance=lambda *_: instance)
+    try:
+        prefetcher.prefetch(str(tmp_path / "b.mp4"))
+        prefetcher.future.result()
+        assert prefetcher.take(str(tmp_path / "c.mp4")) is None
+    finally:
+        prefetcher.close()
+
+    instance.release.assert_called_once()
+    assert prefetcher.take(str(tmp_path / "b.mp4")) is None
@@ -0,0 +1,125 @@
+"""Testes do perfilador opcional: medições, percentis, operações lentas e trace do Chrome."""
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+import profiling
+from profiling import (
+    ImportTime,
+    Profiler,
+    parse_import_times,
+    profiled,
+    profiler,
+    profiling_requested,
+)
+
+
+@pytest.fixture
+def active_profiler() -> Iterator[Profiler]:
+    """Liga o perfilador global durante o teste e restaura o estado anterior."""
+
+    previous = profiler.enabled
+    profiler.reset()
+    profiler.enabled = True
+    yield profiler
+    profiler.enabled = previous
+    profiler.reset()
+
+
+def test_decorador_nao_registra_com_perfilador_desligado() -> None:
+    """Sem ativação, a função decorada apenas repassa argumentos e retorno."""
+
+    profiler.reset()
+
+    @profiled("teste.desligado")
+    def double(value: int) -> int:
+        return value * 2
+
+    assert double(21) == 42
+    assert profiler.operations() == []
+
+
+def test_decorador_registra_duracao_e_excecoes(active_profiler: Profiler) -> None:
+    """A duração é registrada mesmo quando a função termina com exceção."""
+
+    @profiled("teste.falha")
+    def fail() -> None:
+        raise ValueError("falhou")
+
+    with pytest.raises(ValueError, match="falhou"):
+        fail()
+    with active_profiler.span("teste.bloco"):
+        pass
+
+    assert active_profiler.operations() == ["teste.bloco", "teste.falha"]
+    assert active_profiler.percentiles("teste.falha")["count"] == 1
+
+
+def test_percentis_e_operacoes_lentas() -> None:
+    """Calcula percentis por posição e guarda apenas as execuções acima do limite."""
+
+    source = Profiler(window_size=100, slow_threshold_ms=50, slow_operations=2)
+    for milliseconds in range(1, 101):
+        source.record("tree.chapters", source.origin, milliseconds / 1000)
+
+    summary = source.percentiles("tree.chapters")
+    assert summary["count"] == 100
+    assert summary["p50"] == pytest.approx(50)
+    assert summary["p90"] == pytest.approx(90)
+    assert summary["p99"] == pytest.approx(99)
+    assert summary["max"] == pytest.approx(100)
+    assert [round(span.duration * 1000) for span in source.slow_operations()] == [100, 99]
+    assert source.percentiles("inexistente")["count"] == 0
+
+
+def test_janela_deslizante_descarta_medicoes_antigas() -> None:
+    """Os percentis consideram apenas as medições mais recentes."""
+
+    source = Profiler(window_size=3)
+    for seconds in (10.0, 0.001, 0.002, 0.003):
+        source.record("chp.load", source.origin, seconds)
+
+    assert source.percentiles("chp.load")["max"] == pytest.approx(3)
+
+
+def test_exporta_trace_do_chrome(tmp_path: Path) -> None:
+    """Cada medição vira um evento completo em microssegundos."""
+
+    source = Profiler()
+    source.record("editor.save_data", source.origin + 0.5, 0.25)
+    path = tmp_path / "trace.json"
+    source.export_chrome_trace(path)
+
+    document = json.loads(path.read_text(encoding="utf-8"))
+    [event] = document["traceEvents"]
+    assert event["name"] == "editor.save_data"
+    assert event["cat"] == "editor"
+    assert event["ph"] == "X"
+    assert event["ts"] == pytest.approx(500_000)
+    assert event["dur"] == pytest.approx(250_000)
+
+
+def test_ativacao_por_configuracao_ou_ambiente(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A chave ``profiling`` ou a variável de ambiente ligam a instrumentação."""
+
+    monkeypatch.delenv(profiling.PROFILING_ENV, raising=False)
+    assert not profiling_requested({"profiling": False})
+    assert profiling_requested({"profiling": True})
+    monkeypatch.setenv(profiling.PROFILING_ENV, "1")
+    assert profiling_requested({})
+
+
+def test_interpreta_relatorio_de_importtime() -> None:
+    """Ignora o cabeçalho e linhas alheias e preserva os tempos em microssegundos."""
+
+    report = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |     _io\n"
+        "aviso qualquer\n"
+        "import time:      1500 |       4200 |   gui.editor\n"
+    )
+
+    assert parse_import_times(report) == [ImportTime("_io", 120, 120), ImportTime("gui.editor", 1500, 4200)]
@@ -0,0 +1,182 @@
+"""Testes da detecção de mudanças de cena sobre quadros sintéticos."""
+
+import os
+import threading
+import time
+from functools import partial
+from pathlib import Path
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+import vlc
+
+import scenes
+from scenes import (
+    FRAME_HEIGHT,
+    FRAME_WIDTH,
+    SAMPLE_MS,
+    SceneTrack,
+    analyze_scenes,
+    chapters_from_boundaries,
+    decode_range,
+    load_scene_track,
+    scene_boundaries,
+    scene_scores,
+    scenes_path,
+    split_ranges,
+)
+
+CUTS_MS = (12_000, 30_000)
+
+
+def fake_decode(
+    _video_path: str, start_ms: int, end_ms: int, _stop: threading.Event | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Simula a decodificação: quadros de cinza uniforme cujo tom muda nos cortes de ``CUTS_MS``."""
+
+    times = np.arange(start_ms, end_ms, SAMPLE_MS, dtype=np.int64)
+    shades = np.searchsorted(CUTS_MS, times, side="right") * 100 + 20
+    frames = np.broadcast_to(shades[:, None, None], (len(times), FRAME_HEIGHT, FRAME_WIDTH))
+    return times, frames.astype(np.uint8)
+
+
+def blocking_decode(_video_path: str, start_ms: int, _end_ms: int) -> tuple[np.ndarray, np.ndarray]:
+    """Simula um intervalo longo que só termina quando o processo decodificador é interrompido."""
+
+    deadline = time.monotonic() + 30
+    while not scenes._worker_stop.is_set() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return np.array([start_ms], dtype=np.int64), np.zeros((1, FRAME_HEIGHT, FRAME_WIDTH), dtype=np.uint8)
+
+
+def test_pontuacao_destaca_os_cortes_e_ignora_quadros_iguais() -> None:
+    """Quadros iguais pontuam zero e a troca completa de tom pontua perto do máximo."""
+
+    times, frames = fake_decode("", 0, 40_000)
+    scores = scene_scores(frames)
+
+    assert scores[0] == 0
+    assert set(times[scores > 0.5].tolist()) == set(CUTS_MS)
+    assert np.count_nonzero(scores) == len(CUTS_MS)
+
+
+def test_limites_respeitam_limiar_e_distancia_minima() -> None:
+    """O corte mais forte vence quando dois ficam próximos; o início do vídeo nunca é um limite."""
+
+    times = np.arange(0, 20_000, SAMPLE_MS, dtype=np.int64)
+    scores = np.zeros(len(times), dtype=np.float32)
+    for moment, score in ((500, 0.9), (5_000, 0.4), (5_500, 0.8), (12_000, 0.2), (15_000, 0.6)):
+        scores[moment // SAMPLE_MS] = score
+    track = SceneTrack(times, scores)
+
+    assert scene_boundaries(track, 0.3) == [5_500, 15_000]
+    assert scene_boundaries(track, 0.1) == [5_500, 12_000, 15_000]
+    assert scene_boundaries(track, 0.95) == []
+
+
+def test_limites_iguais_a_selecao_gulosa_direta() -> None:
+    """A busca pelos vizinhos escolhe os mesmos limites que comparar cada candidato com todos os já escolhidos."""
+
+    rng = np.random.default_rng(7)
+    track = SceneTrack(np.arange(4_000, dtype=np.int64) * SAMPLE_MS, rng.random(4_000).astype(np.float32))
+    for threshold in (0.05, 0.5, 0.9):
+        chosen: list[int] = []
+        for index in np.argsort(-track.scores, kind="stable").tolist():
+            moment = int(track.times_ms[index])
+            if track.scores[index] < threshold or moment < 2_000:
+                continue
+            if all(abs(moment - other) >= 2_000 for other in chosen):
+                chosen.append(moment)
+        assert scene_boundaries(track, threshold) == sorted(chosen)
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_analise_em_intervalos_junta_os_quadros_em_ordem(workers: int) -> None:
+    """Dividir o vídeo entre processos produz a mesma trilha da decodificação inteira."""
+
+    track = analyze_scenes("video.mp4", 40_000, threading.Event(), workers=workers, decode=fake_decode)
+    times, frames = fake_decode("", 0, 40_000)
+
+    assert split_ranges(40_000, 3)[-1][1] == 40_000
+    assert np.array_equal(track.times_ms, times)
+    assert np.allclose(track.scores, scene_scores(frames))
+
+
+def test_interrupcao_encerra_decodificacoes_em_andamento() -> None:
+    """Sinalizar ``stop`` interrompe os processos que já decodificam, em vez de esperar o fim dos intervalos."""
+
+    stop = threading.Event()
+    threading.Timer(0.5, stop.set).start()
+    started = time.monotonic()
+
+    assert analyze_scenes("video.mp4", 40_000, stop, workers=2, decode=blocking_decode) is None
+    assert time.monotonic() - started < 20
+
+    player = Mock()
+    player.get_state.return_value = vlc.State.Playing
+    instance = Mock()
+    instance.media_player_new.return_value = player
+    stopped = threading.Event()
+    stopped.set()
+    times, frames = decode_range("video.mp4", 0, 40_000, stopped, create_instance=lambda *_: instance)
+    assert len(times) == len(frames) == 0
+    player.stop.assert_called_once_with()
+
+
+def test_libvlc_ausente_vira_erro_de_sistema() -> None:
+    """A falta da libVLC, que o python-vlc sinaliza com ``NameError``, chega ao diálogo como ``OSError``."""
+
+    def missing_libvlc(*_options: str) -> None:
+        raise NameError("no function 'libvlc_new'")
+
+    with pytest.raises(OSError, match="libVLC"):
+        decode_range("video.mp4", 0, 1_000, threading.Event(), create_instance=missing_libvlc)
+    with pytest.raises(OSError, match="libVLC"):
+        decode_range("video.mp4", 0, 1_000, threading.Event(), create_instance=lambda *_: None)
+
+
+def test_trilha_fica_guardada_ao_lado_do_video(tmp_path: Path) -> None:
+    """A segunda leitura usa o arquivo ``.scenes`` sem analisar; um vídeo mais novo força nova análise."""
+
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"")
+    calls: list[str] = []
+
+    def analyze(path: str, duration_ms: int, stop: threading.Event) -> SceneTrack:
+        calls.append(path)
+        return analyze_scenes(path, duration_ms, stop, workers=1, decode=fake_decode)
+
+    first = load_scene_track(str(video), 40_000, threading.Event(), analyze)
+    second = load_scene_track(str(video), 40_000, threading.Event(), analyze)
+    assert first is not None and second is not None
+    assert np.array_equal(first.scores, second.scores)
+    assert len(calls) == 1
+
+    stamp = os.stat(scenes_path(str(video))).st_mtime_ns + 1_000_000_000
+    os.utime(video, ns=(stamp, stamp))
+    load_scene_track(str(video), 40_000, threading.Event(), analyze)
+    assert len(calls) == 2
+
+
+def test_analise_interrompida_nao_grava_trilha(tmp_path: Path) -> None:
+    """Com ``stop`` sinalizado a análise retorna ``None`` e nada é gravado."""
+
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"")
+    stop = threading.Event()
+    stop.set()
+
+    analyze = partial(analyze_scenes, workers=1, decode=fake_decode)
+    assert load_scene_track(str(video), 40_000, stop, analyze) is None
+    assert not os.path.exists(scenes_path(str(video)))
+
+
+def test_limites_viram_capitulos_contiguos() -> None:
+    """Cada capítulo termina onde o seguinte começa e o último vai até o fim do vídeo."""
+
+    assert chapters_from_boundaries([12_250, 30_000], 40_500) == [
+        {"title": "Cena 1", "start": 0, "end": 12, "subs": []},
+        {"title": "Cena 2", "start": 12, "end": 30, "subs": []},
+        {"title": "Cena 3", "start": 30, "end": 41, "subs": []},
+    ]
@@ -0,0 +1,90 @@
+"""Testes da folha de quadros da barra de progresso com um extrator de quadros simulado."""
+
+import io
+import os
+import threading
+from pathlib import Path
+
+from PIL import Image
+
+from gui.scrub_preview import (
+    SpriteSheet,
+    build_sprite_sheet,
+    load_or_build_sprite_sheet,
+    sprite_interval,
+)
+
+
+class FakeGrabber:
+    """Extrator de quadros 2 x 2 cuja cor vermelha é o índice do quadro; o quadro de 30 s não chega a tempo."""
+
+    width = 2
+    height = 2
+
+    def __init__(self, video_path: str = "", duration_ms: int = 45_000) -> None:
+        """Define a duração informada pela análise da mídia."""
+
+        self.duration_ms = duration_ms
+        self.grabs: list[int] = []
+        self.released = False
+
+    def grab(self, time_ms: int) -> bytes | None:
+        """Retorna pixels uniformes para o instante pedido."""
+
+        self.grabs.append(time_ms)
+        if time_ms == 30_000:
+            return None
+        return bytes([time_ms // 10_000, 0, 0]) * 4
+
+    def release(self) -> None:
+        """Marca o extrator como liberado."""
+
+        self.released = True
+
+
+def test_folha_posiciona_quadros_por_intervalo() -> None:
+    """Cada intervalo ocupa uma célula e quadros ausentes repetem o anterior."""
+
+    sheet = build_sprite_sheet(FakeGrabber(), 45_000, "1:2", threading.Event())
+
+    assert sheet is not None
+    assert (sheet.interval_ms, sheet.count, sheet.columns) == (10_000, 5, 5)
+    image = Image.open(io.BytesIO(sheet.data))
+    assert image.size == (10, 2)
+    assert [image.getpixel(sheet.cell(time_ms)[:2])[0] for time_ms in range(0, 50_000, 10_000)] == [0, 1, 2, 2, 4]
+    assert sheet.cell(-5) == (0, 0, 2, 2)
+    assert sheet.cell(99_000) == (8, 0, 10, 2)
+    assert sprite_interval(10 * 3_600_000) == 100_000
+
+
+def test_folha_quebra_linhas_e_respeita_interrupcao() -> None:
+    """Com mais quadros que colunas, a folha ganha linhas; ``stop`` descarta a passagem."""
+
+    sheet = SpriteSheet("", 10_000, 10, 128, 72, 25, b"")
+    assert sheet.cell(215_000) == (128, 144, 256, 216)
+
+    stop = threading.Event()
+    stop.set()
+    assert build_sprite_sheet(FakeGrabber(), 45_000, "", stop) is None
+
+
+def test_folha_e_reaproveitada_ate_o_video_mudar(tmp_path: Path) -> None:
+    """A folha gravada no ``.previews`` vale enquanto tamanho e data do vídeo não mudarem, sem criar um ``.chp``."""
+
+    video = tmp_path / "aula.mp4"
+    video.write_bytes(b"video")
+    grabbers: list[FakeGrabber] = []
+
+    def create_grabber(path: str) -> FakeGrabber:
+        grabbers.append(FakeGrabber(path))
+        return grabbers[-1]
+
+    first = load_or_build_sprite_sheet(str(video), threading.Event(), create_grabber)
+    assert load_or_build_sprite_sheet(str(video), threading.Event(), create_grabber) == first
+    assert len(grabbers) == 1 and grabbers[0].released
+    assert (tmp_path / "aula.previews").exists()
+    assert not (tmp_path / "aula.chp").exists()
+
+    os.utime(video, ns=(0, 0))
+    load_or_build_sprite_sheet(str(video), threading.Event(), create_grabber)
+    assert len(grabbers) == 2
@@ -0,0 +1,98 @@
+"""Testes do agendador de saltos com relógio e laço de eventos simulados."""
+
+from collections.abc import Callable
+from unittest.mock import Mock
+
+from gui.player_widget import PlayerWidget
+from gui.seek_scheduler import SeekScheduler
+
+
+class FakeLoop:
+    """Relógio manual com um único ``after`` pendente, como o laço de eventos do Tk."""
+
+    def __init__(self) -> None:
+        """Começa no instante zero sem agendamentos."""
+
+        self.now = 0.0
+        self.pending: tuple[float, Callable[[], None]] | None = None
+
+    def clock(self) -> float:
+        """Retorna o instante simulado em segundos."""
+
+        return self.now
+
+    def after(self, delay_ms: int, callback: Callable[[], None]) -> str:
+        """Agenda o retorno de chamada para o instante correspondente."""
+
+        self.pending = (self.now + delay_ms / 1000, callback)
+        return "after#1"
+
+    def after_cancel(self, _: str) -> None:
+        """Descarta o agendamento pendente."""
+
+        self.pending = None
+
+    def advance(self, seconds: float) -> None:
+        """Avança o relógio e executa o agendamento vencido."""
+
+        self.now += seconds
+        if self.pending is not None and self.pending[0] <= self.now + 1e-9:
+            callback = self.pending[1]
+            self.pending = None
+            callback()
+
+
+def _scheduler(loop: FakeLoop, applied: list[int]) -> SeekScheduler:
+    """Cria um agendador de 100 ms que registra os destinos aplicados."""
+
+    return SeekScheduler(loop, applied.append, interval_ms=100, clock=loop.clock)
+
+
+def test_rajada_aplica_primeiro_e_ultimo_destino() -> None:
+    """Durante o arraste, o primeiro pedido vai na hora e só o último dos seguintes é aplicado."""
+
+    loop = FakeLoop()
+    applied: list[int] = []
+    scheduler = _scheduler(loop, applied)
+
+    for target in range(1_000, 31_000, 1_000):
+        scheduler.request(target)
+        loop.advance(0.002)
+
+    assert applied == [1_000]
+    loop.advance(0.1)
+    assert applied == [1_000, 30_000]
+
+
+def test_soltar_aplica_destino_preciso_e_cancela_pendente() -> None:
+    """``flush`` descarta a espera e aplica o destino final uma única vez."""
+
+    loop = FakeLoop()
+    applied: list[int] = []
+    scheduler = _scheduler(loop, applied)
+    scheduler.request(1_000)
+    scheduler.request(2_000)
+
+    scheduler.flush(2_500)
+    loop.advance(1)
+
+    assert applied == [1_000, 2_500]
+    assert loop.pending is None
+
+
+def test_saltos_repetidos_acumulam_sobre_o_destino_esperado() -> None:
+    """A repetição da tecla soma os saltos mesmo antes de o VLC informar o novo tempo."""
+
+    loop = FakeLoop()
+    player_widget = object.__new__(PlayerWidget)
+    player_widget.player = Mock()
+    player_widget.player.get_time.return_value = 10_000
+    player_widget.player.get_length.return_value = 60_000
+    player_widget.seeks = SeekScheduler(loop, player_widget.player.set_time, interval_ms=100, clock=loop.clock)
+
+    for _ in range(4):
+        player_widget.jump(5)
+    player_widget.jump(50)
+    loop.advance(0.1)
+
+    assert [call.args[0] for call in player_widget.player.set_time.call_args_list] == [15_000, 60_000]
@@ -0,0 +1,88 @@
+"""Testes do índice de sessões com resumos em cache dos arquivos auxiliares."""
+
+import os
+from pathlib import Path
+
+from logic import ChapterManager, SubtitleManager
+from session_index import SessionIndex
+
+
+def _video(folder: Path, name: str) -> str:
+    """Cria um arquivo de vídeo vazio e retorna seu caminho."""
+
+    path = folder / name
+    path.write_bytes(b"")
+    return str(path)
+
+
+def test_resumo_de_video_aberto_e_duracao(tmp_path: Path) -> None:
+    """A abertura registra contagens de capítulos, legendas e imagens, e o player informa a duração."""
+
+    video = _video(tmp_path, "aula.mp4")
+    ChapterManager(video).save(
+        [{"title": "Início", "start": 0, "end": 10}, {"title": "Fim", "start": 10, "end": 20}], []
+    )
+    SubtitleManager(video).save([{"start": 0, "end": 500, "text": "Olá"}])
+    index = SessionIndex(tmp_path / "dados" / "sessoes.db")
+
+    index.record_open(video)
+    index.record_duration(video, 95_000)
+    index.record_duration(video, 0)
+
+    [summary] = index.summaries()
+    assert summary.path == video
+    assert summary.opened_at is not None
+    assert (summary.duration_ms, summary.chapters, summary.cues, summary.images) == (95_000, 2, 1, 0)
+
+
+def test_atualizacao_incremental_inclui_pasta_e_rele_apenas_alterados(tmp_path: Path) -> None:
+    """Somente vídeos novos ou com ``.chp``/``.srt`` de data diferente são resumidos outra vez."""
+
+    first = _video(tmp_path, "a.mp4")
+    second = _video(tmp_path, "b.mkv")
+    (tmp_path / "notas.txt").write_text("", encoding="utf-8")
+    index = SessionIndex(tmp_path / "sessoes.db")
+    index.record_open(first)
+    index.add_folder(str(tmp_path))
+
+    assert index.refresh() == 1
+    assert index.refresh() == 0
+    assert [summary.path for summary in index.summaries()] == [first, second]
+
+    SubtitleManager(second).save([{"start": 0, "end": 1, "text": "a"}, {"start": 2, "end": 3, "text": "b"}])
+    os.utime(tmp_path / "b.srt", ns=(1, 1))
+    os.remove(first)
+
+    assert index.refresh() == 1
+    [summary] = index.summaries()
+    assert (summary.path, summary.cues, summary.opened_at) == (second, 2, None)
+    assert index.folders() == [str(tmp_path)]
+
+
+def test_chp_ilegivel_fica_sem_contagem(tmp_path: Path) -> None:
+    """Um ``.chp`` corrompido não impede a indexação e aparece com contagens desconhecidas."""
+
+    video = _video(tmp_path, "ruim.mp4")
+    (tmp_path / "ruim.chp").write_bytes(b"isto nao e sqlite")
+    index = SessionIndex(tmp_path / "sessoes.db")
+
+    index.record_open(video)
+
+    [summary] = index.summaries()
+    assert (summary.chapters, summary.images, summary.cues) == (None, None, 0)
+
+
+def test_remover_pasta_mantem_videos_abertos(tmp_path: Path) -> None:
+    """Deixar de vigiar uma pasta descarta apenas os vídeos dela que nunca foram abertos."""
+
+    opened = _video(tmp_path, "a.mp4")
+    _video(tmp_path, "b.mp4")
+    index = SessionIndex(tmp_path / "sessoes.db")
+    index.add_folder(str(tmp_path))
+    index.refresh()
+    index.record_open(opened)
+
+    index.remove_folder(str(tmp_path))
+
+    assert [summary.path for summary in index.summaries()] == [opened]
+    assert index.folders() == []
@@ -0,0 +1,80 @@
+"""Testes da detecção de fala sobre envelopes montados a partir de WAVs sintéticos."""
+
+import wave
+from itertools import pairwise
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from speech import MAX_CUE_MS, cue_skeletons, snap_cues, speech_segments
+from waveform import SAMPLE_RATE, Envelope, build_envelope
+
+
+def envelope_with_bursts(tmp_path: Path, seconds: float, bursts: list[tuple[float, float]]) -> Envelope:
+    """Gera ruído de fundo fraco com tons fortes nos intervalos ``bursts`` e calcula o envelope."""
+
+    rng = np.random.default_rng(7)
+    times = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    samples = rng.normal(0, 30, len(times))
+    for start, end in bursts:
+        inside = (times >= start) & (times < end)
+        samples[inside] += 12_000 * np.sin(2 * np.pi * 220 * times[inside])
+    with wave.open(str(tmp_path / "audio.wav"), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(np.clip(samples, -32_768, 32_767).astype("<i2").tobytes())
+    build_envelope(str(tmp_path / "audio.wav"), str(tmp_path / "video.waveform"))
+    return Envelope.open(str(tmp_path / "video.waveform"))
+
+
+def test_trechos_de_fala_unem_pausas_curtas_e_dividem_os_longos(tmp_path: Path) -> None:
+    """Pausas menores que o mínimo são preenchidas, estalos curtos somem e falas longas são divididas."""
+
+    bursts = [(1.0, 2.0), (2.1, 3.0), (5.0, 5.1), (8.0, 10.0), (10.5, 25.0)]
+    segments = speech_segments(envelope_with_bursts(tmp_path, 30, bursts))
+
+    assert segments[0] == pytest.approx((1_000, 3_000), abs=10)
+    assert segments[1] == pytest.approx((8_000, 10_000), abs=10)
+    assert segments[2][0] == pytest.approx(10_500, abs=10)
+    assert segments[-1][1] == pytest.approx(25_000, abs=10)
+    assert all(end - start <= MAX_CUE_MS for start, end in segments)
+    assert all(previous[1] <= following[0] for previous, following in pairwise(segments))
+
+
+def test_esqueletos_evitam_legendas_existentes_e_bordas_sao_ajustadas() -> None:
+    """Só trechos sem legenda viram esqueletos; bordas próximas da fala são movidas até ela."""
+
+    segments = [(1_000, 3_000), (8_000, 10_000), (12_000, 14_000)]
+    subtitles = [{"start": 8_300, "end": 9_700, "text": "Olá"}, {"start": 15_000, "end": 16_000, "text": "Longe"}]
+
+    assert cue_skeletons(segments, subtitles) == [
+        {"start": 1_000, "end": 3_000, "text": ""},
+        {"start": 12_000, "end": 14_000, "text": ""},
+    ]
+    assert snap_cues(subtitles, segments) == 1
+    assert subtitles == [
+        {"start": 8_000, "end": 10_000, "text": "Olá"},
+        {"start": 15_000, "end": 16_000, "text": "Longe"},
+    ]
+
+
+def test_ajuste_de_bordas_nao_sobrepoe_legendas_vizinhas() -> None:
+    """Duas legendas seguidas em volta de um mesmo trecho de fala continuam sem sobreposição depois do ajuste."""
+
+    subtitles = [{"start": 1_200, "end": 2_800, "text": "Primeira"}, {"start": 2_850, "end": 3_300, "text": "Segunda"}]
+
+    assert snap_cues(subtitles, [(1_000, 3_000)]) == 2
+    assert subtitles == [
+        {"start": 1_000, "end": 2_850, "text": "Primeira"},
+        {"start": 2_850, "end": 3_000, "text": "Segunda"},
+    ]
+
+    subtitles = [{"start": 1_000, "end": 2_750, "text": "Primeira"}, {"start": 2_800, "end": 4_900, "text": "Segunda"}]
+
+    assert snap_cues(subtitles, [(1_000, 2_000), (2_700, 5_000)]) == 1
+    assert subtitles == [
+        {"start": 1_000, "end": 2_750, "text": "Primeira"},
+        {"start": 2_750, "end": 5_000, "text": "Segunda"},
+    ]
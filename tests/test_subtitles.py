@@ -1,10 +1,20 @@
 """Testes dos utilitários e da persistência segura de legendas SRT."""
 
+import random
 from pathlib import Path
 
 import pytest
 
-from logic import DataLoadError, SubtitleManager, fmt_srt_time, parse_srt_time
+from logic import (
+    DataLoadError,
+    SubtitleChecker,
+    SubtitleManager,
+    SubtitleTimeline,
+    fmt_srt_time,
+    issue_codes,
+    parse_srt_time,
+    subtitle_issues,
+)
 
 
 def test_fmt_srt_time() -> None:
@@ -56,3 +66,80 @@ def test_subtitle_manager_rejeita_bloco_invalido_sem_sobrescrever(tmp_path: Path
     with pytest.raises(DataLoadError):
         manager.load()
     assert srt_path.read_text(encoding="utf-8") == original
+
+
+def test_linha_do_tempo_encontra_legendas_ativas_e_sobrepostas() -> None:
+    """A busca respeita o fim exclusivo e inclui legendas longas iniciadas antes da última."""
+
+    timeline = SubtitleTimeline(
+        [
+            {"start": 5_000, "end": 6_000, "text": "Depois"},
+            {"start": 0, "end": 10_000, "text": "Narração"},
+            {"start": 1_000, "end": 2_000, "text": "Fala"},
+        ]
+    )
+
+    assert timeline.active(1_500) == ["Narração", "Fala"]
+    assert timeline.active(2_000) == ["Narração"]
+    assert timeline.active(5_500) == ["Narração", "Depois"]
+    assert timeline.active(10_000) == []
+    assert SubtitleTimeline([]).active(0) == []
+
+
+def test_verificacao_aponta_problemas_na_ordem_recebida() -> None:
+    """Sobreposição, intervalo curto, duração e leitura rápida são marcados em cada legenda afetada."""
+
+    subtitles = [
+        {"start": 5_000, "end": 13_000, "text": "Longa"},
+        {"start": 0, "end": 1_000, "text": "Uma"},
+        {"start": 500, "end": 2_000, "text": "Outra"},
+        {"start": 2_050, "end": 2_900, "text": "Texto\ncomprido demais"},
+        {"start": 14_000, "end": 16_000, "text": "Tranquila"},
+    ]
+
+    assert [issue_codes(mask) for mask in subtitle_issues(subtitles).tolist()] == [
+        ("long",),
+        ("overlap",),
+        ("overlap", "gap"),
+        ("gap", "cps"),
+        (),
+    ]
+    assert len(subtitle_issues([])) == 0
+
+
+def test_verificacao_incremental_acompanha_a_verificacao_completa() -> None:
+    """Cada edição relida por ``SubtitleChecker.update`` dá as mesmas máscaras de uma verificação do zero."""
+
+    rng = random.Random(7)
+    subtitles = []
+    for index in range(200):
+        start = index * 1_500 + rng.randrange(-400, 400)
+        subtitles.append({"start": start, "end": start + rng.randrange(500, 8_000), "text": "x" * rng.randrange(40)})
+    subtitles.sort(key=lambda item: item["start"])
+    checker = SubtitleChecker(subtitles)
+
+    for _ in range(300):
+        subtitle = rng.choice(subtitles)
+        previous = {id(item): mask for item, mask in zip(subtitles, checker.masks.tolist())}
+        subtitle["start"] = max(0, subtitle["start"] + rng.randrange(-5_000, 5_000))
+        subtitle["end"] = subtitle["start"] + rng.randrange(500, 8_000)
+        subtitle["text"] = "y" * rng.randrange(60)
+        subtitles.sort(key=lambda item: item["start"])
+        changed = checker.update(subtitle)
+
+        expected = subtitle_issues(subtitles).tolist()
+        assert checker.masks.tolist() == expected
+        assert set(changed.tolist()) == {subtitles.index(subtitle)} | {
+            index for index, item in enumerate(subtitles) if expected[index] != previous[id(item)]
+        }
+
+
+def test_verificacao_incremental_refaz_tudo_quando_a_lista_muda() -> None:
+    """Uma legenda incluída fora do verificador faz ``update`` reler a lista inteira."""
+
+    subtitles = [{"start": 0, "end": 1_000, "text": "Uma"}]
+    checker = SubtitleChecker(subtitles)
+    subtitles.append({"start": 1_020, "end": 2_000, "text": "Outra"})
+
+    assert checker.update(subtitles[1]) is None
+    assert [issue_codes(mask) for mask in checker.masks.tolist()] == [("gap",), ("gap",)]
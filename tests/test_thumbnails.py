@@ -0,0 +1,207 @@
+"""Testes das miniaturas de capítulos com um extrator de quadros simulado."""
+
+import ctypes
+import io
+import os
+from pathlib import Path
+from unittest.mock import Mock
+
+from PIL import Image
+
+from gui.thumbnails import (
+    ChapterThumbnails,
+    FrameGrabber,
+    ThumbnailWorker,
+    bgrx_to_rgb,
+    encode_png,
+    fit_size,
+)
+from logic import ChapterManager, EditJournal
+
+
+class FakeGrabber:
+    """Extrator que pinta cada quadro com uma cor derivada do instante pedido."""
+
+    width = 4
+    height = 2
+
+    def __init__(self, video_path: str) -> None:
+        """Registra os instantes decodificados."""
+
+        self.grabs: list[int] = []
+        self.released = False
+
+    def grab(self, time_ms: int) -> bytes | None:
+        """Retorna pixels RGB uniformes, ou ``None`` para instantes além do fim do vídeo."""
+
+        self.grabs.append(time_ms)
+        if time_ms >= 60_000:
+            return None
+        return bytes([time_ms // 1000, 0, 255]) * (self.width * self.height)
+
+    def release(self) -> None:
+        """Marca o extrator como liberado."""
+
+        self.released = True
+
+
+class SeekingPlayer:
+    """Player simulado que, após cada busca, ainda entrega um quadro da posição anterior antes do quadro pedido."""
+
+    def __init__(self) -> None:
+        """Começa no início do vídeo, sem quadros a entregar."""
+
+        self.time = 0
+        self.pending: list[int] = []
+
+    def play(self) -> None:
+        """Entrega o primeiro quadro."""
+
+        self.pending.append(self.time)
+
+    def set_time(self, time_ms: int) -> None:
+        """Simula a busca: o quadro antigo ainda chega antes do novo."""
+
+        self.pending += [self.time, time_ms]
+
+    def get_time(self) -> int:
+        """Retorna o instante do último quadro entregue."""
+
+        return self.time
+
+    def __getattr__(self, _name: str) -> Mock:
+        """Aceita as demais chamadas do player sem efeito."""
+
+        return Mock()
+
+
+class DeliveredFrames:
+    """Substitui o evento de quadro pronto, entregando os quadros do player a cada espera."""
+
+    def __init__(self, grabber: FrameGrabber, player: SeekingPlayer) -> None:
+        """Guarda o extrator e o player simulado."""
+
+        self.grabber = grabber
+        self.player = player
+
+    def clear(self) -> None:
+        """Nada a fazer: os quadros são entregues em ``wait``."""
+
+    def set(self) -> None:
+        """Nada a fazer: chamado por ``_display``."""
+
+    def wait(self, _timeout: float) -> bool:
+        """Pinta o próximo quadro com o segundo do seu instante e o exibe, ou retorna ``False`` se não houver."""
+
+        if not self.player.pending:
+            return False
+        self.player.time = self.player.pending.pop(0)
+        grabber = self.grabber
+        ctypes.memset(grabber.address, self.player.time // 1000, grabber.width * grabber.height * 4)
+        grabber._display(None, None)
+        return True
+
+
+def _run(worker: ThumbnailWorker, *times: int) -> dict[int, bytes | None]:
+    """Envia os pedidos, aguarda todos os resultados e encerra o trabalhador."""
+
+    for time_ms in times:
+        assert worker.request(time_ms)
+    results = dict(worker.results.get(timeout=5) for _ in times)
+    worker.close()
+    worker.thread.join(timeout=5)
+    return results
+
+
+def test_png_gerado_preserva_pixels_e_proporcao() -> None:
+    """Os pixels ``RV32`` da libVLC viram um PNG RGB legível e as dimensões cabem na linha da árvore."""
+
+    rgb = bgrx_to_rgb(bytes([30, 20, 10, 0]) * 6)
+    image = Image.open(io.BytesIO(encode_png(3, 2, rgb)))
+
+    assert image.size == (3, 2)
+    assert image.getpixel((2, 1)) == (10, 20, 30)
+    assert fit_size(1920, 1080, 64, 36) == (64, 36)
+    assert fit_size(640, 480, 64, 36) == (48, 36)
+    assert fit_size(0, 0, 64, 36) == (64, 36)
+
+
+def test_trabalhador_guarda_no_chp_e_reaproveita_o_cache(tmp_path: Path) -> None:
+    """A segunda sessão lê as miniaturas do cache sem decodificar e quadros indisponíveis resultam em ``None``."""
+
+    video_path = str(tmp_path / "video.mp4")
+    manager = ChapterManager(video_path)
+    manager.save([{"title": "Abertura", "start": 5, "end": 10}, {"title": "Fim", "start": 70, "end": 80}], [])
+    grabbers: list[FakeGrabber] = []
+
+    def create_grabber(path: str) -> FakeGrabber:
+        grabbers.append(FakeGrabber(path))
+        return grabbers[-1]
+
+    first = _run(ThumbnailWorker(video_path, create_grabber), 5_000, 70_000)
+    assert first[70_000] is None
+    assert Image.open(io.BytesIO(first[5_000])).getpixel((0, 0)) == (5, 0, 255)
+    assert grabbers[0].released
+
+    second = _run(ThumbnailWorker(video_path, create_grabber), 5_000)
+    assert second == {5_000: first[5_000]}
+    assert len(grabbers) == 1
+
+    manager.save([{"title": "Outro", "start": 6, "end": 10}], [])
+    assert manager.previews.load_thumbnails() == {}
+
+
+def test_miniaturas_nao_invalidam_o_diario_de_edicoes(tmp_path: Path) -> None:
+    """Gravar miniaturas não altera o ``.chp``, então as edições do diário continuam recuperáveis."""
+
+    video_path = str(tmp_path / "video.mp4")
+    manager = ChapterManager(video_path)
+    manager.save([{"title": "Abertura", "start": 5, "end": 10}], [])
+    os.utime(manager.chp_path, ns=(0, 0))
+    journal = EditJournal(video_path)
+    journal.stage("chapters", [{"title": "Editado", "start": 5, "end": 10, "subs": []}])
+    journal.write_staged()
+    chp_bytes = Path(manager.chp_path).read_bytes()
+
+    assert _run(ThumbnailWorker(video_path, FakeGrabber), 5_000)[5_000] is not None
+
+    assert Path(manager.chp_path).read_bytes() == chp_bytes
+    assert os.stat(manager.chp_path).st_mtime_ns == 0
+    assert list(journal.pending()) == ["chapters"]
+
+
+def test_busca_para_tras_ignora_quadro_antigo() -> None:
+    """Um quadro posterior ao instante pedido, que ainda chega após voltar no vídeo, não é aceito."""
+
+    player = SeekingPlayer()
+    media = Mock()
+    media.get_duration.return_value = 60_000
+    media.tracks_get.return_value = []
+    instance = Mock()
+    instance.media_new.return_value = media
+    instance.media_player_new.return_value = player
+    grabber = FrameGrabber("video.mp4", create_instance=lambda *_: instance)
+    grabber.frame_ready = DeliveredFrames(grabber, player)
+    size = grabber.width * grabber.height * 3
+
+    assert grabber.grab(40_000) == bytes([40]) * size
+    assert grabber.grab(10_000) == bytes([10]) * size
+
+
+def test_pedidos_repetidos_e_fila_cheia() -> None:
+    """O lado Tk pede cada instante uma vez e repete o pedido recusado pela fila limitada."""
+
+    widget = Mock()
+    worker = Mock()
+    worker.request.side_effect = [False, True]
+    thumbnails = ChapterThumbnails(widget, "video.mp4", Mock(), create_worker=lambda _: worker)
+
+    assert thumbnails.image(5) is None
+    assert thumbnails.image(5) is None
+    assert thumbnails.image(5) is None
+
+    assert [call.args[0] for call in worker.request.call_args_list] == [5_000, 5_000]
+    widget.after.assert_called_once()
+    thumbnails.close()
+    widget.after_cancel.assert_called_once()
+    worker.close.assert_called_once()
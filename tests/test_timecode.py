@@ -0,0 +1,159 @@
+"""Testes de propriedade que comparam o codec de tempos às implementações de referência."""
+
+import random
+from collections.abc import Callable
+
+import pytest
+
+from timecode import (
+    fmt_sec,
+    fmt_srt_time,
+    parse_flexible_time,
+    parse_srt_time,
+    parse_time,
+)
+
+
+def reference_fmt_sec(sec: int) -> str:
+    """Implementação original de ``fmt_sec`` baseada em ``divmod`` e f-strings."""
+
+    hours, sec = divmod(max(0, sec), 3600)
+    minutes, seconds = divmod(sec, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes:02d}:{seconds:02d}"
+
+
+def reference_fmt_srt_time(ms: int) -> str:
+    """Implementação original de ``fmt_srt_time``."""
+
+    ms = max(0, ms)
+    seconds, milliseconds = divmod(ms, 1000)
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+
+
+def reference_parse_time(txt: str) -> int:
+    """Implementação original de ``parse_time`` baseada em ``split``."""
+
+    parts = [int(part) for part in txt.strip().split(":")]
+    if len(parts) == 2:
+        minutes, seconds = parts
+        hours = 0
+    elif len(parts) == 3:
+        hours, minutes, seconds = parts
+    else:
+        raise ValueError("O tempo deve estar no formato hh:mm:ss ou mm:ss")
+    if hours < 0 or not 0 <= minutes <= 59 or not 0 <= seconds <= 59:
+        raise ValueError("Os componentes do tempo estão fora do intervalo permitido")
+    return hours * 3600 + minutes * 60 + seconds
+
+
+def reference_parse_flexible_time(txt: str) -> int:
+    """Implementação original de ``parse_flexible_time``."""
+
+    cleaned = txt.strip()
+    if ":" in cleaned:
+        return reference_parse_time(cleaned)
+    if not cleaned.isdigit():
+        raise ValueError("O tempo deve conter apenas dígitos")
+    digits = cleaned[-6:]
+    if len(digits) <= 2:
+        hours, minutes, seconds = 0, 0, int(digits)
+    elif len(digits) <= 4:
+        hours, minutes, seconds = 0, int(digits[:-2]), int(digits[-2:])
+    else:
+        hours, minutes, seconds = int(digits[:-4]), int(digits[-4:-2]), int(digits[-2:])
+    if minutes > 59 or seconds > 59:
+        raise ValueError("Os minutos e segundos devem estar entre 00 e 59")
+    return hours * 3600 + minutes * 60 + seconds
+
+
+def reference_parse_srt_time(txt: str) -> int:
+    """Implementação original de ``parse_srt_time`` baseada em ``replace`` e ``split``."""
+
+    cleaned = txt.strip().replace(".", ",")
+    if "," not in cleaned:
+        return reference_parse_flexible_time(cleaned) * 1000
+    time_part, milliseconds_part = cleaned.split(",", 1)
+    if not milliseconds_part.isdigit() or len(milliseconds_part) > 3:
+        raise ValueError("Os milissegundos devem conter de um a três dígitos")
+    return reference_parse_time(time_part) * 1000 + int(milliseconds_part.ljust(3, "0"))
+
+
+def _outcome(function: Callable[[str], int], text: str) -> tuple[str, object]:
+    """Resume o resultado de uma conversão como valor ou mensagem de erro."""
+
+    try:
+        return ("valor", function(text))
+    except ValueError as exc:
+        return ("erro", str(exc))
+
+
+def _random_time_texts(generator: random.Random, count: int) -> list[str]:
+    """Gera textos próximos dos formatos aceitos, incluindo variações inválidas."""
+
+    alphabet = "0123456789" * 4 + ":,. -+a٣"
+    texts: list[str] = []
+    for _ in range(count):
+        hours = generator.choice([0, 1, 9, 23, 99, 100, 1234])
+        minutes = generator.choice([0, 5, 59, 60, 99])
+        seconds = generator.choice([0, 7, 59, 60])
+        milliseconds = generator.choice(["000", "5", "50", "999", "1234", ""])
+        separator = generator.choice([",", ".", ""])
+        hour_part = generator.choice([f"{hours:02d}:", f"{hours}:", ""])
+        text = f"{hour_part}{minutes:02d}:{seconds:02d}{separator}{milliseconds}"
+        if generator.random() < 0.3:
+            position = generator.randrange(len(text))
+            text = text[:position] + generator.choice(alphabet) + text[position + 1 :]
+        if generator.random() < 0.2:
+            text = generator.choice([" ", "\t", ""]) + text + generator.choice([" ", "\n", ""])
+        if generator.random() < 0.1:
+            text = "".join(generator.choice(alphabet) for _ in range(generator.randint(0, 14)))
+        texts.append(text)
+    return texts
+
+
+def test_fmt_sec_equivale_a_referencia() -> None:
+    """Compara todos os segundos das primeiras horas e uma amostra de valores grandes."""
+
+    generator = random.Random(29)
+    values = list(range(-5, 40_000)) + [generator.randrange(10**9) for _ in range(20_000)]
+    for value in values:
+        assert fmt_sec(value) == reference_fmt_sec(value)
+
+
+def test_fmt_srt_time_equivale_a_referencia() -> None:
+    """Compara milissegundos de todo o primeiro minuto e uma amostra de tempos longos."""
+
+    generator = random.Random(290)
+    values = list(range(-5, 70_000)) + [generator.randrange(10**12) for _ in range(20_000)]
+    for value in values:
+        assert fmt_srt_time(value) == reference_fmt_srt_time(value)
+
+
+@pytest.mark.parametrize(
+    ("function", "reference"),
+    [
+        (parse_time, reference_parse_time),
+        (parse_flexible_time, reference_parse_flexible_time),
+        (parse_srt_time, reference_parse_srt_time),
+    ],
+)
+def test_conversoes_de_texto_equivalem_a_referencia(
+    function: Callable[[str], int], reference: Callable[[str], int]
+) -> None:
+    """Aceita, rejeita e descreve erros exatamente como as implementações originais."""
+
+    for text in _random_time_texts(random.Random(2029), 30_000):
+        assert _outcome(function, text) == _outcome(reference, text), text
+
+
+def test_ida_e_volta_dos_formatos_fixos() -> None:
+    """Garante que todo texto formatado seja lido de volta sem perda."""
+
+    generator = random.Random(9)
+    for _ in range(20_000):
+        milliseconds = generator.randrange(100 * 3_600_000)
+        assert parse_srt_time(fmt_srt_time(milliseconds)) == milliseconds
+        seconds = milliseconds // 1000
+        assert parse_time(fmt_sec(seconds)) == seconds
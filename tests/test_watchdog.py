@@ -0,0 +1,87 @@
+"""Testes do vigia do laço de eventos com um agendador simulado no lugar do Tk."""
+
+import logging
+import time
+from collections.abc import Callable
+
+import pytest
+
+from gui.watchdog import EventLoopWatchdog
+from profiling import Profiler
+
+
+class FakeScheduler:
+    """Guarda o último ``after`` agendado para que o teste decida quando o laço volta a responder."""
+
+    def __init__(self) -> None:
+        """Começa sem agendamentos."""
+
+        self.pending: Callable[[], None] | None = None
+
+    def after(self, _: int, callback: Callable[[], None]) -> str:
+        """Registra o retorno de chamada como o próximo pulso."""
+
+        self.pending = callback
+        return "after#1"
+
+    def after_cancel(self, _: str) -> None:
+        """Descarta o pulso pendente."""
+
+        self.pending = None
+
+    def run_pending(self) -> None:
+        """Executa o pulso pendente, como faria o laço de eventos."""
+
+        callback, self.pending = self.pending, None
+        assert callback is not None
+        callback()
+
+
+def _bloqueia_o_laco(seconds: float) -> None:
+    """Simula um trabalho síncrono na thread do Tk."""
+
+    time.sleep(seconds)
+
+
+def test_travamento_e_atribuido_ao_ponto_de_chamada(caplog: pytest.LogCaptureFixture) -> None:
+    """O ponto de chamada registrado é a função do projeto que bloqueou a thread principal."""
+
+    scheduler = FakeScheduler()
+    source = Profiler()
+    source.enabled = True
+    watchdog = EventLoopWatchdog(scheduler, interval_ms=1, threshold_ms=40, sample_interval_ms=5, source=source)
+    watchdog.start()
+    try:
+        _bloqueia_o_laco(0.3)
+        with caplog.at_level(logging.WARNING, logger="gui.watchdog"):
+            scheduler.run_pending()
+    finally:
+        watchdog.stop()
+
+    [stall] = watchdog.stalls
+    assert stall.duration >= 0.25
+    assert stall.call_site.startswith("tests/test_watchdog.py:")
+    assert stall.call_site.endswith("em _bloqueia_o_laco")
+    assert stall.hits > 0
+    assert "_bloqueia_o_laco" in stall.stack
+    assert "Laço de eventos travado" in caplog.text
+    assert source.percentiles("tk.stall")["count"] == 1
+    assert source.lag_percentiles()["count"] == 1
+
+
+def test_pulso_pontual_nao_gera_travamento() -> None:
+    """Atrasos abaixo do limite alimentam apenas as estatísticas de atraso."""
+
+    scheduler = FakeScheduler()
+    source = Profiler()
+    watchdog = EventLoopWatchdog(scheduler, interval_ms=1, threshold_ms=500, source=source)
+    watchdog.start()
+    try:
+        for _ in range(3):
+            scheduler.run_pending()
+    finally:
+        watchdog.stop()
+
+    assert not watchdog.stalls
+    assert source.lag_percentiles()["count"] == 3
+    assert scheduler.pending is None
@@ -0,0 +1,102 @@
+"""Testes do envelope de áudio em várias resoluções, com WAVs sintéticos no lugar da decodificação pela libVLC."""
+
+import os
+import threading
+import wave
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import waveform
+from gui.waveform_view import wave_polygon
+from waveform import (
+    BIN_MS,
+    SAMPLE_RATE,
+    Envelope,
+    build_envelope,
+    decode_audio,
+    load_envelope,
+)
+
+
+def write_wav(path: Path, samples: np.ndarray) -> None:
+    """Grava amostras mono de 16 bits a 8 kHz."""
+
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(samples.astype("<i2").tobytes())
+
+
+def test_envelope_tem_niveis_e_le_apenas_o_trecho(tmp_path: Path) -> None:
+    """Um segundo de silêncio seguido de um tom gera níveis coerentes e colunas por pixel."""
+
+    seconds = np.arange(3 * SAMPLE_RATE) / SAMPLE_RATE
+    samples = np.where(seconds >= 1, 16_384 * np.sin(2 * np.pi * 440 * seconds), 0)
+    write_wav(tmp_path / "audio.wav", samples)
+    build_envelope(str(tmp_path / "audio.wav"), str(tmp_path / "video.waveform"))
+
+    envelope = Envelope.open(str(tmp_path / "video.waveform"))
+
+    assert isinstance(envelope.data, np.memmap)
+    assert envelope.duration_ms == 3_000
+    assert envelope.sizes[:3] == [600, 300, 150] and envelope.sizes[-1] == 1
+    assert envelope.level(0)[:200].max() == 0
+    assert envelope.level(0)[300, 1] == pytest.approx(0.5, abs=0.01)
+    assert envelope.level(0)[300, 0] == pytest.approx(0.5 / np.sqrt(2), abs=0.01)
+    assert float(envelope.level(len(envelope.sizes) - 1)[0, 1]) == pytest.approx(0.5, abs=0.01)
+
+    assert envelope.level_for(BIN_MS) == 0
+    assert envelope.level_for(40) == 3
+    columns = envelope.columns(-1_000, 5_000, 6)
+    assert columns[[0, 1, 5], 1].tolist() == [0, 0, 0]
+    assert columns[[2, 3], 1] == pytest.approx([0.5, 0.5], abs=0.01)
+    zoomed = envelope.columns(990, 1_010, 20)
+    assert zoomed[0, 1] == 0 and zoomed[-1, 1] > 0.4
+
+
+def test_envelope_e_refeito_apenas_quando_o_video_muda(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """O ``.waveform`` mais novo que o vídeo é reaproveitado sem decodificar o áudio de novo."""
+
+    video = tmp_path / "aula.mp4"
+    video.write_bytes(b"video")
+    decoded: list[str] = []
+
+    def fake_decode(video_path: str, wav_path: str, stop: threading.Event, create_instance: object) -> bool:
+        decoded.append(video_path)
+        write_wav(Path(wav_path), np.full(SAMPLE_RATE, 1_000))
+        return not stop.is_set()
+
+    monkeypatch.setattr(waveform, "decode_audio", fake_decode)
+
+    assert load_envelope(str(video), threading.Event()).duration_ms == 1_000
+    assert load_envelope(str(video), threading.Event()).duration_ms == 1_000
+    assert len(decoded) == 1
+
+    future = os.stat(tmp_path / "aula.waveform").st_mtime_ns + 1_000_000_000
+    os.utime(video, ns=(future, future))
+    stop = threading.Event()
+    stop.set()
+    assert load_envelope(str(video), stop) is None
+    assert len(decoded) == 2
+
+
+def test_libvlc_ausente_vira_erro_de_sistema(tmp_path: Path) -> None:
+    """A falta da libVLC, que o python-vlc sinaliza com ``NameError``, chega à faixa da onda como ``OSError``."""
+
+    def missing_libvlc(*_options: str) -> None:
+        raise NameError("no function 'libvlc_new'")
+
+    wav_path = str(tmp_path / "audio.wav")
+    with pytest.raises(OSError, match="libVLC"):
+        decode_audio("video.mp4", wav_path, threading.Event(), missing_libvlc)
+    with pytest.raises(OSError, match="libVLC"):
+        decode_audio("video.mp4", wav_path, threading.Event(), lambda *_: None)
+
+
+def test_poligono_da_onda_e_simetrico() -> None:
+    """Cada coluna vira um vértice acima e outro abaixo do centro da faixa."""
+
+    assert wave_polygon([0.0, 1.0], 10) == [0, 5.0, 1, 0.0, 1, 10.0, 0, 5.0]
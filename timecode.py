@@ -0,0 +1,123 @@
+"""Conversão rápida entre tempos numéricos e os textos exibidos nas árvores e gravados nos ``.srt``.
+
+Os formatos fixos (``mm:ss``, ``hh:mm:ss`` e ``hh:mm:ss,mmm``) são resolvidos com fatiamento e tabelas
+pré-calculadas; qualquer outra entrada segue o caminho geral, que preserva as regras e mensagens originais.
+"""
+
+from __future__ import annotations
+
+_PAD2: tuple[str, ...] = tuple(f"{value:02d}" for value in range(100))
+_PAD3: tuple[str, ...] = tuple(f"{value:03d}" for value in range(1000))
+_MINUTES_SECONDS: tuple[str, ...] = tuple(f"{_PAD2[value // 60]}:{_PAD2[value % 60]}" for value in range(3600))
+_DIGITS2: dict[str, int] = {text: value for value, text in enumerate(_PAD2)}
+_DIGITS3: dict[str, int] = {text: value for value, text in enumerate(_PAD3)}
+_SEXAGESIMAL: dict[str, int] = {text: value for text, value in _DIGITS2.items() if value < 60}
+
+
+def fmt_sec(sec: int) -> str:
+    """Converte segundos para formato ``hh:mm:ss`` ou ``mm:ss``."""
+
+    if sec <= 0:
+        return "00:00"
+    if sec < 3600:
+        return _MINUTES_SECONDS[sec]
+    hours, sec = divmod(sec, 3600)
+    return f"{_PAD2[hours] if hours < 100 else hours}:{_MINUTES_SECONDS[sec]}"
+
+
+def fmt_srt_time(ms: int) -> str:
+    """Converte milissegundos em formato de legenda SRT ``hh:mm:ss,mss``."""
+
+    if ms <= 0:
+        return "00:00:00,000"
+    seconds, milliseconds = divmod(ms, 1000)
+    hours, seconds = divmod(seconds, 3600)
+    return f"{_PAD2[hours] if hours < 100 else hours}:{_MINUTES_SECONDS[seconds]},{_PAD3[milliseconds]}"
+
+
+def _parse_time_general(txt: str) -> int:
+    """Interpreta ``hh:mm:ss`` ou ``mm:ss`` com qualquer largura de campo."""
+
+    parts = [int(part) for part in txt.strip().split(":")]
+    if len(parts) == 2:
+        minutes, seconds = parts
+        hours = 0
+    elif len(parts) == 3:
+        hours, minutes, seconds = parts
+    else:
+        raise ValueError("O tempo deve estar no formato hh:mm:ss ou mm:ss")
+    if hours < 0 or not 0 <= minutes <= 59 or not 0 <= seconds <= 59:
+        raise ValueError("Os componentes do tempo estão fora do intervalo permitido")
+    return hours * 3600 + minutes * 60 + seconds
+
+
+def parse_time(txt: str) -> int:
+    """Converte strings ``hh:mm:ss`` ou ``mm:ss`` em segundos válidos."""
+
+    cleaned = txt.strip()
+    size = len(cleaned)
+    if size == 8 and cleaned[2] == ":" and cleaned[5] == ":":
+        hours = _DIGITS2.get(cleaned[0:2])
+        minutes = _SEXAGESIMAL.get(cleaned[3:5])
+        seconds = _SEXAGESIMAL.get(cleaned[6:8])
+        if hours is not None and minutes is not None and seconds is not None:
+            return hours * 3600 + minutes * 60 + seconds
+    elif size == 5 and cleaned[2] == ":":
+        minutes = _SEXAGESIMAL.get(cleaned[0:2])
+        seconds = _SEXAGESIMAL.get(cleaned[3:5])
+        if minutes is not None and seconds is not None:
+            return minutes * 60 + seconds
+    return _parse_time_general(cleaned)
+
+
+def parse_flexible_time(txt: str) -> int:
+    """Converte ``hh:mm:ss``, ``mm:ss`` ou dígitos ``hhmmss`` em segundos."""
+
+    cleaned = txt.strip()
+    if ":" in cleaned:
+        return parse_time(cleaned)
+    if not cleaned.isdigit():
+        raise ValueError("O tempo deve conter apenas dígitos")
+
+    digits = cleaned[-6:]
+    if len(digits) <= 2:
+        hours, minutes, seconds = 0, 0, int(digits)
+    elif len(digits) <= 4:
+        hours = 0
+        minutes = int(digits[:-2])
+        seconds = int(digits[-2:])
+    else:
+        hours = int(digits[:-4])
+        minutes = int(digits[-4:-2])
+        seconds = int(digits[-2:])
+    if minutes > 59 or seconds > 59:
+        raise ValueError("Os minutos e segundos devem estar entre 00 e 59")
+    return hours * 3600 + minutes * 60 + seconds
+
+
+def _parse_srt_time_general(cleaned: str) -> int:
+    """Interpreta tempos de legenda fora da largura fixa, com ou sem milissegundos."""
+
+    cleaned = cleaned.replace(".", ",")
+    if "," not in cleaned:
+        return parse_flexible_time(cleaned) * 1000
+
+    time_part, milliseconds_part = cleaned.split(",", 1)
+    if not milliseconds_part.isdigit() or len(milliseconds_part) > 3:
+        raise ValueError("Os milissegundos devem conter de um a três dígitos")
+    milliseconds = int(milliseconds_part.ljust(3, "0"))
+    return parse_time(time_part) * 1000 + milliseconds
+
+
+def parse_srt_time(txt: str) -> int:
+    """Converte ``hh:mm:ss,mss`` ou ``mm:ss,mss`` em milissegundos."""
+
+    cleaned = txt.strip()
+    if len(cleaned) == 12 and cleaned[2] == ":" and cleaned[5] == ":" and (cleaned[8] == "," or cleaned[8] == "."):
+        hours = _DIGITS2.get(cleaned[0:2])
+        minutes = _SEXAGESIMAL.get(cleaned[3:5])
+        seconds = _SEXAGESIMAL.get(cleaned[6:8])
+        milliseconds = _DIGITS3.get(cleaned[9:12])
+        if hours is not None and minutes is not None and seconds is not None and milliseconds is not None:
+            return ((hours * 60 + minutes) * 60 + seconds) * 1000 + milliseconds
+    return _parse_srt_time_general(cleaned)
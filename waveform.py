@@ -0,0 +1,224 @@
+"""Envelope de amplitude da trilha de áudio em várias resoluções, guardado em disco para leitura por ``memmap``.
+
+A trilha é decodificada uma única vez pela libVLC, convertida em PCM mono de 16 bits a 8 kHz e gravada em um WAV
+temporário pela saída de fluxo (``sout``), que não acompanha o relógio de reprodução e por isso termina bem antes da
+duração do vídeo. O WAV é lido em blocos e reduzido com NumPy a um envelope de RMS, pico e taxa de cruzamentos por
+zero por janela de 5 ms; cada nível seguinte junta pares de janelas do anterior. Todos os níveis ficam em um único arquivo ``.npy`` de ``float16``
+ao lado do vídeo (``.waveform``), aberto com ``mmap_mode="r"``: desenhar um trecho lê apenas o nível e as janelas
+necessárias.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import tempfile
+import threading
+import wave
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import vlc
+
+SAMPLE_RATE = 8_000
+BIN_MS = 5
+BIN_FRAMES = SAMPLE_RATE * BIN_MS // 1000
+CHUNK_BINS = 12_000
+DECODE_POLL_S = 0.1
+CHANNELS = ("rms", "peak", "zcr")
+
+
+def waveform_path(video_path: str) -> str:
+    """Retorna o caminho do envelope guardado ao lado do vídeo."""
+
+    return os.path.splitext(video_path)[0] + ".waveform"
+
+
+def _level_sizes(base_count: int) -> list[int]:
+    """Retorna a quantidade de janelas de cada nível, do mais detalhado até o de uma única janela."""
+
+    sizes = [base_count]
+    while sizes[-1] > 1:
+        sizes.append((sizes[-1] + 1) // 2)
+    return sizes
+
+
+def _pyramid_size(base_count: int) -> int:
+    """Total de janelas de todos os níveis a partir de ``base_count`` janelas no primeiro."""
+
+    return sum(_level_sizes(base_count))
+
+
+def _base_count(total: int) -> int:
+    """Recupera a quantidade de janelas do primeiro nível a partir do total gravado no arquivo."""
+
+    return bisect_left(range(total + 1), total, key=_pyramid_size)
+
+
+def _bin_envelope(samples: np.ndarray) -> np.ndarray:
+    """Calcula RMS, pico e a fração de cruzamentos por zero de cada janela de ``BIN_FRAMES`` amostras de 16 bits.
+
+    A última janela é completada com silêncio.
+    """
+
+    remainder = -len(samples) % BIN_FRAMES
+    if remainder:
+        samples = np.concatenate((samples, np.zeros(remainder, dtype=samples.dtype)))
+    windows = samples.reshape(-1, BIN_FRAMES).astype(np.float32) / 32768.0
+    crossings = np.count_nonzero(np.diff(np.signbit(windows), axis=1), axis=1) / (BIN_FRAMES - 1)
+    return np.stack((np.sqrt(np.mean(windows * windows, axis=1)), np.max(np.abs(windows), axis=1), crossings), axis=1)
+
+
+def _halve(level: np.ndarray) -> np.ndarray:
+    """Junta pares de janelas: RMS pela média das energias, pico pelo maior valor e cruzamentos pela média."""
+
+    if len(level) % 2:
+        level = np.concatenate((level, np.zeros((1, level.shape[1]), dtype=level.dtype)))
+    first, second = level[0::2], level[1::2]
+    rms = np.sqrt((first[:, 0] ** 2 + second[:, 0] ** 2) / 2)
+    crossings = (first[:, 2] + second[:, 2]) / 2
+    return np.stack((rms, np.maximum(first[:, 1], second[:, 1]), crossings), axis=1)
+
+
+def build_envelope(wav_path: str, destination: str) -> None:
+    """Lê um WAV PCM de 16 bits em blocos e grava o envelope de todos os níveis em ``destination``."""
+
+    with wave.open(wav_path, "rb") as wav:
+        if wav.getsampwidth() != 2 or wav.getframerate() != SAMPLE_RATE:
+            raise ValueError("O áudio decodificado não está em PCM de 16 bits a 8 kHz")
+        channels = wav.getnchannels()
+        sizes = _level_sizes(math.ceil(wav.getnframes() / BIN_FRAMES))
+        temporary = f"{destination}.tmp"
+        envelope = np.lib.format.open_memmap(temporary, mode="w+", dtype=np.float16, shape=(sum(sizes), len(CHANNELS)))
+        level = np.zeros((sizes[0], len(CHANNELS)), dtype=np.float32)
+        position = 0
+        while frames := wav.readframes(CHUNK_BINS * BIN_FRAMES):
+            samples = np.frombuffer(frames, dtype="<i2").reshape(-1, channels).mean(axis=1, dtype=np.float32)
+            binned = _bin_envelope(samples)
+            level[position : position + len(binned)] = binned
+            position += len(binned)
+    offset = 0
+    for size in sizes:
+        envelope[offset : offset + size] = level[:size]
+        offset += size
+        level = _halve(level[:size])
+    envelope.flush()
+    del envelope
+    os.replace(temporary, destination)
+
+
+def decode_audio(video_path: str, wav_path: str, stop: threading.Event, create_instance: Any = vlc.Instance) -> bool:
+    """Decodifica a trilha de áudio para um WAV mono; retorna ``False`` se ``stop`` interromper a decodificação."""
+
+    output = Path(wav_path).as_posix()
+    try:
+        instance = create_instance("--no-video", "--no-sout-video", "--no-sout-spu", "--quiet")
+    except NameError as exc:  # o python-vlc sinaliza assim a falta da biblioteca libVLC
+        raise OSError(f"A libVLC não está disponível: {exc}") from exc
+    if instance is None:
+        raise OSError("A libVLC não pôde ser iniciada")
+    media = instance.media_new(video_path)
+    media.add_option(
+        f":sout=#transcode{{vcodec=none,acodec=s16l,channels=1,samplerate={SAMPLE_RATE}}}"
+        f':std{{access=file,mux=wav,dst="{output}"}}'
+    )
+    player = instance.media_player_new()
+    player.set_media(media)
+    try:
+        player.play()
+        finished = (vlc.State.Ended, vlc.State.Error, vlc.State.Stopped)
+        while (state := player.get_state()) not in finished:
+            if stop.wait(DECODE_POLL_S):
+                return False
+        if state == vlc.State.Error or not os.path.exists(wav_path):
+            raise OSError("A libVLC não conseguiu decodificar a trilha de áudio")
+        return True
+    finally:
+        player.stop()
+        player.release()
+        media.release()
+        instance.release()
+
+
+class Envelope:
+    """Envelope de todos os níveis de um arquivo ``.waveform``, lido sob demanda."""
+
+    def __init__(self, data: np.ndarray) -> None:
+        """Calcula onde começa cada nível dentro do arranjo ``(janelas, canais)``, na ordem de ``CHANNELS``."""
+
+        self.data = data
+        self.sizes = _level_sizes(_base_count(len(data)))
+        self.offsets = [sum(self.sizes[:index]) for index in range(len(self.sizes))]
+
+    @classmethod
+    def open(cls, path: str) -> Envelope:
+        """Mapeia o arquivo em memória sem lê-lo."""
+
+        return cls(np.load(path, mmap_mode="r"))
+
+    @property
+    def duration_ms(self) -> int:
+        """Duração coberta pelo primeiro nível."""
+
+        return self.sizes[0] * BIN_MS
+
+    def level(self, index: int) -> np.ndarray:
+        """Retorna a visão do nível ``index``, cujas janelas têm ``BIN_MS << index`` milissegundos."""
+
+        return self.data[self.offsets[index] : self.offsets[index] + self.sizes[index]]
+
+    def level_for(self, ms_per_pixel: float) -> int:
+        """Escolhe o nível mais grosso cujas janelas ainda não são maiores que um pixel."""
+
+        if ms_per_pixel < 2 * BIN_MS:
+            return 0
+        return min(len(self.sizes) - 1, int(math.log2(ms_per_pixel / BIN_MS)))
+
+    def columns(self, start_ms: int, end_ms: int, width: int) -> np.ndarray:
+        """Reduz o trecho a ``width`` colunas com o maior valor de cada canal, lendo apenas o nível e as janelas necessárias.
+
+        Colunas fora da duração do áudio ficam zeradas.
+        """
+
+        result = np.zeros((max(0, width), self.data.shape[1]), dtype=np.float32)
+        if width <= 0 or end_ms <= start_ms or not self.sizes[0]:
+            return result
+        ms_per_pixel = (end_ms - start_ms) / width
+        index = self.level_for(ms_per_pixel)
+        values = self.level(index)
+        bin_ms = BIN_MS << index
+        edges = np.floor((start_ms + np.arange(width + 1) * ms_per_pixel) / bin_ms).astype(np.int64)
+        first = int(np.clip(edges[0], 0, len(values)))
+        last = int(np.clip(edges[-1] + 1, 0, len(values)))
+        if first >= last:
+            return result
+        chunk = np.asarray(values[first:last], dtype=np.float32)
+        starts = edges[:-1]
+        inside = (starts >= 0) & (starts < len(values))
+        reduced = np.maximum.reduceat(chunk, np.clip(starts - first, 0, len(chunk) - 1), axis=0)
+        result[inside] = reduced[inside]
+        return result
+
+
+def load_envelope(video_path: str, stop: threading.Event, create_instance: Any = vlc.Instance) -> Envelope | None:
+    """Abre o envelope do vídeo, decodificando o áudio antes se o arquivo não existir, for mais antigo que o vídeo ou
+    tiver sido gravado com outros canais.
+
+    Retorna ``None`` se ``stop`` interromper a decodificação.
+    """
+
+    path = waveform_path(video_path)
+    try:
+        fresh = os.stat(path).st_mtime_ns >= os.stat(video_path).st_mtime_ns
+        fresh = fresh and np.load(path, mmap_mode="r").shape[1:] == (len(CHANNELS),)
+    except (FileNotFoundError, ValueError):
+        fresh = False
+    if not fresh:
+        with tempfile.TemporaryDirectory(prefix="waveform-") as directory:
+            wav_path = os.path.join(directory, "audio.wav")
+            if not decode_audio(video_path, wav_path, stop, create_instance):
+                return None
+            build_envelope(wav_path, path)
+    return Envelope.open(path)